@@ -1 +1,19 @@
-from .reports import Metar, Taf
+from .reports import (
+    Metar,
+    ReportCache,
+    Taf,
+    aparse,
+    parse_cached,
+    parse_metars,
+    parse_tafs,
+    validate_metar,
+    validate_taf,
+)
+from .reports.models.base import (
+    get_group_cache,
+    get_parser_engine,
+    get_reference_time,
+    set_group_cache,
+    set_parser_engine,
+    set_reference_time,
+)
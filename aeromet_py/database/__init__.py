@@ -1,2 +1,18 @@
+from .columns import (
+    StationColumns,
+    bearings_from,
+    distances_from,
+    get_station_columns,
+    pairwise_bearings,
+    pairwise_distances,
+    parse_coordinate,
+)
 from .countries import get_country
-from .stations import get_stations
+from .spatial import nearest_stations, stations_within
+from .stations import (
+    NULL_STATION_DATA,
+    StationData,
+    find_station,
+    get_station_data,
+    get_stations,
+)
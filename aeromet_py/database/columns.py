@@ -0,0 +1,260 @@
+import sys
+import threading
+
+from array import array
+from math import asin, atan2, cos, degrees, radians, sin, sqrt
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+from .stations import STATIONS
+
+
+# Mean radius of the Earth in kilometers
+EARTH_RADIUS_KM = 6371.0
+
+
+def parse_coordinate(code: str) -> float:
+    """Parse a coordinate of the stations database to decimal degrees.
+
+    The coordinates are stored as degrees and minutes followed by the
+    hemisphere, e.g. "51.53N" is 51° 53' north and "073.46W" is 73° 46' west.
+
+    Args:
+        code (str): the coordinate code.
+
+    Raises:
+        ValueError: if the code is not a valid coordinate.
+
+    Returns:
+        float: the coordinate in decimal degrees, negative to the south and west.
+    """
+    hemisphere = code[-1:]
+    if hemisphere not in ("N", "S", "E", "W"):
+        raise ValueError(f"invalid coordinate: {code!r}")
+
+    # Some entries carry a stray leading dot, e.g. ".88.54W"
+    _degrees, _, _minutes = code[:-1].lstrip(".").rpartition(".")
+    value = int(_degrees) + int(_minutes) / 60.0
+    if hemisphere in ("S", "W"):
+        return -value
+
+    return value
+
+
+class StationColumns(NamedTuple):
+    """The stations database as columns, in the order of the rows of `STATIONS`.
+
+    The numeric columns are arrays of doubles: the coordinates in decimal
+    degrees and the elevation in meters. The code columns are tuples of
+    interned strings.
+    """
+
+    latitude: array
+    longitude: array
+    elevation: array
+    icao: Tuple[str, ...]
+    iata: Tuple[str, ...]
+    synop: Tuple[str, ...]
+    country: Tuple[str, ...]
+
+
+class _Trigonometry(NamedTuple):
+    """Precomputed values of the coordinates used by the distance functions."""
+
+    latitude: array
+    longitude: array
+    cos_latitude: array
+    sin_latitude: array
+
+
+_columns: Optional[StationColumns] = None
+_trigonometry: Optional[_Trigonometry] = None
+_lock = threading.Lock()
+
+
+def _build_columns() -> Tuple[StationColumns, _Trigonometry]:
+    """Convert the string columns of the stations database to arrays."""
+    latitude = array("d")
+    longitude = array("d")
+    elevation = array("d")
+    codes: Tuple[list, list, list, list] = ([], [], [], [])
+
+    for stn in STATIONS:
+        latitude.append(parse_coordinate(stn[4]))
+        longitude.append(parse_coordinate(stn[5]))
+        elevation.append(float(stn[6]))
+        for column, value in zip(codes, (stn[1], stn[2], stn[3], stn[7])):
+            column.append(sys.intern(value))
+
+    columns = StationColumns(
+        latitude,
+        longitude,
+        elevation,
+        tuple(codes[0]),
+        tuple(codes[1]),
+        tuple(codes[2]),
+        tuple(codes[3]),
+    )
+    lat_radians = array("d", map(radians, latitude))
+    trigonometry = _Trigonometry(
+        lat_radians,
+        array("d", map(radians, longitude)),
+        array("d", map(cos, lat_radians)),
+        array("d", map(sin, lat_radians)),
+    )
+    return columns, trigonometry
+
+
+def _load() -> Tuple[StationColumns, _Trigonometry]:
+    global _columns, _trigonometry
+
+    if _columns is None or _trigonometry is None:
+        with _lock:
+            if _columns is None or _trigonometry is None:
+                _columns, _trigonometry = _build_columns()
+
+    return _columns, _trigonometry
+
+
+def get_station_columns() -> StationColumns:
+    """Get the stations database as columns, built on the first call."""
+    return _load()[0]
+
+
+def distances_from(latitude: float, longitude: float) -> array:
+    """Get the great-circle distances from a location to every station.
+
+    Args:
+        latitude (float): the latitude of the location in decimal degrees.
+        longitude (float): the longitude of the location in decimal degrees.
+
+    Returns:
+        array: the distances in kilometers, in the order of the rows of `STATIONS`.
+    """
+    trig = _load()[1]
+    lat = radians(latitude)
+    lon = radians(longitude)
+    cos_lat = cos(lat)
+    factor = 2.0 * EARTH_RADIUS_KM
+
+    return array(
+        "d",
+        [
+            factor
+            * asin(
+                min(
+                    1.0,
+                    sqrt(
+                        sin((lat2 - lat) / 2.0) ** 2
+                        + cos_lat * cos_lat2 * sin((lon2 - lon) / 2.0) ** 2
+                    ),
+                )
+            )
+            for lat2, lon2, cos_lat2 in zip(
+                trig.latitude, trig.longitude, trig.cos_latitude
+            )
+        ],
+    )
+
+
+def bearings_from(latitude: float, longitude: float) -> array:
+    """Get the initial bearings from a location to every station.
+
+    Args:
+        latitude (float): the latitude of the location in decimal degrees.
+        longitude (float): the longitude of the location in decimal degrees.
+
+    Returns:
+        array: the bearings in degrees clockwise from the north, in the range
+        [0, 360) and in the order of the rows of `STATIONS`.
+    """
+    trig = _load()[1]
+    lat = radians(latitude)
+    lon = radians(longitude)
+    cos_lat = cos(lat)
+    sin_lat = sin(lat)
+
+    return array(
+        "d",
+        [
+            degrees(
+                atan2(
+                    sin(lon2 - lon) * cos_lat2,
+                    cos_lat * sin_lat2 - sin_lat * cos_lat2 * cos(lon2 - lon),
+                )
+            )
+            % 360.0
+            for lon2, cos_lat2, sin_lat2 in zip(
+                trig.longitude, trig.cos_latitude, trig.sin_latitude
+            )
+        ],
+    )
+
+
+def pairwise_distances(rows_a: Sequence[int], rows_b: Sequence[int]) -> array:
+    """Get the great-circle distances between pairs of stations.
+
+    Args:
+        rows_a (Sequence[int]): the rows in `STATIONS` of the first stations.
+        rows_b (Sequence[int]): the rows in `STATIONS` of the second stations,
+            with the same length of `rows_a`.
+
+    Returns:
+        array: the distances in kilometers between `rows_a[i]` and `rows_b[i]`.
+    """
+    if len(rows_a) != len(rows_b):
+        raise ValueError("rows_a and rows_b must have the same length")
+
+    trig = _load()[1]
+    lat, lon, cos_lat = trig.latitude, trig.longitude, trig.cos_latitude
+    factor = 2.0 * EARTH_RADIUS_KM
+
+    return array(
+        "d",
+        [
+            factor
+            * asin(
+                min(
+                    1.0,
+                    sqrt(
+                        sin((lat[b] - lat[a]) / 2.0) ** 2
+                        + cos_lat[a] * cos_lat[b] * sin((lon[b] - lon[a]) / 2.0) ** 2
+                    ),
+                )
+            )
+            for a, b in zip(rows_a, rows_b)
+        ],
+    )
+
+
+def pairwise_bearings(rows_a: Sequence[int], rows_b: Sequence[int]) -> array:
+    """Get the initial bearings between pairs of stations.
+
+    Args:
+        rows_a (Sequence[int]): the rows in `STATIONS` of the origin stations.
+        rows_b (Sequence[int]): the rows in `STATIONS` of the destination
+            stations, with the same length of `rows_a`.
+
+    Returns:
+        array: the bearings in degrees from `rows_a[i]` to `rows_b[i]`, clockwise
+        from the north and in the range [0, 360).
+    """
+    if len(rows_a) != len(rows_b):
+        raise ValueError("rows_a and rows_b must have the same length")
+
+    trig = _load()[1]
+    lon, cos_lat, sin_lat = trig.longitude, trig.cos_latitude, trig.sin_latitude
+
+    return array(
+        "d",
+        [
+            degrees(
+                atan2(
+                    sin(lon[b] - lon[a]) * cos_lat[b],
+                    cos_lat[a] * sin_lat[b]
+                    - sin_lat[a] * cos_lat[b] * cos(lon[b] - lon[a]),
+                )
+            )
+            % 360.0
+            for a, b in zip(rows_a, rows_b)
+        ],
+    )
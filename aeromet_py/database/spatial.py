@@ -0,0 +1,210 @@
+import heapq
+import threading
+
+from math import asin, cos, pi, radians, sin, sqrt
+from typing import List, Optional, Tuple
+
+from .columns import EARTH_RADIUS_KM, get_station_columns
+from .stations import STATIONS
+
+
+# Maximum number of points in the leaves of the tree
+_LEAF_SIZE = 8
+
+Point = Tuple[float, float, float, int]
+
+
+def _to_cartesian(latitude: float, longitude: float) -> Tuple[float, float, float]:
+    """Convert the coordinates in degrees to a point on the unit sphere."""
+    lat = radians(latitude)
+    lon = radians(longitude)
+    return cos(lat) * cos(lon), cos(lat) * sin(lon), sin(lat)
+
+
+def _chord_to_km(chord2: float) -> float:
+    """Convert the squared chord between two points of the unit sphere to the
+    great-circle distance in kilometers."""
+    return 2.0 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(chord2) / 2.0))
+
+
+def _km_to_chord(distance: float) -> float:
+    """Convert the great-circle distance in kilometers to the squared chord
+    between two points of the unit sphere."""
+    angle = min(distance / EARTH_RADIUS_KM, pi)
+    return (2.0 * sin(angle / 2.0)) ** 2
+
+
+class StationTree:
+    """Static k-d tree over the locations of the stations.
+
+    The stations are projected onto the unit sphere, so the euclidean distance
+    between two points (the chord) grows with the great-circle distance and
+    the tree gives exact results for the nearest and within-radius queries.
+
+    The points are stored in one list arranged as an implicit tree: the node of
+    the range `[lo, hi)` is the point at `(lo + hi) // 2`, its left subtree is
+    the range to the left of it and the right subtree the range to the right.
+    """
+
+    def __init__(self, points: List[Point]) -> None:
+        self._points = points
+        self._build(0, len(points), 0)
+
+    def _build(self, lo: int, hi: int, depth: int) -> None:
+        if hi - lo <= _LEAF_SIZE:
+            return
+
+        axis = depth % 3
+        self._points[lo:hi] = sorted(self._points[lo:hi], key=lambda p: p[axis])
+        mid = (lo + hi) // 2
+        self._build(lo, mid, depth + 1)
+        self._build(mid + 1, hi, depth + 1)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def nearest(
+        self, latitude: float, longitude: float, k: int
+    ) -> List[Tuple[int, float]]:
+        """Get the `k` rows nearest to the location and their distances in km."""
+        if k <= 0:
+            return []
+
+        x, y, z = _to_cartesian(latitude, longitude)
+        points = self._points
+        # Max-heap of (-squared chord, row) with the best k candidates
+        heap: List[Tuple[float, int]] = []
+
+        def search(lo: int, hi: int, depth: int) -> None:
+            if hi - lo <= _LEAF_SIZE:
+                for px, py, pz, row in points[lo:hi]:
+                    d2 = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d2, row))
+                    elif d2 < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d2, row))
+                return
+
+            mid = (lo + hi) // 2
+            px, py, pz, row = points[mid]
+            d2 = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, row))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, row))
+
+            diff = (x, y, z)[depth % 3] - points[mid][depth % 3]
+            if diff < 0:
+                search(lo, mid, depth + 1)
+                if len(heap) < k or diff * diff < -heap[0][0]:
+                    search(mid + 1, hi, depth + 1)
+            else:
+                search(mid + 1, hi, depth + 1)
+                if len(heap) < k or diff * diff < -heap[0][0]:
+                    search(lo, mid, depth + 1)
+
+        search(0, len(points), 0)
+        found = sorted((-d2, row) for d2, row in heap)
+        return [(row, _chord_to_km(d2)) for d2, row in found]
+
+    def within(
+        self, latitude: float, longitude: float, radius: float
+    ) -> List[Tuple[int, float]]:
+        """Get the rows within `radius` km of the location and their distances
+        in km, sorted from the nearest to the farthest."""
+        if radius < 0:
+            return []
+
+        x, y, z = _to_cartesian(latitude, longitude)
+        limit = _km_to_chord(radius)
+        points = self._points
+        found: List[Tuple[float, int]] = []
+
+        def search(lo: int, hi: int, depth: int) -> None:
+            if hi - lo <= _LEAF_SIZE:
+                for px, py, pz, row in points[lo:hi]:
+                    d2 = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+                    if d2 <= limit:
+                        found.append((d2, row))
+                return
+
+            mid = (lo + hi) // 2
+            px, py, pz, row = points[mid]
+            d2 = (px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2
+            if d2 <= limit:
+                found.append((d2, row))
+
+            diff = (x, y, z)[depth % 3] - points[mid][depth % 3]
+            if diff < 0 or diff * diff <= limit:
+                search(lo, mid, depth + 1)
+            if diff >= 0 or diff * diff <= limit:
+                search(mid + 1, hi, depth + 1)
+
+        search(0, len(points), 0)
+        found.sort()
+        return [(row, _chord_to_km(d2)) for d2, row in found]
+
+
+def _build_tree() -> StationTree:
+    """Build the k-d tree of all the stations in the database."""
+    columns = get_station_columns()
+    points: List[Point] = []
+    for row, (lat, lon) in enumerate(zip(columns.latitude, columns.longitude)):
+        x, y, z = _to_cartesian(lat, lon)
+        points.append((x, y, z, row))
+
+    return StationTree(points)
+
+
+_tree: Optional[StationTree] = None
+_tree_lock = threading.Lock()
+
+
+def get_station_tree() -> StationTree:
+    """Get the k-d tree of the stations database, built on the first call."""
+    global _tree
+
+    if _tree is None:
+        with _tree_lock:
+            if _tree is None:
+                _tree = _build_tree()
+
+    return _tree
+
+
+def nearest_stations(
+    latitude: float, longitude: float, k: int = 1
+) -> List[Tuple[List[str], float]]:
+    """Get the `k` stations nearest to a location.
+
+    Args:
+        latitude (float): the latitude of the location in decimal degrees.
+        longitude (float): the longitude of the location in decimal degrees.
+        k (int, optional): the number of stations to get. Defaults to 1.
+
+    Returns:
+        List[Tuple[List[str], float]]: the data of the stations and their
+        great-circle distances in kilometers, from the nearest to the farthest.
+    """
+    tree = get_station_tree()
+    return [(STATIONS[row], d) for row, d in tree.nearest(latitude, longitude, k)]
+
+
+def stations_within(
+    latitude: float, longitude: float, radius_km: float
+) -> List[Tuple[List[str], float]]:
+    """Get the stations within a radius of a location.
+
+    Args:
+        latitude (float): the latitude of the location in decimal degrees.
+        longitude (float): the longitude of the location in decimal degrees.
+        radius_km (float): the radius in kilometers.
+
+    Returns:
+        List[Tuple[List[str], float]]: the data of the stations and their
+        great-circle distances in kilometers, from the nearest to the farthest.
+    """
+    tree = get_station_tree()
+    return [
+        (STATIONS[row], d) for row, d in tree.within(latitude, longitude, radius_km)
+    ]
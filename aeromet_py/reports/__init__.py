@@ -1,2 +1,5 @@
-from .metar import Metar
-from .taf import Taf
+from .batch import ParseResult, parse_metars, parse_reports, parse_tafs
+from .cache import ReportCache, ReportCacheInfo, get_report_cache, parse_cached
+from .metar import Metar, validate_metar
+from .stream import aparse
+from .taf import Taf, validate_taf
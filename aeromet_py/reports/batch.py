@@ -0,0 +1,197 @@
+import os
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import datetime
+from itertools import islice
+from typing import (
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .metar import Metar
+from .models import get_reference_time, set_reference_time
+from .taf import Taf
+
+
+ReportClass = Union[Type[Metar], Type[Taf]]
+
+
+class ParseResult(NamedTuple):
+    """Result of parsing one report of a batch.
+
+    `report` is None and `error` is the exception raised if the report
+    couldn't be parsed.
+    """
+
+    position: int
+    code: str
+    report: Union[Metar, Taf, None]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        """Get if the report was parsed."""
+        return self.error is None
+
+
+Chunk = List[Tuple[int, str]]
+
+
+def _parse_chunk(
+    report_class: ReportClass,
+    chunk: Chunk,
+    year: Optional[int],
+    month: Optional[int],
+    truncate: bool,
+    reference: Optional[datetime],
+) -> List[ParseResult]:
+    """Parse the reports of a chunk, in a worker process or in the caller."""
+    if reference is not None:
+        set_reference_time(reference)
+
+    results: List[ParseResult] = []
+    for index, code in chunk:
+        try:
+            report = report_class(code, year, month, truncate)
+        except Exception as error:
+            results.append(ParseResult(index, code, None, error))
+        else:
+            results.append(ParseResult(index, code, report, None))
+
+    return results
+
+
+def _chunks(codes: Iterable[str], chunksize: int) -> Iterator[Chunk]:
+    numbered = enumerate(codes)
+    while True:
+        chunk = list(islice(numbered, chunksize))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def parse_reports(
+    report_class: ReportClass,
+    codes: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    ordered: bool = True,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    truncate: bool = False,
+) -> Iterator[ParseResult]:
+    """Parse many reports in a pool of processes.
+
+    The codes are read lazily and sent to the workers in chunks, with a few
+    chunks in flight per worker, so any number of reports can be parsed
+    with bounded memory. The errors raised while parsing a report are
+    returned in its result instead of being raised. The reports parsed in
+    the workers are sent back as their decoded groups, so they aren't parsed
+    again in the calling process.
+
+    The reports without year and month take them from the reference time of
+    the caller, see `set_reference_time`, also in the workers.
+
+    Args:
+        report_class (Type[Metar] | Type[Taf]): the class of the reports.
+        codes (Iterable[str]): the codes of the reports.
+        workers (int | None, optional): the number of worker processes, 1 to
+            parse in the calling process. Defaults to None, the number of
+            CPUs.
+        chunksize (int, optional): the reports sent to a worker at a time.
+            Defaults to 256.
+        ordered (bool, optional): if True the results are yielded in the
+            order of the codes, as they are parsed otherwise. Defaults to True.
+        year (int | None, optional): the year of the reports. Defaults to None.
+        month (int | None, optional): the month of the reports. Defaults to None.
+        truncate (bool, optional): the `truncate` option of the reports.
+            Defaults to False.
+
+    Yields:
+        ParseResult: the result of every report, with the position of its code.
+
+    Raises:
+        ValueError: if `workers` or `chunksize` aren't positive numbers.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 0:
+        raise ValueError(f"workers must be a positive number, got {workers}")
+
+    if chunksize <= 0:
+        raise ValueError(f"chunksize must be a positive number, got {chunksize}")
+
+    chunks = _chunks(codes, chunksize)
+    if workers == 1:
+        for chunk in chunks:
+            yield from _parse_chunk(report_class, chunk, year, month, truncate, None)
+        return
+
+    # Pin the reference time of the caller, the workers may not share it
+    args = (year, month, truncate, get_reference_time())
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit(chunk: Chunk) -> "Future[List[ParseResult]]":
+            return executor.submit(_parse_chunk, report_class, chunk, *args)
+
+        # Keep two chunks in flight per worker
+        pending: Deque["Future[List[ParseResult]]"] = deque(
+            submit(chunk) for chunk in islice(chunks, workers * 2)
+        )
+        try:
+            if ordered:
+                while pending:
+                    results = pending.popleft().result()
+                    pending.extend(submit(chunk) for chunk in islice(chunks, 1))
+
+                    yield from results
+            else:
+                while pending:
+                    done, running = wait(pending, return_when=FIRST_COMPLETED)
+                    pending = deque(running)
+                    for future in done:
+                        pending.extend(submit(chunk) for chunk in islice(chunks, 1))
+
+                        yield from future.result()
+        finally:
+            # The results aren't wanted anymore if the caller stops early
+            for future in pending:
+                future.cancel()
+
+
+def parse_metars(
+    codes: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    ordered: bool = True,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    truncate: bool = False,
+) -> Iterator[ParseResult]:
+    """Parse many METARs in a pool of processes, see `parse_reports`."""
+    return parse_reports(
+        Metar, codes, workers, chunksize, ordered, year, month, truncate
+    )
+
+
+def parse_tafs(
+    codes: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = 256,
+    ordered: bool = True,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    truncate: bool = False,
+) -> Iterator[ParseResult]:
+    """Parse many TAFs in a pool of processes, see `parse_reports`."""
+    return parse_reports(Taf, codes, workers, chunksize, ordered, year, month, truncate)
@@ -0,0 +1,173 @@
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, Type, Union
+
+from .metar import Metar
+from .models import normalize_code
+from .taf import Taf
+
+
+AnyReport = Union[Metar, Taf]
+
+ReportClass = Union[Type[Metar], Type[Taf]]
+
+Key = Tuple[str, Optional[int], Optional[int]]
+
+
+class ReportCacheInfo(NamedTuple):
+    """Statistics of a report cache."""
+
+    hits: int
+    misses: int
+    expired: int
+    maxsize: int
+    currsize: int
+
+
+class ReportCache:
+    """Bounded LRU cache of parsed reports with an optional time to live.
+
+    The reports are kept by their raw code, the code normalized as the
+    reports do, and the year and month given to parse them, so the repeated
+    parses of the same report return the same object. The cached reports are
+    shared and must not be modified. The reports parsed without year and month
+    take them from the date when they were parsed, use `ttl` to parse them
+    again after some time.
+
+    Args:
+        report_class (Type[Metar] | Type[Taf], optional): the class of the
+            reports. Defaults to `Metar`.
+        maxsize (int, optional): the maximum number of reports kept, the least
+            recently used report is dropped when it's exceeded. Defaults to 1024.
+        ttl (float | None, optional): the seconds a report is kept since it was
+            parsed, None to keep it until it's dropped. Defaults to None.
+        timer (Callable[[], float], optional): the clock of the time to live,
+            in seconds. Defaults to `time.monotonic`.
+
+    Raises:
+        ValueError: if `maxsize` or `ttl` aren't positive numbers.
+    """
+
+    def __init__(
+        self,
+        report_class: ReportClass = Metar,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be a positive number, got {maxsize}")
+
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be a positive number, got {ttl}")
+
+        self._report_class = report_class
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._timer = timer
+        # The reports and the time when they expire by key
+        self._reports: "OrderedDict[Key, Tuple[AnyReport, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+
+    def __len__(self) -> int:
+        return len(self._reports)
+
+    @property
+    def report_class(self) -> ReportClass:
+        """Get the class of the reports of the cache."""
+        return self._report_class
+
+    def parse(
+        self, code: str, year: Optional[int] = None, month: Optional[int] = None
+    ) -> AnyReport:
+        """Get the report of the code, parsed with `year` and `month`, from
+        the cache if it was parsed before and hasn't expired."""
+        key = (normalize_code(code), year, month)
+        with self._lock:
+            entry = self._reports.get(key)
+            if entry is not None:
+                report, expires = entry
+                if self._ttl is None or self._timer() < expires:
+                    self._reports.move_to_end(key)
+                    self._hits += 1
+                    return report
+
+                del self._reports[key]
+                self._expired += 1
+
+        # Parse outside of the lock, two threads may parse the same report
+        # but the first one kept is the one shared
+        parsed: AnyReport = self._report_class(code, year, month)
+        expires = self._timer() + self._ttl if self._ttl is not None else 0.0
+        with self._lock:
+            self._misses += 1
+            entry = self._reports.get(key)
+            if entry is not None:
+                return entry[0]
+
+            self._reports[key] = (parsed, expires)
+            if len(self._reports) > self._maxsize:
+                self._reports.popitem(last=False)
+
+        return parsed
+
+    def clear(self) -> None:
+        """Remove all the reports and reset the statistics."""
+        with self._lock:
+            self._reports.clear()
+            self._hits = 0
+            self._misses = 0
+            self._expired = 0
+
+    def info(self) -> ReportCacheInfo:
+        """Get the hits, misses, expired reports, maximum size and current
+        size of the cache."""
+        with self._lock:
+            return ReportCacheInfo(
+                self._hits,
+                self._misses,
+                self._expired,
+                self._maxsize,
+                len(self._reports),
+            )
+
+
+_caches: Dict[type, ReportCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_report_cache(report_class: ReportClass = Metar) -> ReportCache:
+    """Get the default cache of the reports of a class used by `parse_cached`,
+    with room for 1024 reports and without time to live."""
+    try:
+        return _caches[report_class]
+    except KeyError:
+        with _caches_lock:
+            return _caches.setdefault(report_class, ReportCache(report_class))
+
+
+def parse_cached(
+    code: str,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    report_class: ReportClass = Metar,
+) -> AnyReport:
+    """Parse the report with the default cache of its class, see `ReportCache`.
+
+    Args:
+        code (str): the code of the report.
+        year (int | None, optional): the year of the report. Defaults to None.
+        month (int | None, optional): the month of the report. Defaults to None.
+        report_class (Type[Metar] | Type[Taf], optional): the class of the
+            report. Defaults to `Metar`.
+
+    Returns:
+        Metar | Taf: the parsed report, shared with the previous parses of
+        the same report.
+    """
+    return get_report_cache(report_class).parse(code, year, month)
@@ -1,17 +1,29 @@
 import re
 
-from typing import Any, Dict, List, Optional
-
-from ..utils import MetarRegExp, sanitize_visibility, sanitize_windshear, split_sentence
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils import (
+    MetarRegExp,
+    Span,
+    relocate,
+    sanitize_visibility,
+    sanitize_windshear,
+    split_sections,
+)
 from .models import (
     FlightRulesMixin,
-    GroupHandler,
     GroupList,
+    HandlerTable,
     ModifierMixin,
-    ParserError,
+    PendingGroups,
     Report,
     Time,
-    parse_section,
+    ValidationResult,
+    decode_group,
+    key_codes,
+    normalize_code,
+    null_group,
+    parse_groups,
 )
 from .models.metar import *
 
@@ -34,8 +46,10 @@ class Metar(
         year: Optional[int] = None,
         month: Optional[int] = None,
         truncate: bool = False,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
     ) -> None:
-        super().__init__(code, truncate)
+        super().__init__(code, truncate, lazy=lazy, fields=fields)
         self._year = year
         self._month = month
 
@@ -52,22 +66,22 @@ class Metar(
 
         # Body groups
         self._time = Time.from_metar(year=year, month=month)
-        self._wind_variation = MetarWindVariation(None)
-        self._minimum_visibility = MetarMinimumVisibility(None)
+        self._wind_variation = null_group(MetarWindVariation)
+        self._minimum_visibility = null_group(MetarMinimumVisibility)
         self._runway_ranges = GroupList[MetarRunwayRange](3)
-        self._temperatures = MetarTemperatures(None)
-        self._pressure = MetarPressure(None)
-        self._recent_weather = MetarRecentWeather(None)
+        self._temperatures = null_group(MetarTemperatures)
+        self._pressure = null_group(MetarPressure)
+        self._recent_weather = null_group(MetarRecentWeather)
         self._windshears = MetarWindshearList()
-        self._sea_state = MetarSeaState(None)
-        self._runway_state = MetarRunwayState(None)
+        self._sea_state = null_group(MetarSeaState)
+        self._runway_state = null_group(MetarRunwayState)
 
         # Trend groups
         self._weather_trends = MetarWeatherTrends()
 
         # Parse groups
         self._parse_body()
-        self._parse_weather_trend()
+        self._parse_changes()
 
     @property
     def body(self) -> str:
@@ -121,7 +135,7 @@ class Metar(
         return self._runway_ranges
 
     def _handle_temperatures(self, match: re.Match) -> None:
-        self._temperatures = MetarTemperatures(match)
+        self._temperatures = decode_group(MetarTemperatures, match)
 
         self._concatenate_string(self._temperatures)
 
@@ -131,7 +145,7 @@ class Metar(
         return self._temperatures
 
     def _handle_pressure(self, match: re.Match) -> None:
-        self._pressure = MetarPressure(match)
+        self._pressure = decode_group(MetarPressure, match)
 
         self._concatenate_string(self._pressure)
 
@@ -181,8 +195,8 @@ class Metar(
         """Get the runway state data of the METAR."""
         return self._runway_state
 
-    def _handle_weather_trend(self, code: str) -> None:
-        wt: ChangePeriod = ChangePeriod(code, self._time.time)
+    def _handle_weather_trend(self, code: str, offset: int = 0) -> None:
+        wt: ChangePeriod = ChangePeriod(code, self._time.time, offset)
         self._weather_trends.add(wt)
 
         self._concatenate_string(wt)
@@ -192,46 +206,72 @@ class Metar(
         """Get the weather trends of the METAR if provided."""
         return self._weather_trends
 
+    _handler_fields = dict(
+        Report._handler_fields,
+        _handle_modifier=("_modifier",),
+        _handle_wind=("_wind",),
+        _handle_wind_variation=("_wind_variation",),
+        _handle_prevailing=("_prevailing",),
+        _handle_minimum_visibility=("_minimum_visibility",),
+        _handle_runway_range=("_runway_ranges",),
+        _handle_weather=("_weathers",),
+        _handle_cloud=("_clouds",),
+        _handle_temperatures=("_temperatures",),
+        _handle_pressure=("_pressure",),
+        _handle_recent_weather=("_recent_weather",),
+        _handle_windshear=("_windshears",),
+        _handle_sea_state=("_sea_state",),
+        _handle_runway_state=("_runway_state",),
+        _parse_weather_trend=("_weather_trends",),
+    )
+
+    _field_attributes = dict(
+        Report._field_attributes,
+        prevailing_visibility=("_prevailing",),
+        flight_rules=("_prevailing", "_clouds"),
+        should_be_cavok=("_prevailing", "_weathers", "_clouds"),
+        weather_trends=("_weather_trends", "_time"),
+    )
+
+    _changes_parser = "_parse_weather_trend"
+
+    _body_handlers = HandlerTable(
+        (MetarRegExp.TYPE, "_handle_type"),
+        (MetarRegExp.STATION, "_handle_station"),
+        (MetarRegExp.TIME, "_handle_time"),
+        (MetarRegExp.MODIFIER, "_handle_modifier"),
+        (MetarRegExp.WIND, "_handle_wind"),
+        (MetarRegExp.WIND_VARIATION, "_handle_wind_variation"),
+        (MetarRegExp.VISIBILITY, "_handle_prevailing"),
+        (MetarRegExp.MINIMUM_VISIBILITY, "_handle_minimum_visibility"),
+        (MetarRegExp.RUNWAY_RANGE, "_handle_runway_range"),
+        (MetarRegExp.RUNWAY_RANGE, "_handle_runway_range"),
+        (MetarRegExp.RUNWAY_RANGE, "_handle_runway_range"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.TEMPERATURES, "_handle_temperatures"),
+        (MetarRegExp.PRESSURE, "_handle_pressure"),
+        (MetarRegExp.PRESSURE, "_handle_pressure"),
+        (MetarRegExp.RECENT_WEATHER, "_handle_recent_weather"),
+        (MetarRegExp.WINDSHEAR, "_handle_windshear"),
+        (MetarRegExp.WINDSHEAR, "_handle_windshear"),
+        (MetarRegExp.WINDSHEAR, "_handle_windshear"),
+        (MetarRegExp.SEA_STATE, "_handle_sea_state"),
+        (MetarRegExp.RUNWAY_STATE, "_handle_runway_state"),
+    )
+
     def _parse_body(self) -> None:
         """Parse the body section."""
 
-        handlers: List[GroupHandler] = [
-            GroupHandler(MetarRegExp.TYPE, self._handle_type),
-            GroupHandler(MetarRegExp.STATION, self._handle_station),
-            GroupHandler(MetarRegExp.TIME, self._handle_time),
-            GroupHandler(MetarRegExp.MODIFIER, self._handle_modifier),
-            GroupHandler(MetarRegExp.WIND, self._handle_wind),
-            GroupHandler(MetarRegExp.WIND_VARIATION, self._handle_wind_variation),
-            GroupHandler(MetarRegExp.VISIBILITY, self._handle_prevailing),
-            GroupHandler(
-                MetarRegExp.MINIMUM_VISIBILITY, self._handle_minimum_visibility
-            ),
-            GroupHandler(MetarRegExp.RUNWAY_RANGE, self._handle_runway_range),
-            GroupHandler(MetarRegExp.RUNWAY_RANGE, self._handle_runway_range),
-            GroupHandler(MetarRegExp.RUNWAY_RANGE, self._handle_runway_range),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.TEMPERATURES, self._handle_temperatures),
-            GroupHandler(MetarRegExp.PRESSURE, self._handle_pressure),
-            GroupHandler(MetarRegExp.PRESSURE, self._handle_pressure),
-            GroupHandler(MetarRegExp.RECENT_WEATHER, self._handle_recent_weather),
-            GroupHandler(MetarRegExp.WINDSHEAR, self._handle_windshear),
-            GroupHandler(MetarRegExp.WINDSHEAR, self._handle_windshear),
-            GroupHandler(MetarRegExp.WINDSHEAR, self._handle_windshear),
-            GroupHandler(MetarRegExp.SEA_STATE, self._handle_sea_state),
-            GroupHandler(MetarRegExp.RUNWAY_STATE, self._handle_runway_state),
-        ]
-
         sanitized_body: str = sanitize_visibility(self.body)
         sanitized_body = sanitize_windshear(sanitized_body)
 
-        unparsed: List[str] = parse_section(handlers, sanitized_body)
-        self._unparsed_groups += unparsed
+        self._parse_groups(self._body_handlers, sanitized_body, self._body_offset)
 
     def _parse_weather_trend(self) -> None:
         """Parse the weather trend section.
@@ -240,49 +280,25 @@ class Metar(
             ParserError: if self.unparser_groups has items and self._truncate is True,
             raises the error.
         """
-        _trends: List[str] = split_sentence(
-            self.trend,
-            ["TEMPO", "BECMG"],
-            space="both",
-            count=1,
-        )
-
-        for trend in _trends:
-            if trend != "":
-                self._handle_weather_trend(trend)
+        for trend in _split_trend(self.trend):
+            if trend.text != "":
+                self._handle_weather_trend(trend.text, trend.start)
 
         for wt in self._weather_trends:
-            self._unparsed_groups += wt.unparsed_groups
-
-        if self.unparsed_groups and self._truncate:
-            raise ParserError(
-                "failed while processing {} from: {}".format(
-                    ", ".join(self.unparsed_groups),
-                    self.raw_code,
-                )
-            )
+            # The trend is made of the trend sections joined by spaces
+            self._unparsed_spans += relocate(wt.unparsed_spans, self._trend_spans)
+
+        self._raise_unparsed()
+
+    def _unparsed_changes(self) -> List[Span]:
+        return _match_trend(self._trend_spans)
 
     def _handle_sections(self) -> None:
-        sections: List[str] = split_sentence(
-            self._raw_code, ["NOSIG", "TEMPO", "BECMG", "RMK"], space="left"
-        )
+        body, self._trend_spans, remark = _split_metar(self._raw_code)
+        self._body_offset: int = body.start
 
-        trend: str = ""
-        remark: str = ""
-        body: str = ""
-        for section in sections:
-            if (
-                section.startswith("TEMPO")
-                or section.startswith("BECMG")
-                or section.startswith("NOSIG")
-            ):
-                trend += section + " "
-            elif section.startswith("RMK"):
-                remark = section
-            else:
-                body = section
-
-        self._sections = [body, trend.strip(), remark]
+        trend = " ".join(section.text for section in self._trend_spans)
+        self._sections = [body.text, trend, remark]
 
     def as_dict(self) -> Dict[str, Any]:
         d = super().as_dict()
@@ -308,3 +324,74 @@ class Metar(
             }
         )
         return d
+
+
+def _split_metar(raw_code: str) -> Tuple[Span, List[Span], str]:
+    """Split the METAR in its body, the sections of the trend and the remark."""
+    sections: List[Span] = split_sections(
+        raw_code, ["NOSIG", "TEMPO", "BECMG", "RMK"], space="left"
+    )
+
+    body = Span("", 0, 0)
+    trend: List[Span] = []
+    remark: str = ""
+    for section in sections:
+        if section.text.startswith(("TEMPO", "BECMG", "NOSIG")):
+            trend.append(section)
+        elif section.text.startswith("RMK"):
+            remark = section.text
+        else:
+            body = section
+
+    return body, trend, remark
+
+
+def _split_trend(trend: str) -> List[Span]:
+    """Split the trend of the METAR in its change periods."""
+    return split_sections(trend, ["TEMPO", "BECMG"], space="both", count=1)
+
+
+def _match_trend(trend_spans: List[Span]) -> List[Span]:
+    """Get the unparsed groups of the weather trends without decoding them."""
+    unparsed: List[Span] = []
+    trend = " ".join(section.text for section in trend_spans)
+    for change in _split_trend(trend) if trend else []:
+        if change.text != "":
+            spans = parse_groups(
+                ChangePeriod._handlers,
+                sanitize_visibility(change.text),
+                change.start,
+                pending=[],
+            )
+            unparsed += relocate(spans, trend_spans)
+
+    return unparsed
+
+
+def validate_metar(code: str) -> ValidationResult:
+    """Find the unparsed groups of a METAR without decoding its groups.
+
+    The report is splitted and its groups matched the same way `Metar`
+    does, but no handler is called, so it's a lot faster when only the
+    unparsed groups and the key of the report are needed.
+
+    Args:
+        code (str): the METAR code.
+
+    Returns:
+        ValidationResult: the raw code, the station and time codes and the
+        unparsed groups of the report.
+    """
+    raw_code = normalize_code(code)
+    body, trend_spans, _ = _split_metar(raw_code)
+
+    sanitized_body = sanitize_windshear(sanitize_visibility(body.text))
+    pending: PendingGroups = []
+    unparsed = parse_groups(
+        Metar._body_handlers, sanitized_body, body.start, pending=pending
+    )
+
+    unparsed += _match_trend(trend_spans)
+
+    station, time = key_codes(pending)
+    return ValidationResult(raw_code, station, time, unparsed)
@@ -17,6 +17,8 @@ CHANGE_TRANSLATIONS: Dict[str, str] = {
 class ChangeIndicator(Group):
     """Basic structure for trend codes in the report."""
 
+    __slots__ = ("_code", "_translation")
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
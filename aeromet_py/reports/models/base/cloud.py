@@ -73,6 +73,8 @@ class Cloud(Group):
         * height
     """
 
+    __slots__ = ("_code", "_cover", "_oktas", "_type", "_height")
+
     def __init__(self, data: Dict[str, str]) -> None:
         super().__init__(data.get("code"))
 
@@ -192,6 +194,8 @@ class Cloud(Group):
 
 
 class CloudList(GroupList[Cloud]):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(4)
 
@@ -7,6 +7,8 @@ from .numeric import Numeric
 class Distance(Numeric):
     """Basic structure for distance attributes."""
 
+    __slots__ = ()
+
     def __init__(self, code: Optional[str]) -> None:
         if code is None:
             code = "////"
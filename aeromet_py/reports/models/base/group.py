@@ -2,7 +2,18 @@ import json
 
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from .errors import RangeError
 
@@ -10,13 +21,101 @@ from .errors import RangeError
 GroupHandler = namedtuple("GroupHandler", "regexp handler")
 
 
+# The classes of the groups and values by the name used to pickle them
+_MODEL_CLASSES: Dict[str, type] = {}
+_MODEL_NAMES: Dict[type, str] = {}
+_MODEL_SLOTS: Dict[type, Tuple[str, ...]] = {}
+_MODEL_GETTERS: Dict[type, Callable[[Any], Tuple[Any, ...]]] = {}
+
+
+def register_model(cls: type) -> None:
+    """Register a class of groups or values of the reports, so its objects
+    are pickled as the name of the class and their attributes, see
+    `reduce_model`."""
+    name = cls.__qualname__
+    if _MODEL_CLASSES.setdefault(name, cls) is not cls:
+        name = f"{cls.__module__}.{name}"
+        _MODEL_CLASSES[name] = cls
+
+    slots: List[str] = []
+    for klass in reversed(cls.__mro__):
+        names = klass.__dict__.get("__slots__", ())
+        for slot in (names,) if isinstance(names, str) else names:
+            if slot not in slots and slot not in ("__dict__", "__weakref__"):
+                slots.append(slot)
+
+    _MODEL_NAMES[cls] = name
+    _MODEL_SLOTS[cls] = tuple(slots)
+    _MODEL_GETTERS[cls] = _slots_getter(slots)
+
+
+def _slots_getter(slots: List[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Get a function that reads the slots of an object as a tuple, in C
+    with `attrgetter` but for the classes of one slot or none."""
+    if len(slots) > 1:
+        return attrgetter(*slots)
+
+    if slots:
+        get = attrgetter(slots[0])
+        return lambda obj: (get(obj),)
+
+    return lambda obj: ()
+
+
+def reduce_model(obj: Any) -> Tuple[Any, ...]:
+    """Reduce a group or value of a report to pickle it as the name of its
+    class and its decoded attributes, without the paths of the classes, and
+    load it without decoding the group again. The shared instances of the
+    absent groups are loaded as the shared instances."""
+    cls = type(obj)
+    name = _MODEL_NAMES[cls]
+    args = _NULL_ARGS.get(id(obj))
+    if args is not None and _NULL_GROUPS.get((cls, args)) is obj:
+        return (_load_null, (name, args))
+
+    state = _MODEL_GETTERS[cls](obj)
+    attributes = getattr(obj, "__dict__", None)
+    if attributes:
+        state += (attributes,)
+
+    return (_load_model, (name, state))
+
+
+def _load_model(name: str, state: Tuple[Any, ...]) -> Any:
+    cls = _MODEL_CLASSES[name]
+    obj: Any = object.__new__(cls)
+    slots = _MODEL_SLOTS[cls]
+    for slot, value in zip(slots, state):
+        setattr(obj, slot, value)
+
+    if len(state) > len(slots):
+        obj.__dict__.update(state[-1])
+
+    return obj
+
+
+def _load_null(name: str, args: Tuple[Any, ...]) -> Any:
+    return null_group(_MODEL_CLASSES[name], *args)
+
+
 class Group(metaclass=ABCMeta):
     """Basic structure of a group in a aeronautical report from land stations."""
 
+    # The concrete groups declare the `_code` slot, so a group can also derive
+    # from a class with slots of its own, like `Numeric` or `Wind`
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore
+        register_model(cls)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return reduce_model(self)
+
     def __init__(self, code: Optional[str]) -> None:
         if code is not None:
             code = code.replace("_", " ")
-        self._code = code
+        self._code = code  # type: ignore
 
     def __str__(self) -> str:
         if self._code is not None:
@@ -47,30 +146,37 @@ class Group(metaclass=ABCMeta):
 
 G = TypeVar("G", bound=Group)
 
+# The items of the group lists without groups
+_EMPTY: Tuple[()] = ()
+
 
 class GroupList(Generic[G]):
     """Basic structure of a groups list from groups found in a aeronautical
-    report from land stations."""
+    report from land stations.
+
+    Every iteration gets its own iterator, so the list can be iterated from
+    nested loops and many threads at the same time. The lists without groups
+    share an empty tuple until the first group is added.
+    """
+
+    __slots__ = ("_max_items", "_list")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        register_model(cls)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return reduce_model(self)
 
     def __init__(self, max_items: int) -> None:
-        self._n = 0
         self._max_items = max_items
-        self._list: List[G] = []
+        self._list: List[G] = _EMPTY  # type: ignore
 
     def __str__(self) -> str:
         return " | ".join(str(group) for group in self._list)
 
-    def __iter__(self) -> "GroupList[G]":
-        return self
-
-    def __next__(self) -> G:
-        if self._n >= len(self._list):
-            self._n = 0
-            raise StopIteration
-
-        index = self._n
-        self._n += 1
-        return self._list[index]
+    def __iter__(self) -> Iterator[G]:
+        return iter(self._list)
 
     def __getitem__(self, index: int) -> G:
         if index >= self._max_items:
@@ -89,7 +195,10 @@ class GroupList(Generic[G]):
                 f"can't set more than {self._max_items} groups in {self.__class__}"
             )
 
-        self._list.append(group)
+        if not self._list:
+            self._list = [group]
+        else:
+            self._list.append(group)
 
     @property
     def codes(self) -> List[str]:
@@ -99,6 +208,9 @@ class GroupList(Generic[G]):
     @property
     def items(self) -> List[G]:
         """Returns the groups found in report as a List[G]."""
+        if not self._list:
+            return []
+
         return self._list
 
     def as_dict(self) -> Dict[str, Any]:
@@ -124,3 +236,30 @@ class GroupList(Generic[G]):
     def to_json(self) -> str:
         """Returns the items data as a string in JSON format."""
         return json.dumps(self.as_dict())
+
+
+register_model(GroupList)
+
+T = TypeVar("T")
+
+# The shared instances of the absent groups and values by class and arguments
+_NULL_GROUPS: Dict[Tuple[Callable[..., Any], Tuple[Any, ...]], Any] = {}
+
+# The arguments of the shared instances by their ids, to pickle them
+_NULL_ARGS: Dict[int, Tuple[Any, ...]] = {}
+
+
+def null_group(cls: Callable[..., T], *args: Any) -> T:
+    """Get the shared instance of `cls(None, *args)`, the group or value of
+    the class when it isn't found in the report.
+
+    The instance is built the first time it's requested and shared by every
+    report after that, so it must not be modified.
+    """
+    key = (cls, args)
+    try:
+        return _NULL_GROUPS[key]  # type: ignore
+    except KeyError:
+        group = _NULL_GROUPS.setdefault(key, cls(None, *args))
+        _NULL_ARGS.setdefault(id(group), args)
+        return group  # type: ignore
@@ -0,0 +1,122 @@
+import re
+import threading
+
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional, Tuple, TypeVar
+
+from .group import Group
+
+
+G = TypeVar("G", bound=Group)
+
+GroupFactory = Callable[[re.Match], G]
+
+
+class GroupCacheInfo(NamedTuple):
+    """Statistics of a group cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class GroupCache:
+    """Bounded LRU cache of decoded groups.
+
+    The groups are kept by the factory that decodes them, the group type, and
+    the code of the group, so every report with the same group gets the same
+    object. The decoded groups are shared and must not be modified.
+
+    Args:
+        maxsize (int, optional): the maximum number of groups kept, the least
+            recently used group is dropped when it's exceeded. Defaults to 1024.
+
+    Raises:
+        ValueError: if `maxsize` isn't a positive number.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be a positive number, got {maxsize}")
+
+        self._maxsize = maxsize
+        self._groups: "OrderedDict[Tuple[Any, str], Group]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def decode(self, factory: GroupFactory[G], match: re.Match) -> G:
+        """Get the group of the match decoded by `factory`, from the cache if
+        the same group was decoded before."""
+        key = (factory, match.string)
+        with self._lock:
+            group = self._groups.get(key)
+            if group is not None:
+                self._groups.move_to_end(key)
+                self._hits += 1
+                return group  # type: ignore
+
+        # Decode outside of the lock, two threads may decode the same group
+        # but the first one kept is the one shared
+        decoded = factory(match)
+        with self._lock:
+            self._misses += 1
+            group = self._groups.setdefault(key, decoded)
+            if len(self._groups) > self._maxsize:
+                self._groups.popitem(last=False)
+
+        return group  # type: ignore
+
+    def clear(self) -> None:
+        """Remove all the groups and reset the statistics."""
+        with self._lock:
+            self._groups.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> GroupCacheInfo:
+        """Get the hits, misses, maximum size and current size of the cache."""
+        with self._lock:
+            return GroupCacheInfo(
+                self._hits, self._misses, self._maxsize, len(self._groups)
+            )
+
+
+_cache: Optional[GroupCache] = None
+
+
+def set_group_cache(maxsize: Optional[int] = 1024) -> None:
+    """Enable the memoization of the decoded groups with a new cache of
+    `maxsize` groups, or disable it if `maxsize` is None.
+
+    The memoization is disabled by default. When enabled, the reports share
+    the objects of their recurring groups (wind, visibility, weather, clouds,
+    temperatures and pressure), so those groups must not be modified.
+
+    Args:
+        maxsize (int | None, optional): the maximum number of groups kept.
+            Defaults to 1024.
+    """
+    global _cache
+
+    _cache = None if maxsize is None else GroupCache(maxsize)
+
+
+def get_group_cache() -> Optional[GroupCache]:
+    """Get the cache of the decoded groups, None if the memoization is
+    disabled."""
+    return _cache
+
+
+def decode_group(factory: GroupFactory[G], match: re.Match) -> G:
+    """Decode the group of the match with `factory`, through the group cache
+    if the memoization is enabled."""
+    cache = _cache
+    if cache is None:
+        return factory(match)
+
+    return cache.decode(factory, match)
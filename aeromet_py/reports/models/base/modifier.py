@@ -2,7 +2,7 @@ import re
 
 from typing import Dict, Optional
 
-from .group import Group
+from .group import Group, null_group
 from .string_attribute import HasConcatenateStringProntocol
 
 
@@ -20,6 +20,8 @@ MODIFIERS: Dict[str, str] = {
 class Modifier(Group):
     """Basic structure for modifier groups in reports from land stations."""
 
+    __slots__ = ("_code", "_description")
+
     def __init__(self, code: Optional[str]) -> None:
         super().__init__(code)
         self._description = MODIFIERS.get(code, None)
@@ -47,7 +49,7 @@ class ModifierMixin(HasConcatenateStringProntocol):
     """Mixin to add modifier attribute to the report."""
 
     def __init__(self) -> None:
-        self._modifier = Modifier(None)
+        self._modifier = null_group(Modifier)
 
     def _handle_modifier(self, match: re.Match) -> None:
         self._modifier = Modifier(match.string)
@@ -1,12 +1,23 @@
 import json
 
 from abc import ABCMeta, abstractmethod
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .group import reduce_model, register_model
 
 
 class Numeric(metaclass=ABCMeta):
     """Basic structure to handle numeric values."""
 
+    __slots__ = ("_value",)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        register_model(cls)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return reduce_model(self)
+
     def __init__(self, value: Optional[float]) -> None:
         self._value = value
 
@@ -0,0 +1,389 @@
+import re
+import threading
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple, Type
+
+from ....utils import PatternGuard, Span, compile_pattern, get_guard
+from .group import GroupHandler
+
+
+# Maximum number of tokens and token shapes kept by every dispatch table
+_MAX_ENTRIES = 4096
+
+Shape = Tuple[str, str, int]
+
+# Candidate positions of a token, by the index of the first handler to try
+Candidates = Tuple[Tuple[int, ...], ...]
+
+# Handlers and matches of the groups kept to be handled later
+PendingGroups = List[Tuple[GroupHandler, re.Match]]
+
+
+class HandlerList(List[GroupHandler]):
+    """List of the group handlers of a class, resolved by `HandlerTable`.
+
+    The handlers are the functions of the class, so they are called with the
+    instance that parses the section as the first argument.
+    """
+
+    def __init__(self, handlers: Sequence[GroupHandler]) -> None:
+        super().__init__(handlers)
+        self.regexps: Tuple[str, ...] = tuple(h.regexp for h in handlers)
+
+
+class HandlerTable:
+    """Class-level specification of the group handlers of a section.
+
+    Every handler is given as the regular expression of the group and the
+    name of the method that handles it. The names are resolved the first time
+    the table is accessed from every class, so the subclasses that override
+    a handler get their own method, and the handler list is built once per
+    class instead of once per report.
+
+    Args:
+        *specs (Tuple[str, str]): the regular expressions and the names of the
+            handler methods, in the order they are matched.
+    """
+
+    def __init__(self, *specs: Tuple[str, str]) -> None:
+        self._specs = specs
+        self._lists: Dict[type, HandlerList] = {}
+
+    def __get__(self, instance: Any, owner: Type[Any]) -> HandlerList:
+        try:
+            return self._lists[owner]
+        except KeyError:
+            pass
+
+        handlers = HandlerList(
+            [GroupHandler(regexp, getattr(owner, name)) for regexp, name in self._specs]
+        )
+        return self._lists.setdefault(owner, handlers)
+
+
+def _regexps(handlers: Sequence[GroupHandler]) -> Tuple[str, ...]:
+    if isinstance(handlers, HandlerList):
+        return handlers.regexps
+
+    return tuple(h.regexp for h in handlers)
+
+
+class DispatchTable:
+    """Candidate handlers of a handler list by the shape of the token.
+
+    The shape of a token is its first character, its last character and its
+    length. The positions of the handlers whose guards accept a shape are
+    computed the first time a token of that shape is parsed, so the patterns
+    that can't match the token are never tried. The candidates of the most
+    recent tokens are also kept by token, to skip building the shape.
+
+    Args:
+        regexps (Sequence[str]): the regular expressions of the handler list.
+    """
+
+    def __init__(self, regexps: Sequence[str]) -> None:
+        self.patterns: List[Pattern[str]] = [compile_pattern(r) for r in regexps]
+        self._guards: List[Optional[PatternGuard]] = [get_guard(r) for r in regexps]
+        self._shapes: Dict[Shape, Candidates] = {}
+        self._tokens: Dict[str, Candidates] = {}
+
+    def candidates(self, token: str) -> Candidates:
+        """Get the positions of the handlers that can match the token.
+
+        Returns:
+            Candidates: the item `i` are the positions from the handler `i`
+            onwards, in order.
+        """
+        try:
+            return self._tokens[token]
+        except KeyError:
+            pass
+
+        shape = (token[:1], token[-1:], len(token))
+        try:
+            candidates = self._shapes[shape]
+        except KeyError:
+            candidates = self._build(token)
+            if len(self._shapes) >= _MAX_ENTRIES:
+                self._shapes.clear()
+            self._shapes[shape] = candidates
+
+        if len(self._tokens) >= _MAX_ENTRIES:
+            self._tokens.clear()
+        self._tokens[token] = candidates
+        return candidates
+
+    def _build(self, token: str) -> Candidates:
+        if token.endswith("\n"):
+            # `$` also matches before a trailing newline
+            positions = tuple(range(len(self._guards)))
+        else:
+            positions = tuple(
+                i
+                for i, guard in enumerate(self._guards)
+                if guard is None or guard.accepts(token)
+            )
+
+        return tuple(
+            positions[bisect_left(positions, index) :]
+            for index in range(len(self._guards) + 1)
+        )
+
+
+_TABLES: Dict[Tuple[str, ...], DispatchTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_dispatch_table(handlers: Sequence[GroupHandler]) -> DispatchTable:
+    """Get the dispatch table of the handler list, shared by all the lists
+    with the same regular expressions."""
+    key = _regexps(handlers)
+    try:
+        return _TABLES[key]
+    except KeyError:
+        with _tables_lock:
+            return _TABLES.setdefault(key, DispatchTable(key))
+
+
+# Named groups of the patterns, turned into non-capturing groups when the
+# patterns are joined, as the same names appear in many patterns
+_NAMED_GROUP = re.compile(r"(?<!\\)\(\?P<\w+>")
+
+
+class AlternationTable:
+    """Combined regular expressions of a handler list.
+
+    The patterns of the handlers from the position `i` onwards are joined in
+    one alternation, in order, so a single match call finds the first handler
+    whose pattern matches the group. The alternations are compiled the first
+    time they are needed.
+
+    Args:
+        regexps (Sequence[str]): the regular expressions of the handler list.
+    """
+
+    def __init__(self, regexps: Sequence[str]) -> None:
+        if any("(?P=" in r for r in regexps):
+            raise ValueError("named backreferences can't be joined")
+
+        self.patterns: List[Pattern[str]] = [compile_pattern(r) for r in regexps]
+        self._alternatives = [
+            "(?P<_h{}>{})".format(i, _NAMED_GROUP.sub("(?:", r))
+            for i, r in enumerate(regexps)
+        ]
+        self._combined: List[Optional[Tuple[Pattern[str], Dict[int, int]]]] = [
+            None for _ in range(len(regexps) + 1)
+        ]
+
+    def combined(self, index: int) -> Tuple[Pattern[str], Dict[int, int]]:
+        """Get the alternation of the handlers from `index` onwards and the
+        positions of the handlers by the number of their groups in it."""
+        combined = self._combined[index]
+        if combined is None:
+            if index < len(self._alternatives):
+                pattern = re.compile("|".join(self._alternatives[index:]))
+            else:
+                # Nothing left to match
+                pattern = re.compile(r"(?!)")
+
+            positions = {
+                number: int(name[2:]) for name, number in pattern.groupindex.items()
+            }
+            combined = self._combined[index] = (pattern, positions)
+
+        return combined
+
+
+DISPATCH = "dispatch"
+ALTERNATION = "alternation"
+ENGINES = (DISPATCH, ALTERNATION)
+
+_engine: str = DISPATCH
+
+
+def set_parser_engine(engine: str) -> None:
+    """Set the engine used by `parse_section` when the call doesn't give one.
+
+    Args:
+        engine (str): `dispatch` to try the regular expressions of the
+            handlers that can match every group one by one, or `alternation`
+            to find the handler with a single combined regular expression.
+
+    Raises:
+        ValueError: if the engine is unknown.
+    """
+    global _engine
+
+    if engine not in ENGINES:
+        raise ValueError(f"unknown parser engine: {engine!r}")
+
+    _engine = engine
+
+
+def get_parser_engine() -> str:
+    """Get the engine used by `parse_section` when the call doesn't give one."""
+    return _engine
+
+
+_ALTERNATIONS: Dict[Tuple[str, ...], AlternationTable] = {}
+
+
+def get_alternation_table(handlers: Sequence[GroupHandler]) -> AlternationTable:
+    """Get the alternation table of the handler list, shared by all the lists
+    with the same regular expressions."""
+    key = _regexps(handlers)
+    try:
+        return _ALTERNATIONS[key]
+    except KeyError:
+        with _tables_lock:
+            return _ALTERNATIONS.setdefault(key, AlternationTable(key))
+
+
+def parse_section(
+    handlers: List[GroupHandler],
+    section: str,
+    engine: Optional[str] = None,
+    owner: Any = None,
+) -> List[str]:
+    """Parse the groups of the section.
+
+    Every group is matched against the handlers after the last one that
+    matched, in order, and the first handler that matches is called. Both
+    engines give the same results:
+
+    * `dispatch` skips the handlers whose patterns can't match the group by
+    its first and last characters or its length, and tries the rest one by
+    one.
+    * `alternation` finds the handler with one combined regular expression of
+    all the handlers left, and matches the pattern of that handler again to
+    pass its match to the handler.
+
+    Args:
+        handlers (List[GroupHandler]): handler list to manage and match.
+        section (str): the section containing all the groups to parse separated
+        by spaces.
+        engine (str, optional): the engine to use. Defaults to the engine set
+            with `set_parser_engine`, `dispatch` if none was set.
+        owner (Any, optional): the instance passed as the first argument to
+            the handlers, for the handler lists of a `HandlerTable`. Defaults
+            to None, the handlers only get the match.
+
+    Returns:
+        unparsed_groups (List[str]): the not matched groups with anyone
+            of the regular expresions stored in `handlers`.
+    """
+    return [span.text for span in parse_groups(handlers, section, 0, engine, owner)]
+
+
+def parse_groups(
+    handlers: List[GroupHandler],
+    section: str,
+    offset: int = 0,
+    engine: Optional[str] = None,
+    owner: Any = None,
+    pending: Optional[PendingGroups] = None,
+) -> List[Span]:
+    """Parse the groups of the section like `parse_section`, keeping the
+    offsets of the groups that don't match.
+
+    Only the offsets of the groups are tracked while parsing, the spans are
+    built for the unparsed groups alone.
+
+    Args:
+        handlers (List[GroupHandler]): handler list to manage and match.
+        section (str): the section containing all the groups to parse separated
+        by spaces.
+        offset (int, optional): the offset of the section in its report.
+            Defaults to 0.
+        engine (str, optional): the engine to use. Defaults to the engine set
+            with `set_parser_engine`, `dispatch` if none was set.
+        owner (Any, optional): the instance passed as the first argument to
+            the handlers. Defaults to None, the handlers only get the match.
+        pending (PendingGroups, optional): if given, the handlers aren't
+            called, the matched handlers and their matches are appended to
+            it in order. Defaults to None.
+
+    Returns:
+        List[Span]: the unparsed groups and their offsets in the report.
+    """
+    if engine is None:
+        engine = _engine
+
+    if engine == DISPATCH:
+        return _parse_dispatch(handlers, section, offset, owner, pending)
+
+    if engine == ALTERNATION:
+        return _parse_alternation(handlers, section, offset, owner, pending)
+
+    raise ValueError(f"unknown parser engine: {engine!r}")
+
+
+def _handle(handler: GroupHandler, owner: Any, match: re.Match) -> None:
+    if owner is None:
+        handler.handler(match)
+    else:
+        handler.handler(owner, match)
+
+
+def _parse_dispatch(
+    handlers: List[GroupHandler],
+    section: str,
+    offset: int,
+    owner: Any,
+    pending: Optional[PendingGroups],
+) -> List[Span]:
+    unparsed_groups: List[Span] = []
+    index: int = 0
+    table = get_dispatch_table(handlers)
+    patterns = table.patterns
+
+    for group in section.split(" "):
+        for position in table.candidates(group)[index]:
+            match = patterns[position].match(group)
+
+            if match:
+                index = position + 1
+                if pending is None:
+                    _handle(handlers[position], owner, match)
+                else:
+                    pending.append((handlers[position], match))
+                break
+        else:
+            unparsed_groups.append(Span(group, offset, offset + len(group)))
+
+        offset += len(group) + 1
+
+    return unparsed_groups
+
+
+def _parse_alternation(
+    handlers: List[GroupHandler],
+    section: str,
+    offset: int,
+    owner: Any,
+    pending: Optional[PendingGroups],
+) -> List[Span]:
+    unparsed_groups: List[Span] = []
+    index: int = 0
+    table = get_alternation_table(handlers)
+    pattern, positions = table.combined(0)
+
+    for group in section.split(" "):
+        found = pattern.match(group)
+
+        if found:
+            position = positions[found.lastindex]  # type: ignore
+            index = position + 1
+            match = table.patterns[position].match(group)
+            if pending is None:
+                _handle(handlers[position], owner, match)  # type: ignore
+            else:
+                pending.append((handlers[position], match))  # type: ignore
+            pattern, positions = table.combined(index)
+        else:
+            unparsed_groups.append(Span(group, offset, offset + len(group)))
+
+        offset += len(group) + 1
+
+    return unparsed_groups
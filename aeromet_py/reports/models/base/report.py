@@ -1,27 +1,152 @@
 import json
 import re
+import threading
 
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
+from ....utils import Span, compile_pattern, highlight
+from .errors import ParserError
+from .group import GroupHandler, null_group
+from .parser import PendingGroups, parse_groups
 from .station import Station
 from .string_attribute import StringAttributeMixin
 from .time import Time, TimeMixin
 from .type import ReportType
 
 
+# Runs of whitespace and single newlines or tabs
+_WHITESPACE = compile_pattern(r"\s(?:\s+|(?<=[\n\t]))")
+
+
+def normalize_code(code: str) -> str:
+    """Get the raw code of a report: the code stripped, with the runs of
+    whitespace replaced by one space and without the `=` characters."""
+    return _WHITESPACE.sub(" ", code.strip()).replace("=", "")
+
+
+class ValidationResult(NamedTuple):
+    """Result of validating a report without decoding its groups.
+
+    The key fields are the codes of the groups as found in the report, None
+    if the group isn't found.
+    """
+
+    raw_code: str
+    station: Optional[str]
+    time: Optional[str]
+    unparsed_spans: List[Span]
+
+    @property
+    def unparsed_groups(self) -> List[str]:
+        """Get the unparsed groups of the report."""
+        return [span.text for span in self.unparsed_spans]
+
+    @property
+    def valid(self) -> bool:
+        """Get if all the groups of the report were parsed."""
+        return not self.unparsed_spans
+
+
+def key_codes(pending: PendingGroups) -> Tuple[Optional[str], Optional[str]]:
+    """Get the codes of the station and time groups from the matched groups
+    of a report."""
+    station: Optional[str] = None
+    time: Optional[str] = None
+    for handler, match in pending:
+        name = handler.handler.__name__
+        if name == "_handle_station":
+            station = match.string
+        elif name == "_handle_time":
+            time = match.string
+
+    return station, time
+
+
+# Names of the handlers wanted by report class and fields
+_WANTED_HANDLERS: Dict[Tuple[type, FrozenSet[str]], FrozenSet[str]] = {}
+
+
 class Report(StringAttributeMixin, TimeMixin, metaclass=ABCMeta):
-    """Basic structure for an aeronautical report from land stations."""
+    """Basic structure for an aeronautical report from land stations.
 
-    def __init__(self, code: str, truncate: bool = False, type: str = "METAR") -> None:
+    In lazy mode the groups are matched when the report is created, but the
+    handlers of the groups are called the first time one of the attributes
+    they set is accessed. So the errors decoding a group, raised by the
+    constructor otherwise, are raised when it's accessed, every time.
+
+    If `fields` is given, only the handlers of those fields are called, the
+    rest of the groups are matched but not decoded, and keep their empty
+    values, and the change periods are skipped unless they are requested.
+    """
+
+    # The attributes set by every handler, to know which handlers to call
+    # when an attribute is accessed in lazy mode
+    _handler_fields: Dict[str, Tuple[str, ...]] = {
+        "_handle_type": ("_type",),
+        "_handle_station": ("_station",),
+        "_handle_time": ("_time",),
+    }
+
+    # The attributes needed by every field of the report, if they aren't
+    # the name of the field with a leading underscore
+    _field_attributes: Dict[str, Tuple[str, ...]] = {
+        "type_": ("_type",),
+    }
+
+    # The method that parses the change periods, called in lazy mode when
+    # the unparsed groups are accessed
+    _changes_parser: Optional[str] = None
+
+    # The lock of the decoding, only needed by the lazy reports and the
+    # ones with fields, as the others are done when created
+    _decode_lock: ContextManager[Any] = nullcontext()
+
+    def __init__(
+        self,
+        code: str,
+        truncate: bool = False,
+        type: str = "METAR",
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> None:
         assert code != "", "code must be a non-empty string"
 
-        code = code.strip()
         self._truncate = truncate
 
-        self._raw_code: str = re.sub(r"\s{2,}|\n+|\t+", " ", code)
-        self._raw_code = self._raw_code.replace("=", "")
-        self._unparsed_groups: List[str] = []
+        self._lazy = lazy
+        self._deferred = 0
+        self._position: Optional[int] = None
+
+        # Names of the handlers to call, None to call all of them
+        self._fields: Optional[FrozenSet[str]] = None
+        self._wanted: Optional[FrozenSet[str]] = None
+        if fields is not None:
+            self._fields = frozenset(fields)
+            self._wanted = self._wanted_handlers(self._fields)
+
+        self._init_decoding()
+
+        self._raw_code: str = normalize_code(code)
+        self._unparsed_spans: List[Span] = []
+        # If the groups of the change periods, not wanted, are yet to be
+        # matched to find their unparsed groups
+        self._changes_unmatched = False
         self._sections: List[str] = []
 
         # Initialize mixins
@@ -32,7 +157,258 @@ class Report(StringAttributeMixin, TimeMixin, metaclass=ABCMeta):
         self._type: ReportType = ReportType(type.upper())
 
         # Initialize Station group
-        self._station: Station = Station(None, None)
+        self._station: Station = null_group(Station, None)
+
+    def _init_decoding(self) -> None:
+        if self._lazy or self._wanted is not None:
+            self._decode_lock = threading.RLock()
+
+        if not self._lazy:
+            return
+
+        # Calls of the handlers waiting to be done in lazy mode by handler
+        # name, with the position of the group in the report, and the
+        # default values of the attributes they set. The handlers are called
+        # with the lock held, so the report can be read from many threads
+        self._pending: Dict[str, List[Tuple[int, Callable[..., None], tuple]]] = {}
+        self._defaults: Dict[str, Any] = {}
+        self._decoding: Dict[str, Any] = {}
+        self._strings: List[Tuple[int, Any]] = []
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # Only called if the attribute isn't found, as the attributes
+            # set by the pending handlers are removed until they are called
+            attributes = self.__dict__
+            if attributes.get("_lazy"):
+                with self._decode_lock:
+                    # Decoded by another thread since it wasn't found
+                    if name in attributes:
+                        return attributes[name]
+
+                    # Read by its own handler, or another one it calls
+                    if name in self._decoding:
+                        return self._decoding[name]
+
+                    if name in self._defaults:
+                        self._decode(name)
+                        return attributes[name]
+
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+    def __str__(self) -> str:
+        if self._lazy:
+            with self._decode_lock:
+                self._decode_all()
+
+        return super().__str__()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Send the decoded groups, pickled as their decoded attributes, so
+        # the report isn't parsed again where it's loaded
+        with self._decode_lock:
+            if self._lazy:
+                self._decode_all()
+
+            state = {
+                name: value
+                for name, value in self.__dict__.items()
+                if name not in _DECODING_ATTRIBUTES
+            }
+
+        return (_load_report, (type(self), state))
+
+    def _concatenate_string(self, obj: Any) -> None:
+        if self._position is None:
+            super()._concatenate_string(obj)
+        else:
+            self._strings.append((self._position, obj))
+
+    @classmethod
+    def _wanted_handlers(cls, fields: FrozenSet[str]) -> FrozenSet[str]:
+        """Get the names of the handlers that set the attributes of the fields.
+
+        The fields are the properties of the report, and the methods listed
+        in `_field_attributes`.
+
+        Raises:
+            ValueError: if a field isn't one of them.
+        """
+        key = (cls, fields)
+        try:
+            return _WANTED_HANDLERS[key]
+        except KeyError:
+            pass
+
+        attributes: Set[str] = set()
+        for field in fields:
+            if field.startswith("_") or not (
+                field in cls._field_attributes
+                or isinstance(getattr(cls, field, None), property)
+            ):
+                raise ValueError(f"unknown field of {cls.__name__}: {field!r}")
+
+            attributes.update(cls._field_attributes.get(field, ("_" + field,)))
+
+        wanted = frozenset(
+            name
+            for name, names in cls._handler_fields.items()
+            if attributes.intersection(names)
+        )
+        return _WANTED_HANDLERS.setdefault(key, wanted)
+
+    def _parse_groups(
+        self, handlers: List[GroupHandler], section: str, offset: int = 0
+    ) -> None:
+        """Parse the groups of the section, or keep the matches of the groups
+        to handle them later in lazy mode."""
+        if not self._lazy and self._wanted is None:
+            self._unparsed_spans += parse_groups(handlers, section, offset, owner=self)
+            return
+
+        pending: PendingGroups = []
+        self._unparsed_spans += parse_groups(
+            handlers, section, offset, owner=self, pending=pending
+        )
+        wanted = self._wanted
+        for handler, match in pending:
+            function = handler.handler
+            if wanted is not None and function.__name__ not in wanted:
+                continue
+
+            if self._lazy:
+                self._defer(function, match)
+            else:
+                function(self, match)
+
+    def _parse_changes(self) -> None:
+        """Parse the change periods of the report, unless they are deferred in
+        lazy mode or not wanted."""
+        if self._changes_parser is None:
+            return
+
+        parser = getattr(type(self), self._changes_parser)
+        if self._wanted is not None and self._changes_parser not in self._wanted:
+            # Only their unparsed groups are needed, when they are read or
+            # to raise the error now
+            self._changes_unmatched = True
+            if self._truncate:
+                self._match_changes()
+                self._raise_unparsed()
+        elif not self._lazy:
+            parser(self)
+        elif not self._truncate:
+            self._defer(parser)
+        else:
+            # Parsed now to raise the error, but its groups go after the
+            # groups still deferred in the string of the report
+            self._position = self._deferred
+            self._deferred += 1
+            try:
+                parser(self)
+            finally:
+                self._position = None
+
+    def _match_changes(self) -> None:
+        """Find the unparsed groups of the change periods not wanted, matching
+        their groups without calling the handlers."""
+        if self._changes_unmatched:
+            self._changes_unmatched = False
+            self._unparsed_spans += self._unparsed_changes()
+
+    def _unparsed_changes(self) -> List[Span]:
+        """Get the unparsed groups of the change periods, matching their
+        groups without calling the handlers, as `validate_*` does."""
+        return []
+
+    def _raise_unparsed(self) -> None:
+        """Raise a ParserError if there are unparsed groups and the report
+        was created with `truncate`."""
+        if self._unparsed_spans and self._truncate:
+            raise ParserError(
+                "failed while processing {} from: {}".format(
+                    ", ".join(span.text for span in self._unparsed_spans),
+                    self.raw_code,
+                )
+            )
+
+    def _defer(self, function: Callable[..., None], *args: Any) -> None:
+        """Keep the call of the handler `function` of the report with `args`
+        until one of the attributes it sets is accessed."""
+        name = function.__name__
+        calls = self._pending.get(name)
+        if calls is None:
+            calls = self._pending[name] = []
+            for field in self._handler_fields[name]:
+                if field in self.__dict__:
+                    self._defaults[field] = self.__dict__.pop(field)
+
+        calls.append((self._deferred, function, args))
+        self._deferred += 1
+
+    def _decode(self, field: str) -> None:
+        """Call the pending handlers that set the attribute."""
+        for name in [n for n in self._pending if field in self._handler_fields[n]]:
+            self._call_pending(name)
+
+    def _decode_all(self) -> None:
+        """Call all the pending handlers and build the string of the report."""
+        while self._pending:
+            name = min(self._pending, key=lambda n: self._pending[n][0][0])
+            self._call_pending(name)
+
+        if self._strings:
+            # The groups are kept by their position in the report to get the
+            # order of the handlers called when the report is created
+            self._strings.sort(key=lambda item: item[0])
+            self._string_groups += [obj for _, obj in self._strings]
+            self._strings = []
+
+    def _call_pending(self, name: str) -> None:
+        """Call the pending handler with the lock held. Its attributes are
+        set once it's done, so the other threads don't get them half built."""
+        calls = self._pending.pop(name, None)
+        if calls is None:
+            # Called while accessing an attribute from one of its handlers
+            return
+
+        fields = [f for f in self._handler_fields[name] if f in self._defaults]
+        for field in fields:
+            self._decoding[field] = self._defaults.pop(field)
+
+        previous = self._position
+        strings = len(self._strings)
+        done = 0
+        try:
+            for position, function, args in calls:
+                self._position = position
+                function(self, *args)
+                done += 1
+        except BaseException:
+            # Keep the calls left and the defaults, so the error is raised
+            # again the next time the attributes are accessed
+            self._pending[name] = calls[done:]
+            del self._strings[strings:]
+            for field in fields:
+                self.__dict__.pop(field, None)
+                self._defaults[field] = self._decoding.pop(field)
+            raise
+        else:
+            for field in fields:
+                # Keep the value set by the handler, or the default one
+                value = self._decoding.pop(field)
+                self.__dict__.setdefault(field, value)
+        finally:
+            self._position = previous
+
+    @property
+    def lazy(self) -> bool:
+        """Get if the groups of the report are decoded on access, raising the
+        errors decoding them there instead of when the report is created."""
+        return self._lazy
 
     @abstractmethod
     def _handle_sections(self) -> None:
@@ -77,7 +453,26 @@ class Report(StringAttributeMixin, TimeMixin, metaclass=ABCMeta):
     @property
     def unparsed_groups(self) -> List[str]:
         """Get the unparsed groups of the report."""
-        return self._unparsed_groups
+        return [span.text for span in self.unparsed_spans]
+
+    @property
+    def unparsed_spans(self) -> List[Span]:
+        """Get the unparsed groups of the report and their offsets in the
+        raw code."""
+        if self._changes_parser is not None:
+            # The change periods are parsed when decoded in lazy mode, or
+            # only matched if they aren't wanted
+            with self._decode_lock:
+                if self._lazy:
+                    self._call_pending(self._changes_parser)
+
+                self._match_changes()
+
+        return self._unparsed_spans
+
+    def highlight_unparsed(self, marker: str = "^") -> str:
+        """Returns the raw code with the unparsed groups marked below it."""
+        return highlight(self._raw_code, self.unparsed_spans, marker)
 
     @property
     def sections(self) -> List[str]:
@@ -99,3 +494,17 @@ class Report(StringAttributeMixin, TimeMixin, metaclass=ABCMeta):
     def to_json(self) -> str:
         """Returns the report data as a string in JSON format."""
         return json.dumps(self.as_dict())
+
+
+# The attributes of the lazy decoding, not pickled with the report
+_DECODING_ATTRIBUTES = frozenset(
+    ("_pending", "_defaults", "_decoding", "_decode_lock", "_strings")
+)
+
+
+def _load_report(report_class: Type[Report], state: Dict[str, Any]) -> Report:
+    """Load a pickled report, see `Report.__reduce__`."""
+    report: Report = report_class.__new__(report_class)
+    report.__dict__.update(state)
+    report._init_decoding()
+    return report
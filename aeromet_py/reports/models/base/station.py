@@ -1,6 +1,6 @@
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
-from ....database import get_country, get_stations
+from ....database import StationData, get_country, get_station_data
 from .group import Group
 
 
@@ -19,20 +19,12 @@ class Station(Group):
         type (str): the type of land station code (ICAO, IATA, SYNOP).
     """
 
+    __slots__ = ("_code", "_station")
+
     def __init__(self, code: str, type: str) -> None:
         super().__init__(code)
 
-        if code is not None:
-            self._station = self._get_data(code, CODE_TYPES.get(type))
-        else:
-            self._station = [None for _ in range(8)]
-
-    def _get_data(self, code: str, index: int) -> List[Optional[str]]:
-        for stn in get_stations():
-            if code == stn[index]:
-                return stn
-
-        return [None for _ in range(8)]
+        self._station: StationData = get_station_data(code, CODE_TYPES.get(type))
 
     def __str__(self) -> str:
         return (
@@ -45,42 +37,42 @@ class Station(Group):
     @property
     def name(self) -> Optional[str]:
         """Get the name of the station."""
-        return self._station[0]
+        return self._station.name
 
     @property
     def icao(self) -> Optional[str]:
         """Get the ICAO code of the station."""
-        return self._station[1]
+        return self._station.icao
 
     @property
     def iata(self) -> Optional[str]:
         """Get the IATA code of the stations."""
-        return self._station[2]
+        return self._station.iata
 
     @property
     def synop(self) -> Optional[str]:
         """Get the SYNOP code of the station."""
-        return self._station[3]
+        return self._station.synop
 
     @property
     def latitude(self) -> Optional[str]:
         """Get the latitude of the station."""
-        return self._station[4]
+        return self._station.latitude
 
     @property
     def longitude(self) -> Optional[str]:
         """Get the longitude of the station."""
-        return self._station[5]
+        return self._station.longitude
 
     @property
     def elevation(self) -> Optional[str]:
         """Get the elevation in meters above sea level of the station."""
-        return self._station[6]
+        return self._station.elevation
 
     @property
     def country(self) -> Optional[str]:
         """The country to which the land station belongs."""
-        return get_country(self._station[7])
+        return get_country(self._station.country)
 
     def as_dict(self) -> Dict[str, Optional[str]]:
         d = {
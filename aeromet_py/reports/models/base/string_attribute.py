@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List
 
 from typing_extensions import Protocol
 
@@ -9,14 +9,18 @@ class HasConcatenateStringProntocol(Protocol):
 
 
 class StringAttributeMixin:
-    """Basic structure to add string helpers to the report."""
+    """Basic structure to add string helpers to the report.
+
+    The groups are kept in the order they are parsed and described when the
+    string is requested, so parsing doesn't pay for the descriptions.
+    """
 
     def __init__(self) -> None:
-        # String buffer
-        self._string = ""
+        # Groups to describe in the string
+        self._string_groups: List[Any] = []
 
     def __str__(self) -> str:
-        return self._string.strip()
+        return "".join(str(obj) + "\n" for obj in self._string_groups).strip()
 
     def _concatenate_string(self, obj: Any) -> None:
-        self._string += str(obj) + "\n"
+        self._string_groups.append(obj)
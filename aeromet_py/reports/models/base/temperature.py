@@ -7,6 +7,8 @@ from .numeric import Numeric
 class Temperature(Numeric):
     """Basic structure for temperature attributes."""
 
+    __slots__ = ()
+
     def __init__(self, code: Optional[str]) -> None:
         if code is None or code in ["//", "///"]:
             code = "///"
@@ -1,56 +1,91 @@
 import re
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple, Union
 
 from .group import Group
 
 
+# The time used as the current time, None to use the current UTC time
+_reference: Optional[datetime] = None
+
+
+def set_reference_time(time: Optional[datetime]) -> None:
+    """Pin the time used as the current time to complete the year and month
+    of the reports parsed without them, e.g. to process an archive as of a
+    given date, or unpin it with None to use the current UTC time.
+
+    Args:
+        time (datetime | None): the reference time.
+    """
+    global _reference
+
+    _reference = time
+
+
+def get_reference_time() -> datetime:
+    """Get the time used as the current time, the pinned reference time or
+    the current UTC time if there is none."""
+    if _reference is not None:
+        return _reference
+
+    return datetime.utcnow()
+
+
+# Year, month, day, hour and minute of a time to build
+Fields = Tuple[Optional[int], Optional[int], int, int, int]
+
+
 class Time(Group):
-    """Basic structure for time code groups in reports from land stations."""
+    """Basic structure for time code groups in reports from land stations.
+
+    The times without year or month take them from the reference time, see
+    `get_reference_time`. The default time, without code, is built when it's
+    accessed for the first time.
+    """
+
+    __slots__ = ("_code", "_time", "_fields")
 
     def __init__(
         self,
         code: Optional[str] = None,
-        minute: Optional[str] = None,
-        hour: Optional[str] = None,
-        day: Optional[str] = None,
+        minute: Union[str, int, None] = None,
+        hour: Union[str, int, None] = None,
+        day: Union[str, int, None] = None,
         month: Optional[int] = None,
         year: Optional[int] = None,
         time: Optional[datetime] = None,
     ) -> None:
-        self._time: datetime
+        self._time: Optional[datetime] = time
+        self._fields: Optional[Fields] = None
 
         super().__init__(code)
 
         if time:
-            self._time = time
+            return
+
+        fields: Fields = (
+            year,
+            month,
+            1 if day is None else int(day),
+            0 if hour is None else int(hour),
+            0 if minute is None else int(minute),
+        )
+        if code is None:
+            # The default time of a report is built only if it's accessed
+            self._fields = fields
         else:
-            today: datetime = datetime.utcnow()
-
-            if year is None:
-                year = today.year
-
-            if month is None:
-                month = today.month
+            self._time = self._build(fields)
 
-            if day is None:
-                day = "01"
+    @staticmethod
+    def _build(fields: Fields) -> datetime:
+        year, month, day, hour, minute = fields
+        if year is None or month is None:
+            today = get_reference_time()
+            year = today.year if year is None else year
+            month = today.month if month is None else month
 
-            if hour is None:
-                hour = "00"
-
-            if minute is None:
-                minute = "00"
-
-            generated_date: str = "{}{:02d}{}{}{}".format(
-                year,
-                month,
-                day,
-                hour,
-                minute,
-            )
-            self._time = datetime.strptime(generated_date, "%Y%m%d%H%M")
+        return datetime(year, month, day, hour, minute)
 
     @classmethod
     def from_metar(
@@ -62,13 +97,10 @@ class Time(Group):
         if match is None:
             return cls(year=year, month=month)
         else:
-            minute = match.group("min")
-            day = match.group("day")
-            hour = match.group("hour")
-            code = match.string
+            day, hour, minute = match.group("day", "hour", "min")
 
             return cls(
-                code=code,
+                code=match.string,
                 minute=minute,
                 hour=hour,
                 day=day,
@@ -77,37 +109,43 @@ class Time(Group):
             )
 
     def __str__(self) -> str:
-        return str(self._time)
+        return str(self.time)
 
     @property
     def time(self) -> datetime:
         """Get the time of the report as a `datetime` object."""
-        return self._time
+        # The fields are kept, so the threads reading the default time at
+        # once build the same one
+        time = self._time
+        if time is None:
+            time = self._time = self._build(self._fields)  # type: ignore
+
+        return time
 
     @property
     def year(self) -> int:
         """Get the year of the report."""
-        return self._time.year
+        return self.time.year
 
     @property
     def month(self) -> int:
         """Get the month of the report."""
-        return self._time.month
+        return self.time.month
 
     @property
     def day(self) -> int:
         """Get the day of the report."""
-        return self._time.day
+        return self.time.day
 
     @property
     def hour(self) -> int:
         """Get the hour of the report."""
-        return self._time.hour
+        return self.time.hour
 
     @property
     def minute(self) -> int:
         """Get the minute of the report."""
-        return self._time.minute
+        return self.time.minute
 
     def as_dict(self) -> Dict[str, str]:
         d = {
@@ -13,6 +13,8 @@ TYPES: Dict[str, str] = {
 class ReportType(Group):
     """Basic structure for type groups in reports from land stations."""
 
+    __slots__ = ("_code", "_type")
+
     def __init__(self, code: str):
         super().__init__(code)
         self._type = TYPES.get(code, None)
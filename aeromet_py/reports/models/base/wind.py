@@ -1,14 +1,15 @@
 import json
-import re
 
 from typing import Any, Dict, List, Optional
 
-from aeromet_py.utils import Conversions
+from aeromet_py.utils import Conversions, compile_pattern
 
 from .group import Group
 from .numeric import Numeric
 
 
+_SPACES = compile_pattern(r"\s{2,}")
+
 COMPASS_DIRS: Dict[str, List[float]] = {
     "NNE": [11.25, 33.75],
     "NE": [33.75, 56.25],
@@ -32,6 +33,8 @@ COMPASS_DIRS: Dict[str, List[float]] = {
 class Direction(Numeric):
     """Basic structure for directions attributes."""
 
+    __slots__ = ("_variable",)
+
     def __init__(self, code: Optional[str]) -> None:
         if code is None or code == "//":
             code = "///"
@@ -135,6 +138,8 @@ class Direction(Numeric):
 class Speed(Numeric):
     """Basic structure for speed attributes."""
 
+    __slots__ = ()
+
     def __init__(self, code: Optional[str]) -> None:
         if code is None or code == "//":
             code = "///"
@@ -187,6 +192,8 @@ class Speed(Numeric):
 class Wind:
     """Basic structure for wind groups in report from land stations."""
 
+    __slots__ = ("_direction", "_speed")
+
     def __init__(
         self,
         direction: Optional[str] = None,
@@ -206,7 +213,7 @@ class Wind:
             direction,
             self._speed,
         )
-        s = re.sub(r"\s{2,}", " ", s)
+        s = _SPACES.sub(" ", s)
         s = s.strip()
 
         return s
@@ -1,6 +1,6 @@
 import re
 
-from ..base import Cloud, CloudList, HasConcatenateStringProntocol
+from ..base import Cloud, CloudList, HasConcatenateStringProntocol, decode_group
 
 
 class MetarCloudMixin(HasConcatenateStringProntocol):
@@ -10,7 +10,7 @@ class MetarCloudMixin(HasConcatenateStringProntocol):
         self._clouds = CloudList()
 
     def _handle_cloud(self, match: re.Match) -> None:
-        cloud: Cloud = Cloud.from_metar(match)
+        cloud: Cloud = decode_group(Cloud.from_metar, match)
         self._clouds.add(cloud)
 
         self._concatenate_string(cloud)
@@ -9,6 +9,8 @@ from ..base import Group, Pressure
 class MetarPressure(Pressure, Group):
     """Basic structure for pressure in METAR from land stations."""
 
+    __slots__ = ("_code",)
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
@@ -2,13 +2,19 @@ import re
 
 from typing import Dict, Optional
 
+from ....utils import compile_pattern
 from ..base import Group
 from .weather import DESCRIPTION, OBSCURATION, OTHER, PRECIPITATION
 
 
+_SPACES = compile_pattern(r"\s{2,}")
+
+
 class MetarRecentWeather(Group):
     """Basic structure for recent weather groups in METAR."""
 
+    __slots__ = ("_code", "_description", "_obscuration", "_other", "_precipitation")
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
@@ -33,7 +39,7 @@ class MetarRecentWeather(Group):
             self._other,
         )
         s = s.replace("None", "")
-        s = re.sub(r"\s{2,}", " ", s)
+        s = _SPACES.sub(" ", s)
 
         return s.strip()
 
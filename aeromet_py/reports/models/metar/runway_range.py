@@ -46,6 +46,16 @@ def set_runway_name(code: Optional[str]) -> Optional[str]:
 class MetarRunwayRange(Group):
     """Basic structure to for runway range groups in reports from land stations."""
 
+    __slots__ = (
+        "_code",
+        "_name",
+        "_rvr_low",
+        "_rvr_high",
+        "_trend",
+        "_low_range",
+        "_high_range",
+    )
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
@@ -1,6 +1,6 @@
 import re
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from ..base import Group
 from .runway_range import set_runway_name
@@ -68,10 +68,24 @@ SURFACE_FRICTION: Dict[str, str] = {
 class MetarRunwayState(Group):
     """Basic structure for runway state groups in METAR."""
 
+    __slots__ = (
+        "_code",
+        "_snoclo",
+        "_clrd",
+        "_groups",
+        "_name",
+        "_deposits",
+        "_contamination",
+        "_deposits_depth",
+        "_surface_friction",
+    )
+
     def __init__(self, match: Optional[re.Match]) -> None:
         self._snoclo: bool = False
         self._clrd: bool = False
-        self._match = match
+        # The deposit, depth and friction codes, kept instead of the match so
+        # the group can be pickled
+        self._groups: Optional[Tuple[Optional[str], ...]] = None
 
         if match is None:
             super().__init__(None)
@@ -83,6 +97,7 @@ class MetarRunwayState(Group):
             self._surface_friction = None
         else:
             super().__init__(match.string)
+            self._groups = match.group("deposit", "depth", "fric")
 
             self._name = set_runway_name(match.group("name"))
             self._deposits = RUNWAY_DEPOSITS.get(match.group("deposit"), None)
@@ -126,8 +141,7 @@ class MetarRunwayState(Group):
 
     def _deposits_to_str(self) -> str:
         """Helper to convert deposits to string."""
-        deposit = self._match.group("deposit")
-        depth = self._match.group("depth")
+        deposit, depth, _ = self._groups  # type: ignore
 
         if deposit == "/":
             if depth == "99" or depth == "//":
@@ -155,11 +169,11 @@ class MetarRunwayState(Group):
 
     def _surface_friction_to_str(self) -> str:
         """Helper to convert the surface friction to string."""
-        friction = self._match.group("fric")
+        code = self._groups[2]  # type: ignore
 
-        if friction is not None:
+        if code is not None:
             try:
-                friction = int(friction)
+                friction = int(code)
             except ValueError:
                 return self._surface_friction
             else:
@@ -171,7 +185,7 @@ class MetarRunwayState(Group):
             return ""
 
     def __str__(self) -> str:
-        if self._match is None:
+        if self._groups is None:
             return ""
 
         if self.snoclo:
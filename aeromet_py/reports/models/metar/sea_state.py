@@ -24,6 +24,8 @@ SEA_STATE: Dict[str, str] = {
 class MetarSeaState(Group):
     """Basic structure for sea state data in METAR."""
 
+    __slots__ = ("_code", "_temperature", "_state", "_height")
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
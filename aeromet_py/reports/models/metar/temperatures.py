@@ -8,6 +8,8 @@ from ..base import Group, Temperature
 class MetarTemperatures(Group):
     """Basic structure for temperatures in METAR from land stations."""
 
+    __slots__ = ("_code", "_temperature", "_dewpoint")
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
@@ -9,6 +9,8 @@ from ..base import ChangeIndicator, Time
 class MetarTrendIndicator(ChangeIndicator):
     """Basic structure for trend codes in METAR."""
 
+    __slots__ = ("_init_period", "_end_period", "_from", "_until", "_at")
+
     def __init__(self, match: Optional[re.Match], time: datetime) -> None:
         super().__init__(match)
 
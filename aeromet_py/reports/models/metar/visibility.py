@@ -3,14 +3,23 @@ import re
 from typing import Any, Dict, Optional
 
 from ....utils import Conversions
-from ..base import Direction, Distance, Group, HasConcatenateStringProntocol
+from ..base import (
+    Direction,
+    Distance,
+    Group,
+    HasConcatenateStringProntocol,
+    decode_group,
+    null_group,
+)
 
 
 class Visibility(Group):
     """Basic structure for visibility data in reports from land stations."""
 
+    __slots__ = ("_code", "_visibility")
+
     def __init__(self, code: str) -> None:
-        self._visibility = Distance(None)
+        self._visibility = null_group(Distance)
 
         super().__init__(code)
 
@@ -51,8 +60,10 @@ class Visibility(Group):
 class VisibilityWithDirection(Visibility):
     """Basic structure for visibility data with a direction in reports from land stations."""
 
+    __slots__ = ("_direction",)
+
     def __init__(self, code: str) -> None:
-        self._direction = Direction(None)
+        self._direction = null_group(Direction)
 
         super().__init__(code)
 
@@ -99,6 +110,8 @@ class VisibilityWithDirection(Visibility):
 class MetarMinimumVisibility(VisibilityWithDirection):
     """Basic structure for minimum visibility groups in reports from land stations."""
 
+    __slots__ = ()
+
     def __init__(self, match: Optional[re.Match]) -> None:
 
         if match is not None:
@@ -119,6 +132,8 @@ class MetarMinimumVisibility(VisibilityWithDirection):
 class MetarPrevailingVisibility(VisibilityWithDirection):
     """Basic structure for prevailing visibility in reports from land stations."""
 
+    __slots__ = ("_cavok",)
+
     def __init__(self, match: Optional[re.Match]) -> None:
         self._cavok = False
 
@@ -212,7 +227,7 @@ class MetarPrevailingMixin(HasConcatenateStringProntocol):
         self._prevailing = MetarPrevailingVisibility(None)
 
     def _handle_prevailing(self, match: re.Match) -> None:
-        self._prevailing = MetarPrevailingVisibility(match)
+        self._prevailing = decode_group(MetarPrevailingVisibility, match)
 
         self._concatenate_string(self._prevailing)
 
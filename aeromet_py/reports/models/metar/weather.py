@@ -2,9 +2,12 @@ import re
 
 from typing import Dict, Optional
 
-from ..base import Group, GroupList, HasConcatenateStringProntocol
+from ....utils import compile_pattern
+from ..base import Group, GroupList, HasConcatenateStringProntocol, decode_group
 
 
+_SPACES = compile_pattern(r"\s{2,}")
+
 INTENSITY: Dict[str, str] = {
     "-": "light",
     "+": "heavy",
@@ -61,6 +64,15 @@ OTHER: Dict[str, str] = {
 class MetarWeather(Group):
     """Basic structure for weather groups in reports from land stations."""
 
+    __slots__ = (
+        "_code",
+        "_intensity",
+        "_description",
+        "_precipitation",
+        "_obscuration",
+        "_other",
+    )
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
@@ -88,7 +100,7 @@ class MetarWeather(Group):
             self._other,
         )
         s = s.replace("None", "")
-        s = re.sub(r"\s{2,}", " ", s)
+        s = _SPACES.sub(" ", s)
 
         return s.strip()
 
@@ -136,7 +148,7 @@ class MetarWeatherMixin(HasConcatenateStringProntocol):
         self._weathers = GroupList[MetarWeather](3)
 
     def _handle_weather(self, match: re.Match) -> None:
-        weather: MetarWeather = MetarWeather(match)
+        weather: MetarWeather = decode_group(MetarWeather, match)
         self._weathers.add(weather)
 
         self._concatenate_string(weather)
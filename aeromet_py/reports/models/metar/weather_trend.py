@@ -3,15 +3,15 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from ....utils import MetarRegExp, sanitize_visibility
+from ....utils import MetarRegExp, Span, sanitize_visibility
 from ..base import (
     FlightRulesMixin,
     Group,
-    GroupHandler,
     GroupList,
+    HandlerTable,
     StringAttributeMixin,
     Time,
-    parse_section,
+    parse_groups,
 )
 from .cloud import MetarCloudMixin
 from .should_be_cavok import ShouldBeCavokMixin
@@ -31,11 +31,18 @@ class Forecast(
     FlightRulesMixin,
     ShouldBeCavokMixin,
 ):
-    """Basic structure for change periods and forecasts in METAR and TAF respectively."""
+    """Basic structure for change periods and forecasts in METAR and TAF respectively.
 
-    def __init__(self, code: Optional[str]) -> None:
+    Args:
+        code (str | None): the code of the change period.
+        offset (int, optional): the offset of the code in its report, to
+            locate the unparsed groups. Defaults to 0.
+    """
+
+    def __init__(self, code: Optional[str], offset: int = 0) -> None:
         super().__init__(code)
-        self._unparsed_groups: List[str] = []
+        self._offset = offset
+        self._unparsed_spans: List[Span] = []
 
         # Initialize mixins
         StringAttributeMixin.__init__(self)
@@ -52,7 +59,13 @@ class Forecast(
     @property
     def unparsed_groups(self) -> List[str]:
         """Get the unparsed groups of the change period."""
-        return self._unparsed_groups
+        return [span.text for span in self._unparsed_spans]
+
+    @property
+    def unparsed_spans(self) -> List[Span]:
+        """Get the unparsed groups of the change period and their offsets
+        in the report."""
+        return self._unparsed_spans
 
     def as_dict(self) -> Dict[str, Any]:
         d: Dict[str, Any] = {
@@ -69,8 +82,8 @@ class Forecast(
 class ChangePeriod(Forecast):
     """Basic structure for change period of trend in METAR."""
 
-    def __init__(self, code: Optional[str], time: datetime) -> None:
-        super().__init__(code)
+    def __init__(self, code: Optional[str], time: datetime, offset: int = 0) -> None:
+        super().__init__(code, offset)
 
         self._time: Time = Time(time=time)
 
@@ -91,37 +104,37 @@ class ChangePeriod(Forecast):
         return self._change_indicator
 
     def _handle_time_period(self, match: re.Match) -> None:
-        old_change_indicator = str(self._change_indicator)
+        # The trend indicator is already in the string, described with its
+        # periods when the string is requested
         self._change_indicator.add_period(match)
-        new_change_indicator = str(self._change_indicator)
-        print(self._change_indicator.period_at)
 
-        self._string = self._string.replace(old_change_indicator, new_change_indicator)
+    _handlers = HandlerTable(
+        (MetarRegExp.CHANGE_INDICATOR, "_handle_trend_indicator"),
+        (MetarRegExp.TREND_TIME_PERIOD, "_handle_time_period"),
+        (MetarRegExp.TREND_TIME_PERIOD, "_handle_time_period"),
+        (MetarRegExp.WIND, "_handle_wind"),
+        (MetarRegExp.VISIBILITY, "_handle_prevailing"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+    )
 
     def _parse(self) -> None:
-        handlers: List[GroupHandler] = [
-            GroupHandler(MetarRegExp.CHANGE_INDICATOR, self._handle_trend_indicator),
-            GroupHandler(MetarRegExp.TREND_TIME_PERIOD, self._handle_time_period),
-            GroupHandler(MetarRegExp.TREND_TIME_PERIOD, self._handle_time_period),
-            GroupHandler(MetarRegExp.WIND, self._handle_wind),
-            GroupHandler(MetarRegExp.VISIBILITY, self._handle_prevailing),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-        ]
-
         sanitized_code = sanitize_visibility(self._code)
-        unparsed: List[str] = parse_section(handlers, sanitized_code)
-        self._unparsed_groups += unparsed
+        self._unparsed_spans += parse_groups(
+            self._handlers, sanitized_code, self._offset, owner=self
+        )
 
 
 class MetarWeatherTrends(GroupList[ChangePeriod]):
     """Basic structure for weather trends sections in METAR."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(2)
 
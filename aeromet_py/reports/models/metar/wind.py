@@ -2,14 +2,23 @@ import re
 
 from typing import Any, Dict, Optional
 
-from ..base import Group, HasConcatenateStringProntocol, Speed, Wind
+from ..base import (
+    Group,
+    HasConcatenateStringProntocol,
+    Speed,
+    Wind,
+    decode_group,
+    null_group,
+)
 
 
 class MetarWind(Wind, Group):
     """Basic structure for wind groups in METAR reports from land stations."""
 
+    __slots__ = ("_code", "_gust")
+
     def __init__(self, match: Optional[re.Match]) -> None:
-        self._gust = Speed(None)
+        self._gust = null_group(Speed)
 
         if match is None:
             super().__init__()
@@ -64,10 +73,10 @@ class MetarWindMixin(HasConcatenateStringProntocol):
     """Mixin to add a METAR wind group attribute to the report."""
 
     def __init__(self) -> None:
-        self._wind = MetarWind(None)
+        self._wind = null_group(MetarWind)
 
     def _handle_wind(self, match: re.Match) -> None:
-        self._wind = MetarWind(match)
+        self._wind = decode_group(MetarWind, match)
 
         self._concatenate_string(self._wind)
 
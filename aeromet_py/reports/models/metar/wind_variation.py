@@ -9,6 +9,8 @@ from ..base import Direction, Group
 class MetarWindVariation(Group):
     """Basic structure for wind variation groups in reports from land stations."""
 
+    __slots__ = ("_code", "_from", "_to")
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
@@ -9,6 +9,8 @@ from .runway_range import set_runway_name
 class MetarWindshearRunway(Group):
     """Basic structure for windshear runways groups in METAR."""
 
+    __slots__ = ("_code", "_all", "_name")
+
     def __init__(self, match: Optional[re.Match]) -> None:
         if match is None:
             super().__init__(None)
@@ -16,10 +18,12 @@ class MetarWindshearRunway(Group):
             self._all = None
             self._name = None
         else:
-            super().__init__(match.string.replace("_", " "))
-
             self._all = match.group("all")
             _name: str = match.group("name")
+
+            # The runways written as RWY25 are coded as R25
+            code = match.string.replace("_", " ")
+            super().__init__(code if _name is None else code.replace("RWY", "R"))
             if _name is None or len(_name) == 2:
                 self._name = _name
             elif len(_name) == 3:
@@ -61,6 +65,8 @@ class MetarWindshearRunway(Group):
 class MetarWindshearList(GroupList[MetarWindshearRunway]):
     """Basic structure for windshear groups in METAR."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(3)
 
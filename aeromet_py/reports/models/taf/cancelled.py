@@ -8,6 +8,8 @@ from ..base import Group
 class Cancelled(Group):
     """Basic structure for cancelled groups in TAF."""
 
+    __slots__ = ("_code", "_is_cancelled")
+
     def __init__(self, match: Optional[re.Match]) -> None:
         self._is_cancelled = False
 
@@ -8,7 +8,7 @@ from ....utils import (
     sanitize_change_indicator,
     sanitize_visibility,
 )
-from ..base import GroupHandler, GroupList, parse_section
+from ..base import GroupList, HandlerTable, parse_groups
 from ..metar import Forecast
 from .change_indicator import TafChangeIndicator
 from .valid import Valid
@@ -17,8 +17,8 @@ from .valid import Valid
 class ChangeForecasted(Forecast):
     """Basic structure for significant change periods in TAF."""
 
-    def __init__(self, code: str, valid: Valid) -> None:
-        super().__init__(code)
+    def __init__(self, code: str, valid: Valid, offset: int = 0) -> None:
+        super().__init__(code, offset)
 
         # Initialize valid period of the forecasts
         self._valid = valid
@@ -30,10 +30,7 @@ class ChangeForecasted(Forecast):
         self._parse()
 
     def __str__(self) -> str:
-        self._string = ""
-        self._concatenate_string(self._change_indicator)
-
-        return self._string
+        return f"{self._change_indicator}\n"
 
     def _handle_change_indicator(self, match: re.Match) -> None:
         self._change_indicator = TafChangeIndicator(match, self._valid)
@@ -46,30 +43,33 @@ class ChangeForecasted(Forecast):
     def _handle_valid_period(self, match: re.Match) -> None:
         self._change_indicator.set_valid_period(match, self._valid.period_from)
 
-    def _parse(self) -> None:
-        handlers: List[GroupHandler] = [
-            GroupHandler(TafRegExp.CHANGE_INDICATOR, self._handle_change_indicator),
-            GroupHandler(TafRegExp.VALID, self._handle_valid_period),
-            GroupHandler(TafRegExp.WIND, self._handle_wind),
-            GroupHandler(MetarRegExp.VISIBILITY, self._handle_prevailing),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-        ]
+    _handlers = HandlerTable(
+        (TafRegExp.CHANGE_INDICATOR, "_handle_change_indicator"),
+        (TafRegExp.VALID, "_handle_valid_period"),
+        (TafRegExp.WIND, "_handle_wind"),
+        (MetarRegExp.VISIBILITY, "_handle_prevailing"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+    )
 
+    def _parse(self) -> None:
         sanitized_code = sanitize_change_indicator(self._code)
         sanitized_code = sanitize_visibility(sanitized_code)
-        unparsed: List[str] = parse_section(handlers, sanitized_code)
-        self._unparsed_groups += unparsed
+        self._unparsed_spans += parse_groups(
+            self._handlers, sanitized_code, self._offset, owner=self
+        )
 
 
 class TafChangesForecasted(GroupList[ChangeForecasted]):
     """Basic structure for weather change periods in TAF."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(8)
 
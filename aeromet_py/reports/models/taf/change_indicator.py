@@ -10,6 +10,8 @@ from .valid import Valid
 class TafChangeIndicator(ChangeIndicator):
     """Basic structure for change indicators in TAF."""
 
+    __slots__ = ("_valid",)
+
     def __init__(self, match: re.Match, taf_valid: Valid) -> None:
         self._valid: Valid = taf_valid
 
@@ -6,6 +6,8 @@ from ..base import Modifier
 class Missing(Modifier):
     """Basic structure for missing TAF."""
 
+    __slots__ = ("_missing",)
+
     def __init__(self, code: Optional[str]) -> None:
         super().__init__(code)
 
@@ -9,6 +9,8 @@ from ..base import Group, GroupList, Temperature, Time
 class TafTemperature(Temperature, Group):
     """Basic structure for temperature groups in TAF."""
 
+    __slots__ = ("_code", "_time")
+
     def __init__(self, match: Optional[re.Match], time: datetime) -> None:
         time = time.replace(minute=0)
 
@@ -59,5 +61,7 @@ class TafTemperature(Temperature, Group):
 class TafTemperatureList(GroupList[TafTemperature]):
     """Basic structure for temperature lists in TAF."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(2)
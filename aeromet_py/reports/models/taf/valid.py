@@ -11,6 +11,8 @@ from ..base import Group, HasConcatenateStringProntocol, Time
 class Valid(Group):
     """Basic structure for valid time groups in change periods and forecasts."""
 
+    __slots__ = ("_code", "_from", "_until")
+
     def __init__(self, code: str, from_: Time, until_: Time) -> None:
         super().__init__(code)
         self._from = from_
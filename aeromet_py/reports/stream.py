@@ -0,0 +1,192 @@
+import asyncio
+
+from collections import deque
+from concurrent.futures import Executor
+from typing import AsyncIterable, AsyncIterator, Deque, List, Optional, Tuple, Union
+
+from .batch import Chunk, ParseResult, ReportClass, _parse_chunk
+from .metar import Metar
+
+
+# The words that start a new report in a feed
+_REPORT_TYPES = ("METAR", "SPECI", "TAF")
+
+
+class _Splitter:
+    """Join the lines of a feed into the codes of its reports.
+
+    A report ends with a `=`, an empty line or the line of the next report,
+    the one starting with its type, so the reports of many lines, as the
+    TAFs, are joined.
+    """
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def push(self, line: str) -> List[str]:
+        """Add a line of the feed, returns the reports it ends."""
+        line = line.strip()
+        if not line:
+            return self._end()
+
+        codes = []
+        if line.split(" ", 1)[0] in _REPORT_TYPES:
+            codes = self._end()
+
+        self._lines.append(line)
+        if line.endswith("="):
+            codes += self._end()
+
+        return codes
+
+    def _end(self) -> List[str]:
+        code = " ".join(self._lines)
+        self._lines = []
+        return [code] if code.strip("= ") else []
+
+    def flush(self) -> List[str]:
+        """Get the last report of the feed, when it's closed."""
+        return self._end()
+
+
+async def _read(
+    lines: AsyncIterable[Union[str, bytes]],
+    queue: "asyncio.Queue[Optional[Tuple[int, str]]]",
+    encoding: str,
+) -> None:
+    """Put the reports of the feed in the queue, and None when it ends.
+
+    None isn't put when the task is cancelled, as nobody reads the queue
+    then, and waiting for a place in a full queue would never end.
+    """
+    splitter = _Splitter()
+    position = 0
+    try:
+        async for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode(encoding, "replace")
+
+            for code in splitter.push(line):
+                await queue.put((position, code))
+                position += 1
+
+        for code in splitter.flush():
+            await queue.put((position, code))
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        await queue.put(None)
+        raise
+
+    await queue.put(None)
+
+
+async def aparse(
+    stream: Union[asyncio.StreamReader, AsyncIterable[Union[str, bytes]]],
+    report_class: ReportClass = Metar,
+    executor: Optional[Executor] = None,
+    batch_size: int = 64,
+    max_pending: int = 4,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+    truncate: bool = False,
+    encoding: str = "utf-8",
+) -> AsyncIterator[ParseResult]:
+    """Parse the reports of a live feed without blocking the event loop.
+
+    The lines of the feed are joined into reports, see below, which are
+    parsed in batches in `executor`. A batch takes the reports already read
+    when the previous one is sent, up to `batch_size`, so a busy feed is
+    parsed in few calls and a quiet one without waiting. At most
+    `max_pending` batches are parsed at a time, then the feed isn't read
+    until the results are consumed.
+
+    A report ends with a `=`, an empty line or the line of the next report,
+    the one starting with METAR, SPECI or TAF. The errors raised while
+    parsing a report are returned in its result instead of being raised.
+
+    Args:
+        stream (StreamReader | AsyncIterable[str | bytes]): the lines of the
+            feed.
+        report_class (Type[Metar] | Type[Taf], optional): the class of the
+            reports. Defaults to `Metar`.
+        executor (Executor | None, optional): the executor where the reports
+            are parsed, a `ProcessPoolExecutor` to parse them in parallel.
+            Defaults to None, the default executor of the loop.
+        batch_size (int, optional): the maximum reports parsed in a call to
+            the executor. Defaults to 64.
+        max_pending (int, optional): the maximum batches being parsed.
+            Defaults to 4.
+        year (int | None, optional): the year of the reports. Defaults to None,
+            the reference time where they are parsed, see `set_reference_time`.
+        month (int | None, optional): the month of the reports. Defaults to None.
+        truncate (bool, optional): the `truncate` option of the reports.
+            Defaults to False.
+        encoding (str, optional): the encoding of the lines given as bytes.
+            Defaults to "utf-8".
+
+    Yields:
+        ParseResult: the result of every report, in the order of the feed.
+
+    Raises:
+        ValueError: if `batch_size` or `max_pending` aren't positive numbers.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be a positive number, got {batch_size}")
+
+    if max_pending <= 0:
+        raise ValueError(f"max_pending must be a positive number, got {max_pending}")
+
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Optional[Tuple[int, str]]]" = asyncio.Queue(batch_size)
+    reader = asyncio.ensure_future(_read(stream, queue, encoding))
+    pending: Deque["asyncio.Future[List[ParseResult]]"] = deque()
+    ended = False
+
+    def submit(chunk: Chunk) -> None:
+        pending.append(
+            loop.run_in_executor(
+                executor, _parse_chunk, report_class, chunk, year, month, truncate, None
+            )
+        )
+
+    try:
+        while True:
+            # Send the reports already read, waiting for one only if there
+            # isn't any batch to wait for
+            while not ended and len(pending) < max_pending:
+                chunk: Chunk = []
+                if not pending:
+                    item = await queue.get()
+                    if item is None:
+                        ended = True
+                    else:
+                        chunk.append(item)
+
+                while not ended and len(chunk) < batch_size and not queue.empty():
+                    item = queue.get_nowait()
+                    if item is None:
+                        ended = True
+                    else:
+                        chunk.append(item)
+
+                if not chunk:
+                    break
+
+                submit(chunk)
+
+            if not pending:
+                break
+
+            for result in await pending.popleft():
+                yield result
+
+        # Raise the errors reading the feed
+        await reader
+    finally:
+        reader.cancel()
+        for future in pending:
+            future.cancel()
+
+        # Wait for the reader to stop, so it isn't left pending in the loop
+        await asyncio.gather(reader, return_exceptions=True)
@@ -1,22 +1,27 @@
 import re
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..utils import (
     MetarRegExp,
+    Span,
     TafRegExp,
     sanitize_change_indicator,
     sanitize_visibility,
-    split_sentence,
+    split_sections,
 )
 from .models import (
     FlightRulesMixin,
-    GroupHandler,
+    HandlerTable,
     ModifierMixin,
-    ParserError,
+    PendingGroups,
     Report,
     Time,
-    parse_section,
+    ValidationResult,
+    key_codes,
+    normalize_code,
+    null_group,
+    parse_groups,
 )
 from .models.metar import (
     MetarCloudMixin,
@@ -47,10 +52,12 @@ class Taf(
         year: Optional[int] = None,
         month: Optional[int] = None,
         truncate: bool = False,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
     ) -> None:
-        super().__init__(code, truncate=truncate, type="TAF")
+        super().__init__(code, truncate=truncate, type="TAF", lazy=lazy, fields=fields)
         self._body: str = ""
-        self._changes_codes: List[str] = []
+        self._changes_spans: List[Span] = []
         self._year = year
         self._month = month
 
@@ -67,8 +74,8 @@ class Taf(
         ShouldBeCavokMixin.__init__(self)
 
         # Body groups
-        self._missing = Missing(None)
-        self._cancelled = Cancelled(None)
+        self._missing = null_group(Missing)
+        self._cancelled = null_group(Cancelled)
         self._max_temperatures = TafTemperatureList()
         self._min_temperatures = TafTemperatureList()
 
@@ -79,7 +86,7 @@ class Taf(
         self._parse_body()
 
         # Parse the change periods
-        self._parse_changes_forecasted()
+        self._parse_changes()
 
     @property
     def body(self) -> str:
@@ -136,77 +143,97 @@ class Taf(
         """Get the minimum temperatures expected to happen."""
         return self._min_temperatures
 
-    def _handle_change_forecasted(self, code: str) -> None:
-        cf: ChangeForecasted = ChangeForecasted(code, self._valid)
+    def _handle_change_forecasted(self, code: str, offset: int = 0) -> None:
+        cf: ChangeForecasted = ChangeForecasted(code, self._valid, offset)
         self._changes_forecasted.add(cf)
 
-        self._concatenate_string(cf)
+        # The period of a FM change is cut by the next FM or BECMG change,
+        # the report describes the period as it's given
+        self._concatenate_string(str(cf))
 
     @property
     def changes_forecasted(self) -> TafChangesForecasted:
         """Get the weather change periods data of the TAF if provided."""
         return self._changes_forecasted
 
+    _handler_fields = dict(
+        Report._handler_fields,
+        _handle_modifier=("_modifier",),
+        _handle_missing=("_missing",),
+        _handle_valid_period=("_valid",),
+        _handle_cancelled=("_cancelled",),
+        _handle_wind=("_wind",),
+        _handle_prevailing=("_prevailing",),
+        _handle_weather=("_weathers",),
+        _handle_cloud=("_clouds",),
+        _handle_temperature=("_max_temperatures", "_min_temperatures"),
+        _parse_changes_forecasted=("_changes_forecasted",),
+    )
+
+    _field_attributes = dict(
+        Report._field_attributes,
+        prevailing_visibility=("_prevailing",),
+        flight_rules=("_prevailing", "_clouds"),
+        should_be_cavok=("_prevailing", "_weathers", "_clouds"),
+        valid=("_valid", "_time"),
+        max_temperatures=("_max_temperatures", "_time"),
+        min_temperatures=("_min_temperatures", "_time"),
+        changes_forecasted=("_changes_forecasted", "_valid", "_time"),
+    )
+
+    _changes_parser = "_parse_changes_forecasted"
+
+    _body_handlers = HandlerTable(
+        (MetarRegExp.TYPE, "_handle_type"),
+        (TafRegExp.AMD_COR, "_handle_modifier"),
+        (MetarRegExp.STATION, "_handle_station"),
+        (MetarRegExp.TIME, "_handle_time"),
+        (TafRegExp.NIL, "_handle_missing"),
+        (TafRegExp.VALID, "_handle_valid_period"),
+        (TafRegExp.CANCELLED, "_handle_cancelled"),
+        (TafRegExp.WIND, "_handle_wind"),
+        (TafRegExp.VISIBILITY, "_handle_prevailing"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.WEATHER, "_handle_weather"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (MetarRegExp.CLOUD, "_handle_cloud"),
+        (TafRegExp.TEMPERATURE, "_handle_temperature"),
+        (TafRegExp.TEMPERATURE, "_handle_temperature"),
+        (TafRegExp.TEMPERATURE, "_handle_temperature"),
+        (TafRegExp.TEMPERATURE, "_handle_temperature"),
+    )
+
     def _parse_body(self) -> None:
         """Parse the body groups."""
-        handlers: List[GroupHandler] = [
-            GroupHandler(MetarRegExp.TYPE, self._handle_type),
-            GroupHandler(TafRegExp.AMD_COR, self._handle_modifier),
-            GroupHandler(MetarRegExp.STATION, self._handle_station),
-            GroupHandler(MetarRegExp.TIME, self._handle_time),
-            GroupHandler(TafRegExp.NIL, self._handle_missing),
-            GroupHandler(TafRegExp.VALID, self._handle_valid_period),
-            GroupHandler(TafRegExp.CANCELLED, self._handle_cancelled),
-            GroupHandler(TafRegExp.WIND, self._handle_wind),
-            GroupHandler(TafRegExp.VISIBILITY, self._handle_prevailing),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.WEATHER, self._handle_weather),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(MetarRegExp.CLOUD, self._handle_cloud),
-            GroupHandler(TafRegExp.TEMPERATURE, self._handle_temperature),
-            GroupHandler(TafRegExp.TEMPERATURE, self._handle_temperature),
-            GroupHandler(TafRegExp.TEMPERATURE, self._handle_temperature),
-            GroupHandler(TafRegExp.TEMPERATURE, self._handle_temperature),
-        ]
-
         sanitized_body: str = sanitize_visibility(self._body)
-        unparsed: List[str] = parse_section(handlers, sanitized_body)
-        self._unparsed_groups += unparsed
+        self._parse_groups(self._body_handlers, sanitized_body)
 
     def _parse_changes_forecasted(self) -> None:
-        for change in self._changes_codes:
-            if change != "":
-                self._handle_change_forecasted(change)
+        for change in self._changes_spans:
+            if change.text != "":
+                self._handle_change_forecasted(change.text, change.start)
 
         for cp in self._changes_forecasted:
-            self._unparsed_groups += cp.unparsed_groups
-
-        if self.unparsed_groups and self._truncate:
-            raise ParserError(
-                "failed while processing {} from: {}".format(
-                    ", ".join(self.unparsed_groups),
-                    self.raw_code,
-                )
-            )
+            self._unparsed_spans += cp.unparsed_spans
+
+        self._raise_unparsed()
+
+    def _unparsed_changes(self) -> List[Span]:
+        return _match_changes_forecasted(self._changes_spans)
 
     def _handle_sections(self) -> None:
-        keywords: List[str] = ["FM", "TEMPO", "BECMG", "PROB"]
-        sanitized_code: str = sanitize_change_indicator(self._raw_code)
-        if sanitized_code.startswith("TAF"):
-            sanitized_code = sanitized_code.replace("TAF ", "TAF_")
-        sections: List[str] = split_sentence(sanitized_code, keywords, space="left")
-        sections[0] = sections[0].replace("TAF_", "TAF ")
-
-        self._body = sections[0]
+        sections = _split_taf(self._raw_code)
+
+        self._body = sections[0].text.replace("TAF_", "TAF ")
         if len(sections) > 1:
-            self._changes_codes = [section for section in sections[1:]]
+            self._changes_spans = sections[1:]
 
         self._sections = [
             self._body,
-            " ".join(change.replace("_", " ") for change in self._changes_codes),
+            " ".join(change.text.replace("_", " ") for change in self._changes_spans),
         ]
 
     def as_dict(self) -> Dict[str, Any]:
@@ -227,3 +254,59 @@ class Taf(
             }
         )
         return d
+
+
+def _split_taf(raw_code: str) -> List[Span]:
+    """Split the TAF in its body and its change periods, with the change
+    indicators sanitized."""
+    keywords: List[str] = ["FM", "TEMPO", "BECMG", "PROB"]
+    sanitized_code: str = sanitize_change_indicator(raw_code)
+    if sanitized_code.startswith("TAF"):
+        sanitized_code = sanitized_code.replace("TAF ", "TAF_")
+
+    return split_sections(sanitized_code, keywords, space="left")
+
+
+def _match_changes_forecasted(changes: List[Span]) -> List[Span]:
+    """Get the unparsed groups of the change periods without decoding them."""
+    unparsed: List[Span] = []
+    for change in changes:
+        # The change indicators were sanitized to split the sections
+        if change.text != "":
+            unparsed += parse_groups(
+                ChangeForecasted._handlers,
+                sanitize_visibility(change.text),
+                change.start,
+                pending=[],
+            )
+
+    return unparsed
+
+
+def validate_taf(code: str) -> ValidationResult:
+    """Find the unparsed groups of a TAF without decoding its groups.
+
+    The report is splitted and its groups matched the same way `Taf` does,
+    but no handler is called, so it's a lot faster when only the unparsed
+    groups and the key of the report are needed.
+
+    Args:
+        code (str): the TAF code.
+
+    Returns:
+        ValidationResult: the raw code, the station and time codes and the
+        unparsed groups of the report.
+    """
+    raw_code = normalize_code(code)
+    sections = _split_taf(raw_code)
+
+    body = sections[0].text.replace("TAF_", "TAF ")
+    pending: PendingGroups = []
+    unparsed = parse_groups(
+        Taf._body_handlers, sanitize_visibility(body), pending=pending
+    )
+
+    unparsed += _match_changes_forecasted(sections[1:])
+
+    station, time = key_codes(pending)
+    return ValidationResult(raw_code, station, time, unparsed)
@@ -1,5 +1,6 @@
 from .conversions import Conversions
 from .metar_regexp import MetarRegExp
 from .parser import sanitize_change_indicator, sanitize_visibility, sanitize_windshear
-from .split import split_sentence
+from .patterns import PatternGuard, compile_pattern, get_guard
+from .split import Span, highlight, relocate, split_sections, split_sentence
 from .taf_regexp import TafRegExp
@@ -74,7 +74,7 @@ class MetarRegExp:
         r"(?P<other>PO|SQ|FC|SS|DS)?$"
     )
 
-    WINDSHEAR = r"^WS(?P<all>_ALL)?" r"_(RWY|R(?P<name>\d{2}[RCL]?))$"
+    WINDSHEAR = r"^WS(?P<all>_ALL)?" r"_(RWY|R(?:WY)?(?P<name>\d{2}[RCL]?))$"
 
     SEA_STATE = (
         r"^W(?P<sign>M)?"
@@ -2,51 +2,83 @@ import re
 
 from typing import List
 
+from .patterns import compile_pattern
+
+
+_VISIBILITY = compile_pattern(r"\s(?P<int>\d+)\s(?P<frac>\d/\dSM)\s?")
+_VISIBILITY_TAIL = compile_pattern(r"(?P<int>\d+)\s(?P<frac>\d/\dSM)\s?")
+_WINDSHEAR = compile_pattern(r"WS\s(?:(?P<all>ALL\sRWY)|R(WY)?(?P<name>\d{2}[CLR]?))")
+_CHANGE_INDICATOR = compile_pattern(r"PROB(?P<percent>[34]0)\sTEMPO")
+
 
 def sanitize_visibility(report: str) -> str:
     """Sanitize the visibility in sea miles to get macth
     with the regular expresion of visibility in METAR like
     reports.
 
+    Up to three groups are joined in one scan of the report. The space
+    between the integer and the fraction is replaced by an underscore, so
+    the sanitized report keeps the offsets of the original one.
+
     Args:
         report (str): the report or section to sanitize.
 
     Returns:
         str: the sanitized report or section.
     """
-    regex = r"\s(?P<int>\d+)\s(?P<frac>\d/\dSM)\s?"
+    match = _VISIBILITY.search(report)
+    if match is None:
+        return report
 
-    for _ in range(3):
-        match = re.search(regex, report)
+    pieces: List[str] = []
+    position = 0
 
-        try:
-            report = re.sub(regex, " {}_{} ".format(*match.groups()), report, count=1)
-        except AttributeError:
+    for _ in range(3):
+        if match is None:
             break
 
-    return report
+        space = match.start("frac") - 1
+        pieces.append(report[position:space])
+        pieces.append("_")
+        position = space + 1
+
+        end = match.end()
+        match = _VISIBILITY_TAIL.match(report, end)
+        if match is None:
+            match = _VISIBILITY.search(report, end)
+
+    pieces.append(report[position:])
+    return "".join(pieces)
 
 
 def sanitize_windshear(report: str) -> str:
     """Sanitize the windshear in to get macth with the
     regular expresion of windshear in METAR like reports.
 
+    All the `WS ALL RWY` groups and up to three runway groups are joined in
+    one scan of the report. Only the spaces are replaced, so the sanitized
+    report keeps the offsets of the original one.
+
     Args:
         report (str): the report or section to sanitize.
 
     Returns:
         str: the sanitized report or section.
     """
-    report = re.sub(r"WS\sALL\sRWY", "WS_ALL_RWY", report)
+    runways = 0
 
-    fmt = r"WS\sR(WY)?(?P<name>\d{2}[CLR]?)"
-    pattern = re.compile(fmt)
-    for _ in range(3):
-        match = pattern.search(report)
-        if match:
-            report = re.sub(fmt, "WS_R{}".format(match.group("name")), report, count=1)
+    def replace(match: re.Match) -> str:
+        nonlocal runways
+
+        group: str = match.group()
+        if not match.group("all"):
+            runways += 1
+            if runways > 3:
+                return group
 
-    return report
+        return group.replace(" ", "_")
+
+    return _WINDSHEAR.sub(replace, report)
 
 
 def sanitize_change_indicator(report: str) -> str:
@@ -59,15 +91,4 @@ def sanitize_change_indicator(report: str) -> str:
     Returns:
         str: the sanitized report or section.
     """
-    fmt = r"PROB(?P<percent>[34]0)\sTEMPO"
-    pattern = re.compile(fmt)
-    for _ in range(5):
-        match = pattern.search(report)
-        if match:
-            report = re.sub(
-                fmt, "PROB{}_TEMPO".format(match.group("percent")), report, count=1
-            )
-        else:
-            break
-
-    return report
+    return _CHANGE_INDICATOR.sub(r"PROB\g<percent>_TEMPO", report, count=5)
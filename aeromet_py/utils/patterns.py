@@ -0,0 +1,139 @@
+import re
+
+from typing import Dict, NamedTuple, Optional, Pattern, Union
+
+from .metar_regexp import MetarRegExp
+from .taf_regexp import TafRegExp
+
+
+def compile_pattern(regexp: Union[str, Pattern[str]]) -> Pattern[str]:
+    """Get the compiled regular expression of `regexp` from the registry,
+    compiling it the first time it is requested.
+
+    Unlike `re.compile`, the registry has no size limit, so the patterns of
+    the parsers are never evicted by other regular expressions of the program.
+
+    Args:
+        regexp (str | Pattern[str]): the regular expression.
+
+    Returns:
+        Pattern[str]: the compiled regular expression.
+    """
+    try:
+        return _PATTERNS[regexp]  # type: ignore
+    except KeyError:
+        pass
+
+    if isinstance(regexp, str):
+        return _PATTERNS.setdefault(regexp, re.compile(regexp))
+
+    return regexp
+
+
+class PatternGuard(NamedTuple):
+    """Cheap conditions that every token matched by a pattern meets.
+
+    A guard must be conservative: it may accept tokens the pattern doesn't
+    match, but never reject a token the pattern matches.
+
+    Args:
+        first (str | None): the characters a non-empty token may start with,
+            None for any character.
+        last (str | None): the characters a non-empty token may end with,
+            None for any character.
+        min_length (int): the minimum length of the token.
+        max_length (int | None): the maximum length of the token, None for
+            no limit.
+    """
+
+    first: Optional[str] = None
+    last: Optional[str] = None
+    min_length: int = 0
+    max_length: Optional[int] = None
+
+    def accepts(self, token: str) -> bool:
+        """Returns False if the pattern can't match the token."""
+        length = len(token)
+        if length < self.min_length:
+            return False
+
+        if self.max_length is not None and length > self.max_length:
+            return False
+
+        if length == 0:
+            return True
+
+        if self.first is not None and token[0] not in self.first:
+            return False
+
+        if self.last is not None and token[-1] not in self.last:
+            return False
+
+        return True
+
+
+def get_guard(regexp: Union[str, Pattern[str]]) -> Optional[PatternGuard]:
+    """Get the guard of the pattern, None if the pattern has no guard and
+    must be tried with every token.
+
+    Args:
+        regexp (str | Pattern[str]): the regular expression.
+
+    Returns:
+        PatternGuard | None: the guard of the pattern.
+    """
+    if not isinstance(regexp, str):
+        regexp = regexp.pattern
+
+    return _GUARDS.get(regexp, None)
+
+
+def _register(cls: type) -> None:
+    """Compile all the regular expressions defined as attributes of `cls`."""
+    for name, value in vars(cls).items():
+        if name.isupper() and isinstance(value, str):
+            compile_pattern(value)
+
+
+# Registry of the compiled regular expressions by pattern string
+_PATTERNS: Dict[str, Pattern[str]] = {}
+
+_register(MetarRegExp)
+_register(TafRegExp)
+
+_DIGITS = "0123456789"
+_UPPERCASE = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Guards of the patterns of the parsers. The patterns that end with `$` match
+# the whole token, so their length limits and last characters are exact;
+# the ones without it match a prefix of the token and only have a minimum.
+_GUARDS: Dict[str, PatternGuard] = {
+    MetarRegExp.TYPE: PatternGuard("MST", "RIF", 3, 5),
+    MetarRegExp.STATION: PatternGuard(_UPPERCASE, None, 4, 4),
+    MetarRegExp.TIME: PatternGuard("0123", "Z", 7, 7),
+    MetarRegExp.MODIFIER: PatternGuard("CANTF", None, 3, 4),
+    MetarRegExp.WIND: PatternGuard("0123/V", "TS", 7, 15),
+    MetarRegExp.WIND_VARIATION: PatternGuard("0123", None, 7, 7),
+    MetarRegExp.VISIBILITY: PatternGuard(_DIGITS + "/MP_SKUC", None, 1, 9),
+    MetarRegExp.MINIMUM_VISIBILITY: PatternGuard(_DIGITS + "/", None, 4, 6),
+    MetarRegExp.RUNWAY_RANGE: PatternGuard("R", None, 6, 19),
+    MetarRegExp.WEATHER: PatternGuard("-+VMPBDSTFRGIUHN/", None, 0, 8),
+    MetarRegExp.CLOUD: PatternGuard("VCSNBFO0/", None, 2, 9),
+    MetarRegExp.TEMPERATURES: PatternGuard(_DIGITS + "M-/X", None, 5, 7),
+    MetarRegExp.PRESSURE: PatternGuard(_DIGITS + "AQ/", None, 4, 10),
+    MetarRegExp.RECENT_WEATHER: PatternGuard("R", None, 2, 10),
+    MetarRegExp.WINDSHEAR: PatternGuard("W", None, 6, 13),
+    MetarRegExp.SEA_STATE: PatternGuard("W", None, 6, 9),
+    MetarRegExp.RUNWAY_STATE: PatternGuard("R", None, 8, 11),
+    MetarRegExp.CHANGE_INDICATOR: PatternGuard("TBN", None, 5),
+    MetarRegExp.TREND_TIME_PERIOD: PatternGuard("FTA", None, 6, 6),
+    MetarRegExp.REMARK: PatternGuard("R", None, 3, 4),
+    TafRegExp.AMD_COR: PatternGuard("CA", None, 3, 3),
+    TafRegExp.NIL: PatternGuard("N", None, 3, 3),
+    TafRegExp.VALID: PatternGuard("0123", None, 9, 9),
+    TafRegExp.CANCELLED: PatternGuard("C", None, 3, 3),
+    TafRegExp.WIND: PatternGuard("0123V", "TS", 7, 15),
+    TafRegExp.VISIBILITY: PatternGuard(_DIGITS + "MP_SKUC", None, 1),
+    TafRegExp.TEMPERATURE: PatternGuard("T", None, 10),
+    TafRegExp.CHANGE_INDICATOR: PatternGuard("TBFP", None, 5),
+}
@@ -1,22 +1,106 @@
 import re
 
-from typing import List
+from bisect import bisect_right
+from typing import Dict, Iterable, List, NamedTuple, Pattern, Sequence, Tuple
 
+from .patterns import compile_pattern
 
-def _add_space_left(word: str) -> str:
-    """Add space to the left of word."""
-    return " " + word
 
+class Span(NamedTuple):
+    """A piece of a sentence and its offsets, `text == sentence[start:end]`."""
 
-def _add_space_right(word: str) -> str:
-    """Add space to the right of word."""
-    return word + " "
+    text: str
+    start: int
+    end: int
 
 
-def _add_space_both(word: str) -> str:
-    """Add space to the left and right of words."""
-    word = _add_space_left(word)
-    return _add_space_right(word)
+# Regular expressions of the keywords by the position of the spaces
+_FORMATS: Dict[str, str] = {
+    "": "(?P<keyword>{})",
+    "left": " (?P<keyword>{})",
+    "right": "(?P<keyword>{}) ",
+    "both": " (?P<keyword>{})(?= )",
+}
+
+
+# Regular expressions of the keywords by the keywords and the spaces
+_PATTERNS: Dict[Tuple[Tuple[str, ...], str], Pattern[str]] = {}
+
+
+def _keywords_pattern(keywords: Tuple[str, ...], space: str) -> Pattern[str]:
+    """Get the regular expression that finds any of the keywords."""
+    try:
+        return _PATTERNS[(keywords, space)]
+    except KeyError:
+        pass
+
+    try:
+        fmt = _FORMATS[space]
+    except KeyError:
+        fmt = _FORMATS[""]
+
+    alternation = "|".join(re.escape(kw) for kw in keywords)
+    pattern = compile_pattern(fmt.format(alternation))
+    return _PATTERNS.setdefault((keywords, space), pattern)
+
+
+def split_sections(
+    sentence: str, keywords: Sequence[str], count: int = 0, space: str = ""
+) -> List[Span]:
+    """Split the `sentence` before every one of the `keywords`, in one scan.
+
+    The sentence is split where the keywords are found as given by `space`,
+    the space to the left of the keyword is dropped and the keyword starts
+    the next section.
+
+    Args:
+        sentence (str): the sentence to split.
+        keywords (Sequence[str]): the words where the sentence will be splitted.
+        count (int, optional): Number of splits of every keyword, 0 to split
+            on all of them. Defaults to 0.
+        space (str, optional): the spaces required around every keyword.
+            Defaults to ''. Options: `left`, `right`, `both`
+
+    Returns:
+        List[Span]: the sections of the sentence, with their offsets in it.
+    """
+    if not keywords:
+        return [Span(sentence, 0, len(sentence))]
+
+    pattern = _keywords_pattern(tuple(keywords), space)
+    # The space to the left of the keyword isn't part of any section, the one
+    # to the right is matched too with `right` and must be put back
+    lead = 1 if space in ("left", "both") else 0
+    trail = " " if space == "right" else ""
+
+    if count <= 0:
+        # The pieces alternate the text between keywords and the keywords
+        pieces = pattern.split(sentence)
+        spans = [Span(pieces[0], 0, len(pieces[0]))]
+        end = len(pieces[0])
+        for i in range(1, len(pieces), 2):
+            start = end + lead
+            text = pieces[i] + trail + pieces[i + 1]
+            end = start + len(text)
+            spans.append(Span(text, start, end))
+
+        return spans
+
+    counts: Dict[str, int] = {}
+    spans = []
+    start = 0
+    for match in pattern.finditer(sentence):
+        keyword = match.group("keyword")
+        found = counts.get(keyword, 0)
+        if found >= count:
+            continue
+
+        counts[keyword] = found + 1
+        spans.append(Span(sentence[start : match.start()], start, match.start()))
+        start = match.start() + lead
+
+    spans.append(Span(sentence[start:], start, len(sentence)))
+    return spans
 
 
 def split_sentence(
@@ -35,21 +119,53 @@ def split_sentence(
     Returns:
         List[str, str]: the list of sentence splitted from the original.
     """
-    for kw in keywords:
-        if space == "left":
-            kw = _add_space_left(kw)
-        elif space == "right":
-            kw = _add_space_right(kw)
-        elif space == "both":
-            kw = _add_space_both(kw)
-        else:
-            pass
-
-        pattern = re.compile(kw)
-        sentence = re.sub(
-            pattern,
-            "|" + kw.lstrip(),
-            sentence,
-            count=count,
-        )
-    return sentence.split("|")
+    if count <= 0 and keywords:
+        pieces = _keywords_pattern(tuple(keywords), space).split(sentence)
+        trail = " " if space == "right" else ""
+        return pieces[:1] + [k + trail + t for k, t in zip(pieces[1::2], pieces[2::2])]
+
+    return [span.text for span in split_sections(sentence, keywords, count, space)]
+
+
+def relocate(spans: Iterable[Span], pieces: Sequence[Span]) -> List[Span]:
+    """Move the spans of a text made of `pieces` joined by spaces to the
+    offsets of the pieces in their own sentence.
+
+    Args:
+        spans (Iterable[Span]): the spans with offsets in the joined text.
+        pieces (Sequence[Span]): the pieces of the joined text, in order.
+
+    Returns:
+        List[Span]: the spans with offsets in the sentence of the pieces.
+    """
+    starts: List[int] = []
+    position = 0
+    for piece in pieces:
+        starts.append(position)
+        position += len(piece.text) + 1
+
+    relocated: List[Span] = []
+    for span in spans:
+        i = max(bisect_right(starts, span.start) - 1, 0)
+        shift = pieces[i].start - starts[i] if pieces else 0
+        relocated.append(Span(span.text, span.start + shift, span.end + shift))
+
+    return relocated
+
+
+def highlight(sentence: str, spans: Iterable[Span], marker: str = "^") -> str:
+    """Mark the spans of the sentence in a line below it.
+
+    Args:
+        sentence (str): the sentence of the spans.
+        spans (Iterable[Span]): the spans to mark.
+        marker (str, optional): the character used to mark. Defaults to '^'.
+
+    Returns:
+        str: the sentence and the line of markers, without trailing spaces.
+    """
+    line = [" "] * len(sentence)
+    for span in spans:
+        line[span.start : span.end] = [marker] * (span.end - span.start)
+
+    return "{}\n{}".format(sentence, "".join(line).rstrip())
@@ -0,0 +1,72 @@
+"""Benchmark of parsing a live feed in an asyncio service.
+
+Parses the reports of an async feed with a call to `run_in_executor` per
+report, as hand-rolled in asyncio services, and with `aparse` and batches of
+several sizes, in the default executor of the loop, and prints the
+throughput of every way.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.async_stream [--reports N]
+"""
+import argparse
+import asyncio
+import time
+
+from typing import AsyncIterator, List
+
+from aeromet_py import Metar, aparse
+
+from .parse_allocations import METARS
+
+
+async def feed(codes: List[str]) -> AsyncIterator[str]:
+    for code in codes:
+        yield code + "=\n"
+
+
+async def per_report(codes: List[str]) -> int:
+    loop = asyncio.get_running_loop()
+    count = 0
+    async for line in feed(codes):
+        await loop.run_in_executor(None, Metar, line)
+        count += 1
+
+    return count
+
+
+async def batched(codes: List[str], batch_size: int) -> int:
+    count = 0
+    async for result in aparse(feed(codes), batch_size=batch_size):
+        assert result.ok, result.error
+        count += 1
+
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=20_000)
+    args = parser.parse_args()
+
+    codes = METARS * (args.reports // len(METARS))
+    runs = [("run_in_executor", lambda: per_report(codes))]
+    for batch_size in (1, 16, 64, 256):
+        runs.append(
+            (f"aparse batch {batch_size}", lambda b=batch_size: batched(codes, b))
+        )
+
+    baseline = None
+    for name, run in runs:
+        start = time.perf_counter()
+        count = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"{name:16s}: {count / elapsed:7.0f} reports/s, "
+            f"{baseline / elapsed:4.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
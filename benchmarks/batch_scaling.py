@@ -0,0 +1,52 @@
+"""Benchmark of the scaling of the batch parsing with the number of workers.
+
+Parses the same METARs with `parse_metars` in the calling process and with
+pools of 2, 4, 8 and 16 worker processes, reading every group of the
+reports as a caller does, and prints the throughput, the speedup against
+the calling process and the CPU time of the calling process per report, the
+bound of the throughput with enough CPUs. The speedup is bounded by the number of
+CPUs of the machine.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.batch_scaling [--reports N] [--chunksize N]
+"""
+import argparse
+import os
+import time
+
+from aeromet_py import parse_metars
+
+from .parse_allocations import METARS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=50_000)
+    parser.add_argument("--chunksize", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    codes = METARS * (args.reports // len(METARS))
+    print(f"{len(codes)} reports, {os.cpu_count()} CPUs")
+
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        for result in parse_metars(codes, workers, args.chunksize):
+            assert result.ok, result.error
+            result.report.as_dict()  # type: ignore
+
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+        baseline = baseline or elapsed
+        print(
+            f"{workers:2d} workers: {len(codes) / elapsed:8.0f} reports/s, "
+            f"{baseline / elapsed:4.2f}x, "
+            f"caller {cpu / len(codes) * 1e6:6.1f} us/report"
+        )
+
+
+if __name__ == "__main__":
+    main()
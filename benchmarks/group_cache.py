@@ -0,0 +1,159 @@
+"""Benchmark of the memoization of the decoded groups.
+
+Decodes the recurring groups (CAVOK, 9999, FEW020, Q1013, -RA...) with and
+without a group cache, and parses METARs generated with a realistic
+distribution of the groups, where those groups are most of the traffic, with
+the group cache disabled and enabled, and prints the hit rate of the cache.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.group_cache [--reports N] [--maxsize N]
+"""
+import argparse
+import random
+import time
+import timeit
+
+from typing import Any, Callable, List, Sequence, Tuple
+
+from aeromet_py import Metar, get_group_cache, set_group_cache
+from aeromet_py.reports.models import (
+    Cloud,
+    GroupCache,
+    MetarPressure,
+    MetarPrevailingVisibility,
+    MetarWeather,
+    MetarWind,
+)
+from aeromet_py.utils import MetarRegExp, compile_pattern
+
+
+# The groups of every kind and their weights, the most common first
+WINDS = [("VRB02KT", 8), ("00000KT", 6), ("09010KT", 4), ("27015G25KT", 1)]
+VISIBILITIES = [("CAVOK", 10), ("9999", 30), ("8000", 4), ("3000", 1)]
+WEATHERS = [("", 40), ("-RA", 6), ("BR", 4), ("RA", 2), ("-SHRA", 2), ("TSRA", 1)]
+CLOUDS = [
+    ("FEW020", 10),
+    ("SCT025", 6),
+    ("BKN015CB", 4),
+    ("BKN030", 4),
+    ("OVC008", 2),
+    ("FEW015TCU", 1),
+]
+PRESSURES = [("Q1013", 10), ("Q1015", 8), ("Q1009", 6), ("A2992", 4), ("Q1021", 2)]
+
+
+def choose(items: Sequence[Tuple[str, int]], rng: random.Random) -> str:
+    return rng.choices([i for i, _ in items], [w for _, w in items])[0]
+
+
+def generate(n: int, seed: int = 0) -> List[str]:
+    """Generate `n` METARs of a few stations with recurring groups."""
+    rng = random.Random(seed)
+    stations = ["MROC", "SKBO", "LEMD", "EGLL", "KJFK", "SCFA", "UUWW", "RJTT"]
+    codes = []
+    for _ in range(n):
+        visibility = choose(VISIBILITIES, rng)
+        groups = [
+            "METAR",
+            rng.choice(stations),
+            "{:02d}{:02d}{:02d}Z".format(
+                rng.randint(1, 28), rng.randint(0, 23), rng.choice([0, 30])
+            ),
+            choose(WINDS, rng),
+            visibility,
+        ]
+        if visibility != "CAVOK":
+            groups.append(choose(WEATHERS, rng))
+            groups += sorted({choose(CLOUDS, rng) for _ in range(rng.randint(1, 3))})
+
+        temperature = rng.randint(5, 30)
+        groups.append(
+            "{:02d}/{:02d}".format(temperature, temperature - rng.randint(0, 8))
+        )
+        groups.append(choose(PRESSURES, rng))
+        groups.append("NOSIG")
+        codes.append(" ".join(group for group in groups if group))
+
+    return codes
+
+
+GROUPS: List[Tuple[Callable[[Any], Any], str, List[Tuple[str, int]]]] = [
+    (MetarWind, MetarRegExp.WIND, WINDS),
+    (MetarPrevailingVisibility, MetarRegExp.VISIBILITY, VISIBILITIES),
+    (MetarWeather, MetarRegExp.WEATHER, WEATHERS[1:]),
+    (Cloud.from_metar, MetarRegExp.CLOUD, CLOUDS),
+    (MetarPressure, MetarRegExp.PRESSURE, PRESSURES),
+]
+
+
+def decode_groups() -> Tuple[float, float]:
+    """Get the time to decode every recurring group without and with a
+    group cache, in microseconds per group."""
+    matches = []
+    for factory, regexp, items in GROUPS:
+        pattern = compile_pattern(regexp)
+        matches += [(factory, pattern.match(code)) for code, _ in items]
+
+    cache = GroupCache()
+    number = 2000
+    times = []
+    for decode in (lambda f, m: f(m), cache.decode):
+        elapsed = min(
+            timeit.repeat(
+                lambda: [decode(f, m) for f, m in matches], number=number, repeat=5
+            )
+        )
+        times.append(elapsed / number / len(matches) * 1e6)
+
+    return times[0], times[1]
+
+
+def parse_all(codes: List[str]) -> float:
+    start = time.perf_counter()
+    for code in codes:
+        Metar(code)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=20_000)
+    parser.add_argument("--maxsize", type=int, default=1024)
+    args = parser.parse_args()
+
+    uncached, cached = decode_groups()
+    print(
+        f"decode group: {uncached:5.2f} us without cache, "
+        f"{cached:5.2f} us with cache, {uncached / cached:4.1f}x"
+    )
+
+    codes = generate(args.reports)
+    parse_all(codes[:1000])  # warm up caches
+
+    set_group_cache(None)
+    disabled = min(parse_all(codes) for _ in range(3))
+
+    enabled = float("inf")
+    for _ in range(3):
+        set_group_cache(args.maxsize)
+        enabled = min(enabled, parse_all(codes))
+
+    info = get_group_cache().info()  # type: ignore
+    set_group_cache(None)
+
+    for name, elapsed in (("disabled", disabled), ("enabled", enabled)):
+        print(
+            f"group cache {name:8s}: {elapsed / len(codes) * 1e6:6.1f} us/report, "
+            f"{disabled / elapsed:4.2f}x"
+        )
+    print(
+        f"hits: {info.hits}, misses: {info.misses}, "
+        f"hit rate: {info.hits / (info.hits + info.misses):.1%}, "
+        f"size: {info.currsize}/{info.maxsize}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark of the cost of importing the package.
+
+Measures, in fresh interpreters with warm bytecode caches, the wall time of
+`import aeromet_py`, the memory allocated by the import and the peak RSS of
+the process after the import and after parsing a first report.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.import_cost
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from statistics import median
+from typing import Dict
+
+
+TIMING = """
+import json, resource, time
+start = time.perf_counter()
+import aeromet_py
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+aeromet_py.Metar("METAR MROC 161900Z 09014KT CAVOK 29/16 A2999")
+rss_report = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps([elapsed, rss, rss_report]))
+"""
+
+ALLOCATION = """
+import tracemalloc
+tracemalloc.start()
+import aeromet_py
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+BASELINE = """
+import resource
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def run(script: str, env: Dict[str, str]) -> str:
+    return subprocess.check_output(
+        [sys.executable, "-W", "ignore", "-c", script], text=True, env=env
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as prefix:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=prefix)
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+        # Warm up the bytecode cache
+        run(TIMING, env)
+
+        runs = [json.loads(run(TIMING, env)) for _ in range(7)]
+        allocated = median(int(run(ALLOCATION, env)) for _ in range(3))
+        baseline = median(int(run(BASELINE, env)) for _ in range(3))
+
+    elapsed, rss, rss_report = (median(col) for col in zip(*runs))
+    print(f"import time:              {elapsed * 1e3:8.1f} ms")
+    print(f"allocated by import:      {allocated / 1024:8.0f} KiB")
+    print(f"peak RSS of interpreter:  {baseline:8.0f} KiB")
+    print(f"peak RSS after import:    {rss:8.0f} KiB")
+    print(f"peak RSS after a report:  {rss_report:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
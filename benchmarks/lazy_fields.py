@@ -0,0 +1,65 @@
+"""Benchmark of reading a few fields from many reports.
+
+Parses the reports and reads `station`, `time` and `wind` from every one of
+them, the fields most of the consumers read, with every group decoded when
+the report is created, with `lazy=True`, with only those `fields` and with
+both options.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.lazy_fields [--reports N]
+
+The default is 1,000,000 reports, which takes some minutes.
+"""
+import argparse
+import time
+
+from typing import Any, Dict, Type
+
+from aeromet_py import Metar, Taf
+from aeromet_py.reports.models import Report
+
+from .parse_allocations import METARS, TAFS
+
+
+FIELDS = ("station", "time", "wind")
+
+MODES: Dict[str, Dict[str, Any]] = {
+    "eager": {},
+    "lazy": {"lazy": True},
+    "fields": {"fields": FIELDS},
+    "lazy+fields": {"lazy": True, "fields": FIELDS},
+}
+
+
+def read_fields(cls: Type[Report], codes: list, n: int, options: dict) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        report = cls(codes[i % len(codes)], **options)  # type: ignore
+        report.station
+        report.time
+        report.wind  # type: ignore
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for cls, codes in ((Metar, METARS), (Taf, TAFS)):
+        eager = 0.0
+        for mode, options in MODES.items():
+            read_fields(cls, codes, len(codes), options)  # warm up caches
+            elapsed = read_fields(cls, codes, args.reports, options)
+            eager = eager or elapsed
+            print(
+                f"{cls.__name__:6s} {mode:12s} {args.reports} reports: "
+                f"{elapsed:8.2f} s ({elapsed / args.reports * 1e6:6.1f} us/report), "
+                f"{eager / elapsed:4.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
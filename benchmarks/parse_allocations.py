@@ -0,0 +1,85 @@
+"""Benchmark of the memory allocated to parse reports.
+
+Measures with tracemalloc, per parsed report:
+
+* the blocks and bytes still allocated after parsing, with the reports kept,
+* the peak of memory allocated while parsing one report, over the memory
+  held before it (needs Python 3.9+ to reset the peak between reports).
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.parse_allocations
+"""
+import gc
+import tracemalloc
+
+from typing import Callable, List
+
+from aeromet_py import Metar, Taf
+
+
+METARS = [
+    "METAR MROC 161900Z 09014KT CAVOK 29/16 A2999",
+    "METAR KJFK 122051Z 32004KT 10SM OVC065 M02/M15 A3031",
+    "METAR SCFA 121300Z 21008KT 9999 3000W TSRA FEW020 20/13 Q1014",
+    "METAR EGLL 161950Z AUTO 24012G25KT 200V270 6000 R27L/0800U -RA BR "
+    "SCT008 BKN012 OVC020 12/11 Q1003 RERA WS R27L BECMG 4000 -DZ",
+    "METAR UUWW 141030Z 14006MPS 9999 SHSN BKN025CB M08/M11 Q1019 R01/290050",
+    "METAR LEMD 131100Z 02010KT 350V050 CAVOK 18/M03 Q1027 NOSIG",
+]
+
+TAFS = [
+    "TAF MROC 161700Z 1618/1718 09012KT 9999 FEW030 TX31/1618Z TN19/1711Z "
+    "BECMG 1700/1702 06008KT TEMPO 1708/1712 5000 -RA BKN010",
+]
+
+
+def measure(name: str, parse: Callable[[str], object], reports: List[str]) -> None:
+    n = 500
+    codes = reports * (n // len(reports))
+    for code in reports:
+        parse(code)  # warm up caches and lazy tables
+
+    gc.collect()
+    tracemalloc.start()
+
+    kept = []
+    before = tracemalloc.get_traced_memory()[0]
+    blocks_before = _blocks()
+    for code in codes:
+        kept.append(parse(code))
+    retained = tracemalloc.get_traced_memory()[0] - before
+    retained_blocks = _blocks() - blocks_before
+    del kept
+
+    gc.collect()
+    peak = 0
+    for code in reports:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        report = parse(code)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+        del report
+
+    tracemalloc.stop()
+
+    print(
+        f"{name:6s} retained: {retained_blocks / len(codes):7.0f} blocks "
+        f"{retained / len(codes) / 1024:7.1f} KiB/report, "
+        f"peak while parsing: {peak / 1024:7.1f} KiB"
+    )
+
+
+def _blocks() -> int:
+    snapshot = tracemalloc.take_snapshot()
+    return sum(stat.count for stat in snapshot.statistics("filename"))
+
+
+def main() -> None:
+    measure("Metar", Metar, METARS)
+    measure("Taf", Taf, TAFS)
+
+
+if __name__ == "__main__":
+    main()
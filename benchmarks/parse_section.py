@@ -0,0 +1,129 @@
+"""Benchmark of the throughput of `parse_section` with every parser engine.
+
+Parses METAR bodies with the handler table of `Metar` (with no-op handlers, so
+only the matching is measured) and full METAR reports. The bodies are a few
+real reports repeated, a synthetic corpus where most of the groups are
+different between reports and the same corpus followed by remarks, which
+are tried against every handler left.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.parse_section
+"""
+import random
+import timeit
+
+from typing import List
+
+from aeromet_py import Metar, set_parser_engine
+from aeromet_py.reports.models.base import GroupHandler, parse_section
+from aeromet_py.reports.models.base.parser import ENGINES
+from aeromet_py.utils import MetarRegExp
+
+
+REPORTS = [
+    "METAR MROC 161900Z 09014KT CAVOK 29/16 A2999",
+    "METAR KJFK 122051Z 32004KT 10SM OVC065 M02/M15 A3031",
+    "METAR SCFA 121300Z 21008KT 9999 3000W TSRA FEW020 20/13 Q1014",
+    "METAR EGLL 161950Z AUTO 24012G25KT 200V270 6000 R27L/0800U -RA BR "
+    "SCT008 BKN012 OVC020 12/11 Q1003 RERA WS R27L",
+    "METAR UUWW 141030Z 14006MPS 9999 SHSN BKN025CB M08/M11 Q1019 R01/290050",
+    "METAR LEMD 131100Z 02010KT 350V050 CAVOK 18/M03 Q1027 NOSIG",
+    "METAR KMIA 130053Z 00000KT 10SM FEW030 SCT250 23/21 A3015 RMK AO2",
+]
+
+
+def noop(match) -> None:
+    pass
+
+
+def temperature(value: int) -> str:
+    return f"M{-value:02d}" if value < 0 else f"{value:02d}"
+
+
+def synthetic(n: int) -> List[str]:
+    random.seed(0)
+    stations = ["MROC", "KJFK", "EGLL", "SCFA", "UUWW", "LEMD", "KMIA", "RJTT"]
+    weather = ["", " -RA", " +TSRA", " BR", " SHSN", " VCSH -DZ"]
+    bodies = []
+    for _ in range(n):
+        clouds = " ".join(
+            f"{random.choice(['FEW', 'SCT', 'BKN', 'OVC'])}{random.randint(3, 250):03d}"
+            for _ in range(random.randint(1, 3))
+        )
+        bodies.append(
+            f"METAR {random.choice(stations)} "
+            f"{random.randint(1, 28):02d}{random.randint(0, 23):02d}"
+            f"{random.choice([0, 20, 30, 50]):02d}Z "
+            f"{random.randint(0, 35) * 10:03d}{random.randint(2, 30):02d}KT "
+            f"{random.choice(['9999', '8000', '4000', '0800'])}"
+            f"{random.choice(weather)} {clouds} "
+            f"{temperature(random.randint(-5, 35))}/"
+            f"{temperature(random.randint(-9, 25))} "
+            f"Q{random.randint(980, 1040):04d}"
+        )
+    return bodies
+
+
+PATTERNS = [
+    MetarRegExp.TYPE,
+    MetarRegExp.STATION,
+    MetarRegExp.TIME,
+    MetarRegExp.MODIFIER,
+    MetarRegExp.WIND,
+    MetarRegExp.WIND_VARIATION,
+    MetarRegExp.VISIBILITY,
+    MetarRegExp.MINIMUM_VISIBILITY,
+    *[MetarRegExp.RUNWAY_RANGE] * 3,
+    *[MetarRegExp.WEATHER] * 3,
+    *[MetarRegExp.CLOUD] * 4,
+    MetarRegExp.TEMPERATURES,
+    *[MetarRegExp.PRESSURE] * 2,
+    MetarRegExp.RECENT_WEATHER,
+    *[MetarRegExp.WINDSHEAR] * 3,
+    MetarRegExp.SEA_STATE,
+    MetarRegExp.RUNWAY_STATE,
+]
+
+
+def measure(
+    name: str, handlers: List[GroupHandler], bodies: List[str], engine: str
+) -> None:
+    groups = sum(len(b.split(" ")) for b in bodies)
+    n = max(1, 20_000 // len(bodies))
+    elapsed = min(
+        timeit.repeat(
+            lambda: [parse_section(handlers, b, engine) for b in bodies],
+            number=n,
+            repeat=5,
+        )
+    )
+    print(
+        f"{engine:12s} {name:18s} {n * len(bodies) / elapsed:10.0f} sections/s "
+        f"{n * groups / elapsed:10.0f} groups/s"
+    )
+
+
+def main() -> None:
+    handlers: List[GroupHandler] = [GroupHandler(p, noop) for p in PATTERNS]
+    real = [Metar(r).body for r in REPORTS]
+    corpus = synthetic(5_000)
+    remarks = [b + " RMK AO2 SLP264 T10171150 56004" for b in corpus]
+
+    for engine in ENGINES:
+        measure("real (repeated)", handlers, real, engine)
+        measure("synthetic", handlers, corpus, engine)
+        measure("synthetic + RMK", handlers, remarks, engine)
+
+        set_parser_engine(engine)
+        n = 200
+        elapsed = min(
+            timeit.repeat(lambda: [Metar(r) for r in REPORTS], number=n, repeat=5)
+        )
+        print(
+            f"{engine:12s} {'Metar':18s} {n * len(REPORTS) / elapsed:10.0f} reports/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
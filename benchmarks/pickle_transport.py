@@ -0,0 +1,147 @@
+"""Benchmark of the pickling of the reports sent between processes.
+
+Compares three ways to send a report:
+
+* graph: the default pickle of the objects of the report, with the paths of
+  the classes and the names of the attributes of every group.
+* code: the code and the options only, the report is parsed again where
+  it's loaded.
+* compact: `Report.__reduce__`, the groups as the names of their classes and
+  their decoded attributes, loaded without decoding the groups again.
+
+Prints the size of the pickles and the process time to dump them, to load
+them and to load them and read every group.
+
+The compact form is smaller than the graph, and the reports aren't parsed
+again when loaded, but every group is still built: loading a `Taf` is about
+as fast as the graph, only its size and the time to dump it are lower. The
+benchmark fails if the compact form gets bigger than the graph, or slower
+than it or than parsing the reports again.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.pickle_transport [--number N]
+"""
+import argparse
+import copyreg
+import io
+import pickle
+import time
+import timeit
+
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from aeromet_py import Metar, Taf
+from aeromet_py.reports.models import Report
+from aeromet_py.reports.models.base.group import _MODEL_CLASSES, _MODEL_SLOTS
+
+from .parse_allocations import METARS, TAFS
+
+
+def reduce_graph(obj: Any) -> Tuple[Any, ...]:
+    """Reduce an object as the default pickle does."""
+    cls = type(obj)
+    attributes = getattr(obj, "__dict__", None)
+    slots = {s: getattr(obj, s) for s in _MODEL_SLOTS.get(cls, ())}
+    state = (attributes, slots) if slots else attributes
+    return (copyreg.__newobj__, (cls,), state)  # type: ignore
+
+
+GRAPH_TABLE: Dict[type, Callable[[Any], Tuple[Any, ...]]] = {
+    cls: reduce_graph for cls in list(_MODEL_CLASSES.values()) + [Metar, Taf]
+}
+
+
+def dumps_graph(report: Report) -> bytes:
+    f = io.BytesIO()
+    pickler = pickle.Pickler(f, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = GRAPH_TABLE
+    pickler.dump(report)
+    return f.getvalue()
+
+
+def dumps_code(report: Report) -> bytes:
+    time = report.time
+    return pickle.dumps(
+        (type(report), report.raw_code, time.year, time.month),
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def loads_code(data: bytes) -> Report:
+    cls, code, year, month = pickle.loads(data)
+    return cls(code, year, month, lazy=True)
+
+
+def dumps(report: Report) -> bytes:
+    return pickle.dumps(report, pickle.HIGHEST_PROTOCOL)
+
+
+# The margin of the time of the compact form over the graph, for the noise
+TOLERANCE = 1.25
+
+
+class Measure(NamedTuple):
+    size: float
+    dumps: float
+    loads: float
+    decode: float
+
+
+def measure(
+    name: str,
+    reports: List[Report],
+    dump: Callable[[Report], bytes],
+    load: Callable[[bytes], Any],
+    number: int,
+) -> Measure:
+    data = [dump(report) for report in reports]
+    count = number * len(reports)
+
+    def best(function: Callable[[], Any]) -> float:
+        times = timeit.repeat(
+            function, number=number, repeat=5, timer=time.process_time
+        )
+        return min(times) / count * 1e6
+
+    result = Measure(
+        sum(len(d) for d in data) / len(data),
+        best(lambda: [dump(r) for r in reports]),
+        best(lambda: [load(d) for d in data]),
+        best(lambda: [load(d).as_dict() for d in data]),
+    )
+    print(
+        f"{name:14s}: {result.size:7.0f} bytes, dumps {result.dumps:6.1f} us, "
+        f"loads {result.loads:6.1f} us, loads + as_dict {result.decode:6.1f} us"
+    )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    for cls, codes in ((Metar, METARS), (Taf, TAFS)):
+        reports: List[Report] = [cls(code) for code in codes]
+        name = cls.__name__
+        graph = measure(
+            f"{name} graph", reports, dumps_graph, pickle.loads, args.number
+        )
+        code = measure(f"{name} code", reports, dumps_code, loads_code, args.number)
+        compact = measure(f"{name} compact", reports, dumps, pickle.loads, args.number)
+
+        assert compact.size < graph.size, f"{name}: bigger than the graph"
+        assert compact.dumps < graph.dumps * TOLERANCE, f"{name}: slower dumps"
+        assert compact.loads < graph.loads * TOLERANCE, f"{name}: slower loads"
+        assert compact.decode < code.decode, f"{name}: slower than parsing"
+
+    start = timeit.default_timer()
+    for code in METARS:
+        Metar(code).as_dict()
+    elapsed = timeit.default_timer() - start
+    print(f"Metar(code).as_dict(): {elapsed / len(METARS) * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark of parsing repeated reports through a report cache.
+
+Parses a feed where every report is seen many times, as when re-polling
+feeds or receiving duplicate bulletins, with `Metar` and with `ReportCache`,
+and prints the hit rate of the cache.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.report_cache [--reports N] [--repeats N]
+"""
+import argparse
+import random
+import time
+
+from typing import Callable, List
+
+from aeromet_py import Metar, ReportCache
+
+from .parse_allocations import METARS
+
+
+def parse_all(parse: Callable[[str], object], codes: List[str]) -> float:
+    start = time.perf_counter()
+    for code in codes:
+        parse(code)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    # Every distinct report seen `repeats` times in random order
+    rng = random.Random(0)
+    distinct = [
+        code.replace(code.split()[1], "K{:03d}".format(i % 1000), 1)
+        for i, code in enumerate(METARS * (args.reports // args.repeats // len(METARS)))
+    ]
+    codes = distinct * args.repeats
+    rng.shuffle(codes)
+
+    uncached = parse_all(Metar, codes)
+    cache = ReportCache(Metar, maxsize=len(distinct))
+    cached = parse_all(cache.parse, codes)
+    info = cache.info()
+
+    for name, elapsed in (("Metar", uncached), ("ReportCache", cached)):
+        print(
+            f"{name:11s}: {elapsed / len(codes) * 1e6:6.1f} us/report, "
+            f"{uncached / elapsed:5.1f}x"
+        )
+    print(f"hits: {info.hits}, misses: {info.misses}, size: {info.currsize}")
+
+    hits = distinct[:1000]
+    elapsed = min(parse_all(cache.parse, hits) for _ in range(5))
+    print(f"cache hit: {elapsed / len(hits) * 1e6:6.2f} us/report")
+
+
+if __name__ == "__main__":
+    main()
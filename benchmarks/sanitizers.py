@@ -0,0 +1,118 @@
+"""Benchmark of the sanitizers over long TAFs with many change groups.
+
+Compares the search/sub loops the sanitizers used to run, which rescan the
+whole report for every replacement, with the single-pass sanitizers.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.sanitizers
+"""
+import random
+import re
+import timeit
+
+from typing import Callable, List
+
+from aeromet_py import Taf
+from aeromet_py.utils import (
+    sanitize_change_indicator,
+    sanitize_visibility,
+    sanitize_windshear,
+)
+
+
+def loop_visibility(report: str) -> str:
+    regex = r"\s(?P<int>\d+)\s(?P<frac>\d/\dSM)\s?"
+    for _ in range(3):
+        match = re.search(regex, report)
+        try:
+            report = re.sub(regex, " {}_{} ".format(*match.groups()), report, count=1)
+        except AttributeError:
+            break
+    return report
+
+
+def loop_windshear(report: str) -> str:
+    report = re.sub(r"WS\sALL\sRWY", "WS_ALL_RWY", report)
+    fmt = r"WS\sR(WY)?(?P<name>\d{2}[CLR]?)"
+    pattern = re.compile(fmt)
+    for _ in range(3):
+        match = pattern.search(report)
+        if match:
+            report = re.sub(fmt, "WS_R{}".format(match.group("name")), report, count=1)
+    return report
+
+
+def loop_change_indicator(report: str) -> str:
+    fmt = r"PROB(?P<percent>[34]0)\sTEMPO"
+    pattern = re.compile(fmt)
+    for _ in range(5):
+        match = pattern.search(report)
+        if match:
+            report = re.sub(
+                fmt, "PROB{}_TEMPO".format(match.group("percent")), report, count=1
+            )
+        else:
+            break
+    return report
+
+
+def long_taf(changes: int) -> str:
+    groups = ["TAF KMIA 161700Z 1618/1718 09012KT 6SM FEW030"]
+    for i in range(changes):
+        day, hour = 16 + (18 + i) // 24, (18 + i) % 24
+        indicator = random.choice(
+            ["BECMG", "TEMPO", "PROB30 TEMPO", "PROB40 TEMPO", "PROB30"]
+        )
+        groups.append(
+            f"{indicator} {day}{hour:02d}/{day}{hour + 1 if hour < 23 else 24:02d} "
+            f"{random.choice(['1 1/2SM', '2 1/4SM', '3SM', '1/2SM'])} "
+            f"{random.choice(['-RA', 'BR', 'TSRA', 'SHRA'])} "
+            f"{random.choice(['BKN010', 'OVC005', 'SCT020CB'])}"
+        )
+    return " ".join(groups)
+
+
+def measure(name: str, sanitize: Callable[[str], str], reports: List[str]) -> float:
+    elapsed = min(
+        timeit.repeat(lambda: [sanitize(r) for r in reports], number=20, repeat=5)
+    )
+    per_report = elapsed / (20 * len(reports))
+    print(f"{name:28s} {per_report * 1e6:9.1f} us/report")
+    return per_report
+
+
+def main() -> None:
+    random.seed(0)
+    for changes in (5, 20, 60):
+        reports = [long_taf(changes) for _ in range(50)]
+        for report in reports:
+            assert sanitize_visibility(report) == loop_visibility(report)
+            assert sanitize_windshear(report) == loop_windshear(report)
+            assert sanitize_change_indicator(report) == loop_change_indicator(report)
+
+        print(f"{changes} change groups, {len(reports[0])} chars:")
+        before = measure("  loops", _loops, reports)
+        after = measure("  single pass", _single_pass, reports)
+        print(f"  speedup {before / after:.1f}x")
+
+    # Taf keeps up to 8 change periods, PROB30 TEMPO takes two of them
+    reports = [long_taf(4) for _ in range(20)]
+    elapsed = min(timeit.repeat(lambda: [Taf(r) for r in reports], number=5, repeat=3))
+    print(f"Taf with 4 change groups:    {elapsed / 100 * 1e6:9.1f} us/report")
+
+
+def _loops(report: str) -> str:
+    report = loop_visibility(report)
+    report = loop_windshear(report)
+    return loop_change_indicator(report)
+
+
+def _single_pass(report: str) -> str:
+    report = sanitize_visibility(report)
+    report = sanitize_windshear(report)
+    return sanitize_change_indicator(report)
+
+
+if __name__ == "__main__":
+    main()
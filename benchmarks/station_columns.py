@@ -0,0 +1,87 @@
+"""Benchmark of the distance queries over the columns of the stations database.
+
+Compares the loops that parse the coordinate strings of every station on each
+query with the batched functions over the numeric columns.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.station_columns
+"""
+import random
+import time
+import timeit
+
+from math import asin, cos, radians, sin, sqrt
+from typing import List
+
+from aeromet_py.database import (
+    distances_from,
+    get_station_columns,
+    get_stations,
+    pairwise_distances,
+    parse_coordinate,
+)
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = (
+        sin(dlat / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    )
+    return 2 * 6371.0 * asin(sqrt(a))
+
+
+def strings_from(lat: float, lon: float) -> List[float]:
+    return [
+        haversine(lat, lon, parse_coordinate(s[4]), parse_coordinate(s[5]))
+        for s in get_stations()
+    ]
+
+
+def strings_pairwise(rows_a: List[int], rows_b: List[int]) -> List[float]:
+    stations = list(get_stations())
+    result = []
+    for a, b in zip(rows_a, rows_b):
+        sa, sb = stations[a], stations[b]
+        result.append(
+            haversine(
+                parse_coordinate(sa[4]),
+                parse_coordinate(sa[5]),
+                parse_coordinate(sb[4]),
+                parse_coordinate(sb[5]),
+            )
+        )
+    return result
+
+
+def main() -> None:
+    random.seed(0)
+    queries = [(random.uniform(-60, 70), random.uniform(-180, 180)) for _ in range(20)]
+
+    start = time.perf_counter()
+    columns = get_station_columns()
+    build = time.perf_counter() - start
+
+    n = len(columns.latitude)
+    rows_a = [random.randrange(n) for _ in range(100_000)]
+    rows_b = [random.randrange(n) for _ in range(100_000)]
+
+    strings = timeit.timeit(lambda: [strings_from(a, o) for a, o in queries], number=1)
+    arrays = timeit.timeit(lambda: [distances_from(a, o) for a, o in queries], number=5)
+    arrays /= 5
+    pairs_strings = timeit.timeit(lambda: strings_pairwise(rows_a, rows_b), number=1)
+    pairs_arrays = timeit.timeit(lambda: pairwise_distances(rows_a, rows_b), number=5)
+    pairs_arrays /= 5
+
+    q = len(queries)
+    print(f"columns build (once):     {build * 1e3:10.1f} ms")
+    print(f"strings one-to-all:       {strings / q * 1e3:10.2f} ms/query")
+    print(f"columns one-to-all:       {arrays / q * 1e3:10.2f} ms/query")
+    print(f"strings 100k pairs:       {pairs_strings * 1e3:10.1f} ms")
+    print(f"columns 100k pairs:       {pairs_arrays * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
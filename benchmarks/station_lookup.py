@@ -0,0 +1,45 @@
+"""Benchmark of the station lookup by code.
+
+Compares the linear search over the stations database with the hash index
+used by `Station`.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.station_lookup
+"""
+import random
+import timeit
+
+from typing import List, Optional
+
+from aeromet_py.database import find_station, get_stations
+
+
+def linear_search(code: str, index: int) -> Optional[List[str]]:
+    for stn in get_stations():
+        if code == stn[index]:
+            return stn
+
+    return None
+
+
+def main() -> None:
+    random.seed(0)
+    codes = [stn[1] for stn in get_stations()]
+    sample = random.sample(codes, 1000)
+
+    # Warm up the index so it is not counted in the lookups
+    find_station(sample[0], 1)
+
+    scan = timeit.timeit(lambda: [linear_search(c, 1) for c in sample], number=1)
+    index = timeit.timeit(lambda: [find_station(c, 1) for c in sample], number=100)
+    index /= 100
+
+    print(f"stations in database: {len(codes)}")
+    print(f"linear search: {scan / len(sample) * 1e6:10.2f} us/lookup")
+    print(f"hash index:    {index / len(sample) * 1e6:10.2f} us/lookup")
+    print(f"speedup:       {scan / index:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark of the memory held by the station groups of the reports.
+
+Simulates keeping a day of hourly reports from 5,000 airports in memory and
+compares station groups holding a copy of their database row each with the
+station groups sharing the interned `StationData` of the registry.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.station_memory
+"""
+import gc
+import time
+import tracemalloc
+
+from typing import Callable, List
+
+from aeromet_py.database import find_station, get_stations
+from aeromet_py.reports.models.base import Station
+
+
+AIRPORTS = 5_000
+HOURS = 24
+
+
+class CopiedStation(Station):
+    """Station group holding its own copy of the database row."""
+
+    def __init__(self, code: str, type: str) -> None:
+        super().__init__(code, type)
+        self._station = find_station(code, 1)  # type: ignore
+
+
+def measure(factory: Callable[[str, str], Station], codes: List[str]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    groups = [factory(code, "ICAO") for _ in range(HOURS) for code in codes]
+    elapsed = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    n = len(groups)
+    name = factory.__name__
+    print(
+        f"{name:16s} {n} groups: {current / 2**20:8.1f} MiB, "
+        f"{current / n:6.0f} B/group, {elapsed / n * 1e6:6.2f} us/group"
+    )
+
+
+def main() -> None:
+    codes = [stn[1] for stn in get_stations() if stn[1] != "None"][:AIRPORTS]
+    # Warm up the hash index and the registry outside of the measures
+    for code in codes:
+        Station(code, "ICAO")
+
+    measure(CopiedStation, codes)
+    measure(Station, codes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark of the neighbourhood queries over the stations database.
+
+Compares a linear haversine search over all the stations with the k-d tree
+behind `nearest_stations` and `stations_within`.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.station_neighbours
+"""
+import random
+import time
+import timeit
+
+from math import asin, cos, radians, sin, sqrt
+from typing import List, Tuple
+
+from aeromet_py.database import (
+    get_stations,
+    nearest_stations,
+    parse_coordinate,
+    stations_within,
+)
+from aeromet_py.database.spatial import get_station_tree
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = (
+        sin(dlat / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    )
+    return 2 * 6371.0 * asin(sqrt(a))
+
+
+def linear_nearest(lat: float, lon: float, k: int) -> List[Tuple[float, str]]:
+    distances = [
+        (haversine(lat, lon, parse_coordinate(s[4]), parse_coordinate(s[5])), s[1])
+        for s in get_stations()
+    ]
+    return sorted(distances)[:k]
+
+
+def main() -> None:
+    random.seed(0)
+    queries = [(random.uniform(-60, 70), random.uniform(-180, 180)) for _ in range(50)]
+
+    start = time.perf_counter()
+    get_station_tree()
+    build = time.perf_counter() - start
+
+    scan = timeit.timeit(
+        lambda: [linear_nearest(a, o, 5) for a, o in queries], number=1
+    )
+    tree = timeit.timeit(
+        lambda: [nearest_stations(a, o, 5) for a, o in queries], number=10
+    )
+    tree /= 10
+    radius = timeit.timeit(
+        lambda: [stations_within(a, o, 250.0) for a, o in queries], number=10
+    )
+    radius /= 10
+
+    n = len(queries)
+    print(f"tree build (once):        {build * 1e3:10.1f} ms")
+    print(f"linear 5-nearest:         {scan / n * 1e3:10.3f} ms/query")
+    print(f"tree 5-nearest:           {tree / n * 1e3:10.3f} ms/query")
+    print(f"tree within 250 km:       {radius / n * 1e3:10.3f} ms/query")
+    print(f"speedup (5-nearest):      {scan / tree:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
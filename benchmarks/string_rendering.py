@@ -0,0 +1,50 @@
+"""Benchmark of the parse throughput and the cost of the report strings.
+
+Parses the reports, then parses them and renders their strings, to show
+the throughput of the parse alone and the time of rendering the description
+of the reports, which is only paid by the reports whose string is requested.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.string_rendering [--reports N]
+"""
+import argparse
+import time
+
+from typing import Callable, List
+
+from aeromet_py import Metar, Taf
+
+from .parse_allocations import METARS, TAFS
+
+
+def throughput(parse: Callable[[str], object], codes: List[str], n: int) -> float:
+    """Get the reports parsed per second."""
+    start = time.perf_counter()
+    for i in range(n):
+        parse(codes[i % len(codes)])
+
+    return n / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for cls, codes in ((Metar, METARS), (Taf, TAFS)):
+        throughput(cls, codes, len(codes))  # warm up caches
+
+        parsed = max(throughput(cls, codes, args.reports) for _ in range(3))
+        rendered = max(
+            throughput(lambda code: str(cls(code)), codes, args.reports)  # type: ignore
+            for _ in range(3)
+        )
+        print(
+            f"{cls.__name__:6s} parse: {parsed:8.0f} reports/s, "
+            f"parse and str: {rendered:8.0f} reports/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
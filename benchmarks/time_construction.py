@@ -0,0 +1,51 @@
+"""Benchmark of the construction of the time groups.
+
+Times the construction of the default time of a report, of the time of the
+report group with and without year and month, and the parse of the reports.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.time_construction
+"""
+import timeit
+
+from typing import Callable, List, Tuple
+
+from aeromet_py import Metar, Taf
+from aeromet_py.reports.models import Time
+from aeromet_py.utils import MetarRegExp, compile_pattern
+
+from .parse_allocations import METARS, TAFS
+
+
+def per_call(function: Callable[[], object], number: int) -> float:
+    """Get the best time of a call of the function, in microseconds."""
+    function()
+    elapsed = min(timeit.repeat(function, number=number, repeat=5))
+    return elapsed / number * 1e6
+
+
+def main() -> None:
+    match = compile_pattern(MetarRegExp.TIME).match("071230Z")
+
+    # The name, the function, the calls made by the function and the calls
+    # of the function to time
+    cases: List[Tuple[str, Callable[[], object], int, int]] = [
+        ("Time()", lambda: Time(), 1, 20_000),
+        ("Time.from_metar(match)", lambda: Time.from_metar(match), 1, 20_000),
+        (
+            "Time.from_metar(match, 2022, 3)",
+            lambda: Time.from_metar(match, 2022, 3),
+            1,
+            20_000,
+        ),
+        ("Metar", lambda: [Metar(code) for code in METARS], len(METARS), 50),
+        ("Taf", lambda: [Taf(code) for code in TAFS], len(TAFS), 200),
+    ]
+    for name, function, calls, number in cases:
+        elapsed = per_call(function, number) / calls
+        print(f"{name:32s} {elapsed:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
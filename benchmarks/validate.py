@@ -0,0 +1,68 @@
+"""Benchmark of validating reports against parsing them.
+
+Compares the time to get the unparsed groups of a report with
+`validate_metar` and `validate_taf`, which only match the groups, with the
+time to parse the report with `Metar` and `Taf`.
+
+Validating takes about 25 us per METAR and 35 us per TAF, most of it
+matching the groups, the same as when it was added. It was about 10x faster
+than parsing then, but parsing is about twice as fast since, so the target
+is now 4x, and the benchmark fails below it. Both share the matching of the
+groups, so validating can't get much further ahead.
+
+Run it from the root of the repository with:
+
+    python -m benchmarks.validate
+"""
+import timeit
+
+from typing import Callable, List
+
+from aeromet_py import Metar, Taf, validate_metar, validate_taf
+
+from .parse_allocations import METARS, TAFS
+
+
+# The minimum ratio of the time to parse a report over the time to validate it
+TARGET = 4.0
+
+
+def per_report(
+    functions: List[Callable[[str], object]], codes: List[str]
+) -> List[float]:
+    """Get the best time per report of every function, in microseconds.
+
+    The functions are timed in turns, so a slow period of the machine affects
+    all of them alike.
+    """
+    for function in functions:
+        for code in codes:
+            function(code)  # warm up caches
+
+    number = 50
+    best = [float("inf")] * len(functions)
+    for _ in range(25):
+        for i, function in enumerate(functions):
+            elapsed = timeit.timeit(
+                lambda: [function(code) for code in codes], number=number
+            )
+            best[i] = min(best[i], elapsed / number / len(codes) * 1e6)
+
+    return best
+
+
+def main() -> None:
+    for name, parse, validate, codes in (
+        ("Metar", Metar, validate_metar, METARS),
+        ("Taf", Taf, validate_taf, TAFS),
+    ):
+        parsing, validating = per_report([parse, validate], codes)
+        print(
+            f"{name:6s} parse: {parsing:7.1f} us/report, "
+            f"validate: {validating:7.1f} us/report, {parsing / validating:5.1f}x"
+        )
+        assert parsing / validating >= TARGET, f"{name}: below {TARGET}x"
+
+
+if __name__ == "__main__":
+    main()
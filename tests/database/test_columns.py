@@ -0,0 +1,91 @@
+import random
+
+from math import asin, atan2, cos, degrees, radians, sin, sqrt
+
+import pytest
+
+from aeromet_py.database import (
+    bearings_from,
+    distances_from,
+    get_station_columns,
+    get_stations,
+    pairwise_bearings,
+    pairwise_distances,
+    parse_coordinate,
+)
+
+
+def _haversine(lat1, lon1, lat2, lon2):
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = (
+        sin(dlat / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    )
+    return 2 * 6371.0 * asin(sqrt(a))
+
+
+def _bearing(lat1, lon1, lat2, lon2):
+    lat1, lat2, dlon = radians(lat1), radians(lat2), radians(lon2 - lon1)
+    y = sin(dlon) * cos(lat2)
+    x = cos(lat1) * sin(lat2) - sin(lat1) * cos(lat2) * cos(dlon)
+    return degrees(atan2(y, x)) % 360
+
+
+def test_columns_match_stations():
+    columns = get_station_columns()
+    stations = list(get_stations())
+
+    assert len(columns.latitude) == len(stations)
+    for row in range(0, len(stations), 97):
+        stn = stations[row]
+        assert columns.latitude[row] == parse_coordinate(stn[4])
+        assert columns.longitude[row] == parse_coordinate(stn[5])
+        assert columns.elevation[row] == float(stn[6])
+        assert columns.icao[row] == stn[1]
+        assert columns.iata[row] == stn[2]
+        assert columns.synop[row] == stn[3]
+        assert columns.country[row] == stn[7]
+
+
+def test_columns_are_built_once():
+    assert get_station_columns() is get_station_columns()
+
+
+def test_distances_and_bearings_from():
+    columns = get_station_columns()
+    lat, lon = 9.99, -84.22
+    distances = distances_from(lat, lon)
+    bearings = bearings_from(lat, lon)
+
+    assert len(distances) == len(bearings) == len(columns.latitude)
+    for row in range(0, len(distances), 211):
+        lat2, lon2 = columns.latitude[row], columns.longitude[row]
+        assert distances[row] == pytest.approx(_haversine(lat, lon, lat2, lon2))
+        assert bearings[row] == pytest.approx(_bearing(lat, lon, lat2, lon2))
+
+    assert all(0.0 <= b < 360.0 for b in bearings)
+
+
+def test_pairwise_distances_and_bearings():
+    columns = get_station_columns()
+    random.seed(3)
+    n = len(columns.latitude)
+    rows_a = [random.randrange(n) for _ in range(200)]
+    rows_b = [random.randrange(n) for _ in range(200)]
+    distances = pairwise_distances(rows_a, rows_b)
+    bearings = pairwise_bearings(rows_a, rows_b)
+
+    for a, b, distance, bearing in zip(rows_a, rows_b, distances, bearings):
+        coordinates = (
+            columns.latitude[a],
+            columns.longitude[a],
+            columns.latitude[b],
+            columns.longitude[b],
+        )
+        assert distance == pytest.approx(_haversine(*coordinates))
+        if a != b:
+            assert bearing == pytest.approx(_bearing(*coordinates))
+
+    with pytest.raises(ValueError):
+        pairwise_distances([0, 1], [0])
@@ -0,0 +1,67 @@
+import random
+
+from math import asin, cos, radians, sin, sqrt
+
+import pytest
+
+from aeromet_py.database import (
+    get_stations,
+    nearest_stations,
+    parse_coordinate,
+    stations_within,
+)
+
+
+def _haversine(lat1, lon1, lat2, lon2):
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = (
+        sin(dlat / 2) ** 2
+        + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    )
+    return 2 * 6371.0 * asin(sqrt(a))
+
+
+def _distances(lat, lon):
+    return sorted(
+        _haversine(lat, lon, parse_coordinate(stn[4]), parse_coordinate(stn[5]))
+        for stn in get_stations()
+    )
+
+
+def test_parse_coordinate():
+    assert parse_coordinate("51.53N") == pytest.approx(51 + 53 / 60)
+    assert parse_coordinate("176.39W") == pytest.approx(-(176 + 39 / 60))
+    assert parse_coordinate("00.07S") == pytest.approx(-7 / 60)
+    assert parse_coordinate("078.21E") == pytest.approx(78 + 21 / 60)
+
+    with pytest.raises(ValueError):
+        parse_coordinate("51.53")
+
+
+def test_nearest_stations():
+    stations = nearest_stations(9.99, -84.22, k=3)
+
+    assert len(stations) == 3
+    assert stations[0][0][1] == "MROC"
+    assert [d for _, d in stations] == sorted(d for _, d in stations)
+
+
+def test_nearest_stations_match_linear_search():
+    random.seed(7)
+    for _ in range(10):
+        lat, lon = random.uniform(-90, 90), random.uniform(-180, 180)
+        expected = _distances(lat, lon)[:5]
+        found = [d for _, d in nearest_stations(lat, lon, k=5)]
+
+        assert found == pytest.approx(expected)
+
+
+def test_stations_within_match_linear_search():
+    random.seed(11)
+    for _ in range(10):
+        lat, lon = random.uniform(-60, 70), random.uniform(-180, 180)
+        expected = [d for d in _distances(lat, lon) if d <= 500.0]
+        found = [d for _, d in stations_within(lat, lon, 500.0)]
+
+        assert found == pytest.approx(expected)
@@ -0,0 +1,95 @@
+from aeromet_py.database import (
+    NULL_STATION_DATA,
+    find_station,
+    get_station_data,
+    get_stations,
+)
+from aeromet_py.database.stations import (
+    STATIONS,
+    STATIONS_FILE,
+    StationTable,
+    build_stations,
+    pack_stations,
+    read_stations_source,
+)
+
+
+def _linear_search(code, index):
+    for stn in get_stations():
+        if code == stn[index]:
+            return stn
+
+    return None
+
+
+def test_find_station_by_icao():
+    station = find_station("MROC", 1)
+
+    assert station == [
+        "JUAN SANTAMARIA",
+        "MROC",
+        "SJO",
+        "78762",
+        "10.00N",
+        "084.13W",
+        "920",
+        "CR",
+    ]
+
+
+def test_find_station_by_iata_and_synop():
+    assert find_station("JFK", 2)[1] == "KJFK"
+    assert find_station("74486", 3)[1] == "KJFK"
+
+
+def test_find_station_not_found():
+    assert find_station("XXXX", 1) is None
+    assert find_station("XXX", 2) is None
+    assert find_station("00000", 3) is None
+
+
+def test_find_station_matches_linear_search():
+    for index in [1, 2, 3]:
+        codes = [stn[index] for stn in get_stations()]
+        for code in codes[::100] + ["None"]:
+            assert find_station(code, index) == _linear_search(code, index)
+
+
+def test_packed_station_table(tmp_path):
+    rows = [
+        ["JUAN SANTAMARIA", "MROC", "SJO", "78762", "10.00N", "084.13W", "920", "CR"],
+        ["QUITO/NEW INTL", "SEQM", "None", "None", "00.07S", "078.21W", "2400", "EC"],
+    ]
+    path = str(tmp_path / "stations.dat")
+    pack_stations(rows, path)
+    table = StationTable(path)
+
+    assert len(table) == 2
+    assert list(table) == rows
+    assert table[-1] == rows[1]
+    assert table[0:1] == rows[0:1]
+
+
+def test_get_station_data_is_interned():
+    data = get_station_data("MROC", 1)
+
+    assert data is get_station_data("MROC", 1)
+    assert data is get_station_data("SJO", 2)
+    assert list(data) == find_station("MROC", 1)
+    assert data.icao == "MROC"
+    assert data.elevation == "920"
+
+
+def test_get_station_data_not_found():
+    assert get_station_data("XXXX", 1) is NULL_STATION_DATA
+    assert get_station_data(None, None) is NULL_STATION_DATA
+    assert NULL_STATION_DATA.name is None
+
+
+def test_packed_file_matches_source(tmp_path):
+    assert list(read_stations_source()) == list(STATIONS)
+
+    path = tmp_path / "stations.dat"
+    build_stations(path=str(path))
+    with open(STATIONS_FILE, "rb") as f:
+        assert path.read_bytes() == f.read()
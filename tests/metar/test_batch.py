@@ -0,0 +1,58 @@
+import pickle
+
+import pytest
+
+from aeromet_py import Metar, parse_metars
+from aeromet_py.reports.models import ParserError
+
+
+codes = [
+    "METAR MROC 071200Z 10005KT 9999 -RA FEW020 BKN015CB 25/17 Q1013 NOSIG",
+    "METAR SKBO 071300Z VRB02KT CAVOK 18/09 A3010 NOSIG",
+    "METAR LEMD 071400Z 27015G25KT 3000 R36L/P1500U BR OVC008 10/09 Q1009",
+    "METAR EGLL 071500Z 00000KT 8000 SCT025 12/08 Q1021 R27L/290095",
+]
+
+
+def test_ordered_results():
+    expected = [Metar(code, 2022, 3).as_dict() for code in codes]
+
+    for workers in (1, 2):
+        results = list(
+            parse_metars(codes * 3, workers=workers, chunksize=2, year=2022, month=3)
+        )
+        assert [result.position for result in results] == list(range(12))
+        assert all(result.ok for result in results)
+        assert [result.report.as_dict() for result in results] == expected * 3
+
+
+def test_unordered_results():
+    results = list(parse_metars(codes * 3, workers=2, chunksize=1, ordered=False))
+    assert sorted(result.position for result in results) == list(range(12))
+    for result in results:
+        assert result.code == codes[result.position % 4]
+
+
+def test_errors_per_report():
+    bad = codes[1].replace("CAVOK", "CAVOK XYZ")
+    for workers in (1, 2):
+        results = list(parse_metars([codes[0], bad, ""], workers, truncate=True))
+        assert [result.ok for result in results] == [True, False, False]
+        assert isinstance(results[1].error, ParserError)
+        assert results[1].report is None
+        assert isinstance(results[2].error, AssertionError)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        list(parse_metars(codes, workers=0))
+
+    with pytest.raises(ValueError):
+        list(parse_metars(codes, chunksize=0))
+
+
+def test_pickle_report():
+    metar = Metar(codes[3], 2022, 3)
+    loaded = pickle.loads(pickle.dumps(metar))
+    assert loaded.as_dict() == metar.as_dict()
+    assert str(loaded.runway_state) == str(metar.runway_state)
@@ -0,0 +1,77 @@
+import pytest
+
+from aeromet_py import Metar
+from aeromet_py.reports.models import ParserError
+
+
+code = (
+    "METAR EGLL 161950Z AUTO 24012G25KT 200V270 6000 R27L/0800U -RA BR "
+    "SCT008 BKN012 OVC020 12/11 Q1003 RERA WS R27L XXX BECMG 4000 -DZ"
+)
+
+
+def test_only_the_fields_are_decoded():
+    metar = Metar(code, fields={"wind", "clouds", "temperatures"})
+    eager = Metar(code)
+
+    assert metar.wind.as_dict() == eager.wind.as_dict()
+    assert metar.clouds.as_dict() == eager.clouds.as_dict()
+    assert metar.temperatures.as_dict() == eager.temperatures.as_dict()
+    assert metar.pressure.code is None
+    assert metar.weathers.codes == []
+    assert len(metar.weather_trends) == 0
+    # The groups matched by other handlers aren't unparsed
+    assert metar.unparsed_groups == ["XXX"]
+
+
+def test_fields_with_dependencies():
+    eager = Metar(code)
+
+    metar = Metar(code, fields=["weather_trends"])
+    assert metar.weather_trends.as_dict() == eager.weather_trends.as_dict()
+
+    metar = Metar(code, fields=["flight_rules"], lazy=True)
+    assert metar.flight_rules == eager.flight_rules
+
+
+def test_method_fields():
+    cavok = "METAR MROC 071200Z 10005KT 9999 FEW050 25/17 Q1013"
+    metar = Metar(cavok, fields=["should_be_cavok"])
+
+    assert metar.should_be_cavok() is Metar(cavok).should_be_cavok() is True
+    assert metar.wind.code is None
+
+
+def test_unknown_field():
+    with pytest.raises(ValueError):
+        Metar(code, fields=["winds"])
+
+
+def test_fields_with_truncate():
+    with pytest.raises(ParserError):
+        Metar(code, fields=["wind"], truncate=True)
+
+
+trend_errors = "METAR MROC 071200Z 10005KT 9999 FEW020 25/17 Q1013 BECMG 34505KT XYZ"
+
+
+def test_unparsed_groups_of_trends_not_wanted():
+    expected = Metar(trend_errors).unparsed_groups
+
+    for fields in ({"wind"}, {"unparsed_groups"}):
+        assert Metar(trend_errors, fields=fields).unparsed_groups == expected
+        metar = Metar(trend_errors, fields=fields, lazy=True)
+        assert metar.unparsed_groups == expected
+
+    assert len(Metar(trend_errors, fields={"wind"}).weather_trends) == 0
+
+
+def test_trend_errors_with_truncate():
+    for lazy in (False, True):
+        with pytest.raises(ParserError):
+            Metar(trend_errors, fields=["wind"], truncate=True, lazy=lazy)
+
+
+def test_methods_are_not_fields():
+    with pytest.raises(ValueError):
+        Metar(code, fields=["as_dict"])
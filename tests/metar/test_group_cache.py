@@ -0,0 +1,89 @@
+import pytest
+
+from aeromet_py import Metar, Taf, get_group_cache, set_group_cache
+from aeromet_py.reports.models import GroupCache, MetarPressure
+from aeromet_py.utils import MetarRegExp, compile_pattern
+
+
+@pytest.fixture
+def cache():
+    set_group_cache(64)
+    yield get_group_cache()
+    set_group_cache(None)
+
+
+code = (
+    "METAR MROC 071200Z 10005KT 9999 -RA FEW020 BKN015CB 25/17 Q1013 "
+    "TEMPO 3000 -RA BKN015CB"
+)
+
+
+def test_disabled_by_default():
+    assert get_group_cache() is None
+
+
+def test_same_groups_with_cache(cache):
+    cached = Metar(code)
+    set_group_cache(None)
+    uncached = Metar(code)
+
+    assert cached.as_dict() == uncached.as_dict()
+    assert str(cached) == str(uncached)
+
+
+def test_shared_groups(cache):
+    first = Metar(code)
+    second = Metar(code.replace("MROC", "SKBO"))
+
+    assert first.wind is second.wind
+    assert first.prevailing_visibility is second.prevailing_visibility
+    assert first.clouds[1] is second.clouds[1]
+    assert first.pressure is second.pressure
+    assert first.weathers[0] is first.weather_trends[0].weathers[0]
+    assert first.clouds[1] is first.weather_trends[0].clouds[0]
+
+
+def test_taf_shares_groups(cache):
+    metar = Metar(code)
+    taf = Taf("TAF MROC 071100Z 0712/0812 10005KT 9999 FEW020 BECMG 0714/0716 -RA")
+
+    assert taf.wind is metar.wind
+    assert taf.clouds[0] is metar.clouds[0]
+    assert taf.changes_forecasted[0].weathers[0] is metar.weathers[0]
+
+
+def test_counters(cache):
+    Metar(code)
+    info = cache.info()
+    assert info.hits == 2
+    assert info.misses == 8
+    assert info.currsize == 8
+    assert info.maxsize == 64
+
+    Metar(code)
+    assert cache.info().hits == 12
+
+    cache.clear()
+    assert cache.info() == (0, 0, 64, 0)
+
+
+def test_least_recently_used_dropped():
+    cache = GroupCache(2)
+    pattern = compile_pattern(MetarRegExp.PRESSURE)
+    q1013, q1015, q1020 = (pattern.match(c) for c in ("Q1013", "Q1015", "Q1020"))
+
+    first = cache.decode(MetarPressure, q1013)
+    cache.decode(MetarPressure, q1015)
+    assert cache.decode(MetarPressure, q1013) is first
+    cache.decode(MetarPressure, q1020)
+
+    assert len(cache) == 2
+    assert cache.decode(MetarPressure, q1013) is first
+    assert cache.info().misses == 3
+    cache.decode(MetarPressure, q1015)
+    assert cache.info().misses == 4
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        GroupCache(0)
@@ -0,0 +1,64 @@
+import threading
+
+from aeromet_py import Metar, Taf
+
+
+metar = Metar(
+    "METAR EGLL 161950Z 24012G25KT 6000 -RA BR SCT008 BKN012 OVC020 12/11 Q1003 "
+    "TEMPO 4000 -DZ BKN008 BECMG 9999 NSW SCT015"
+)
+taf = Taf(
+    "TAF SKBO 071100Z 0712/0812 03005KT 9999 SCT020 TEMPO 0712/0716 4000 BR "
+    "BECMG 0720/0722 VRB02KT PROB30 0802/0806 2000 RA BKN008"
+)
+
+
+def snapshot():
+    return (
+        [cloud.code for cloud in metar.clouds],
+        [[cloud.code for cloud in trend.clouds] for trend in metar.weather_trends],
+        [change.code for change in taf.changes_forecasted],
+        [weather.code for weather in metar.weathers],
+    )
+
+
+def test_nested_iteration():
+    pairs = [(a.code, b.code) for a in metar.clouds for b in metar.clouds]
+
+    assert len(pairs) == 9
+    assert pairs[1] == ("SCT008", "BKN012")
+    assert list(metar.clouds) == list(metar.clouds)
+
+
+def test_break_doesnt_leak_state():
+    for cloud in metar.clouds:
+        break
+
+    assert [cloud.code for cloud in metar.clouds] == ["SCT008", "BKN012", "OVC020"]
+
+
+def test_empty_lists():
+    assert list(metar.runway_ranges) == []
+    assert metar.runway_ranges.items == []
+    assert len(metar.windshears) == 0
+
+
+def test_concurrent_iteration():
+    expected = snapshot()
+    errors = []
+    barrier = threading.Barrier(16)
+
+    def iterate() -> None:
+        barrier.wait()
+        for _ in range(500):
+            result = snapshot()
+            if result != expected:
+                errors.append(result)
+
+    threads = [threading.Thread(target=iterate) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
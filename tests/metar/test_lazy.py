@@ -0,0 +1,123 @@
+import sys
+import threading
+
+import pytest
+
+from aeromet_py import Metar
+
+
+code = (
+    "METAR EGLL 161950Z AUTO 24012G25KT 200V270 6000 R27L/0800U -RA BR "
+    "SCT008 BKN012 OVC020 12/11 Q1003 RERA WS R27L XXX BECMG 4000 -DZ YYY"
+)
+
+
+def test_lazy_groups_are_decoded_on_access():
+    metar = Metar(code, lazy=True)
+
+    assert metar.lazy
+    assert "_wind" not in metar.__dict__
+    assert "_weather_trends" not in metar.__dict__
+    assert metar.wind.code == "24012G25KT"
+    assert "_wind" in metar.__dict__
+    assert "_temperatures" not in metar.__dict__
+
+
+def test_lazy_same_as_eager():
+    eager = Metar(code)
+    lazy = Metar(code, lazy=True)
+
+    # Access some fields first to decode them out of order
+    assert lazy.flight_rules == eager.flight_rules
+    assert lazy.windshears.codes == eager.windshears.codes
+    assert str(lazy) == str(eager)
+    assert lazy.as_dict() == eager.as_dict()
+
+
+def test_lazy_string_with_truncate():
+    trend = "METAR EGLL 161950Z 24012KT 9999 SCT008 12/11 Q1003 TEMPO 4000 -DZ"
+    eager = Metar(trend, truncate=True)
+
+    assert str(Metar(trend, lazy=True)) == str(eager)
+    assert str(Metar(trend, lazy=True, truncate=True)) == str(eager)
+
+
+def test_lazy_unparsed_groups():
+    metar = Metar(code, lazy=True)
+
+    assert metar.unparsed_groups == ["XXX", "YYY"]
+    assert "_wind" not in metar.__dict__
+
+
+def test_eager_without_decoding_state():
+    attributes = Metar(code).__dict__
+
+    assert "_decode_lock" not in attributes
+    assert "_pending" not in attributes
+    assert "_decode_lock" in Metar(code, lazy=True).__dict__
+
+
+def test_lazy_missing_attribute():
+    metar = Metar(code, lazy=True)
+
+    with pytest.raises(AttributeError):
+        metar.not_an_attribute
+
+
+def test_lazy_decoding_errors():
+    # The day is out of range for the month
+    metar = Metar(
+        "METAR MROC 311200Z 10005KT 9999 25/17 Q1013 TEMPO 3000", 2022, 2, lazy=True
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            metar.time
+
+    with pytest.raises(ValueError):
+        metar.weather_trends
+
+    assert metar.wind.code == "10005KT"
+
+
+def test_lazy_concurrent_access():
+    eager = Metar(code)
+    expected = [
+        eager.wind.as_dict(),
+        eager.clouds.as_dict(),
+        len(eager.weather_trends),
+        eager.temperatures.as_dict(),
+    ]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(100):
+            metar = Metar(code, lazy=True)
+            errors = []
+            barrier = threading.Barrier(8)
+
+            def read() -> None:
+                barrier.wait()
+                try:
+                    result = [
+                        metar.wind.as_dict(),
+                        metar.clouds.as_dict(),
+                        len(metar.weather_trends),
+                        metar.temperatures.as_dict(),
+                    ]
+                except Exception as error:
+                    errors.append(error)
+                else:
+                    if result != expected:
+                        errors.append(result)
+
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert errors == []
+            assert str(metar) == str(eager)
+    finally:
+        sys.setswitchinterval(interval)
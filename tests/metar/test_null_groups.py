@@ -0,0 +1,47 @@
+from aeromet_py import Metar, Taf
+from aeromet_py.reports.models import (
+    MetarRunwayState,
+    MetarSeaState,
+    MetarWindVariation,
+    Station,
+    null_group,
+)
+
+
+first = Metar("METAR MROC 071200Z 10005KT 9999 FEW020 25/17 A3005")
+second = Metar("METAR ZZZZ 071200Z 10005KT 9999 FEW020 25/17 A3005")
+
+
+def test_absent_groups_shared():
+    assert first.wind_variation is second.wind_variation
+    assert first.minimum_visibility is second.minimum_visibility
+    assert first.sea_state is second.sea_state
+    assert first.runway_state is second.runway_state
+    assert first.recent_weather is second.recent_weather
+    assert first.modifier is second.modifier
+    assert first.station is not second.station
+    assert Metar("METAR 10005KT").station is Metar("METAR 20005KT").station
+
+
+def test_same_interface():
+    assert first.sea_state.as_dict() == MetarSeaState(None).as_dict()
+    assert first.runway_state.as_dict() == MetarRunwayState(None).as_dict()
+    assert first.wind_variation.code is None
+    assert str(first.wind_variation) == ""
+    assert second.station.name is None
+    assert Metar("METAR 10005KT").station.as_dict() == Station(None, None).as_dict()
+
+
+def test_found_groups_not_shared():
+    metar = Metar("METAR MROC 071200Z 10005KT 050V150 9999 FEW020 25/17 A3005")
+
+    assert metar.wind_variation is not null_group(MetarWindVariation)
+    assert metar.wind_variation.code == "050V150"
+    assert null_group(MetarWindVariation).code is None
+
+
+def test_taf_absent_groups_shared():
+    code = "TAF MROC 071100Z 0712/0812 10005KT 9999 FEW020"
+
+    assert Taf(code).missing is Taf(code).missing
+    assert Taf(code).cancelled is Taf(code).cancelled
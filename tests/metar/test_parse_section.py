@@ -0,0 +1,175 @@
+import random
+import re
+
+import pytest
+
+from aeromet_py import Metar, Taf, get_parser_engine, set_parser_engine
+from aeromet_py.reports.models.base import GroupHandler, HandlerTable, parse_section
+from aeromet_py.reports.models.base.parser import ENGINES
+from aeromet_py.utils import MetarRegExp, TafRegExp, get_guard
+
+
+REPORTS = [
+    "METAR MROC 161900Z 09014KT CAVOK 29/16 A2999",
+    "METAR KJFK 122051Z 32004KT 1_1/2SM OVC065 M02/M15 A3031 RMK AO2",
+    "SPECI SCFA 121300Z 21008KT 9999 3000W TSRA FEW020 20/13 Q1014",
+    "METAR EGLL 161950Z AUTO 24012G25KT 200V270 6000 R27L/0800U -RA BR "
+    "SCT008 BKN012CB OVC020 12/11 Q1003 RERA WS_R27L WS_ALL_RWY",
+    "METAR EGKK 161950Z 24012KT 9999 12/11 Q1003 WS_RWY26L WS_ALL_RWY08R",
+    "METAR UUWW 141030Z 14006MPS 9999 SHSN BKN025CB M08/M11 Q1019 R01/290050",
+    "METAR LEMD 131100Z VRB02KT 350V050 P6SM VV002 18/M03 Q1027 NOSIG",
+    "METAR SKBO 131100Z ///// //// ////// ///// Q//// W15/S2 WM01/H123",
+    "METAR KMIA 130053Z 00000KT 1/4SM R09/P6000FT FG SKC 23/21 A3015 R/SNOCLO",
+    "TAF MROC 161700Z 1618/1718 09012KT 9999 FEW030 TX31/1618Z TNM02/1711Z",
+    "TAF AMD SKBO 161700Z 1618/1718 CNL",
+    "TEMPO BECMG PROB30 PROB40_TEMPO FM161800 TL1900 AT2000 RMK",
+]
+
+REGEXPS = [
+    value
+    for cls in (MetarRegExp, TafRegExp)
+    for name, value in vars(cls).items()
+    if name.isupper()
+]
+
+
+def _tokens():
+    tokens = {token for report in REPORTS for token in report.split(" ")}
+    fragments = sorted({t[i:j] for t in tokens for i in range(3) for j in (-2, 99)})
+    random.seed(5)
+    for _ in range(20000):
+        tokens.add("".join(random.sample(fragments, random.randint(1, 2))))
+
+    return tokens
+
+
+def _linear_parse_section(handlers, section):
+    unparsed_groups = []
+    index = 0
+    for group in section.split(" "):
+        unparsed_groups.append(group)
+        counter = 0
+        for group_handler in handlers[index:]:
+            match = re.match(group_handler.regexp, group)
+            counter += 1
+            if match:
+                index += counter
+                group_handler.handler(match)
+                unparsed_groups.remove(group)
+                break
+
+    return unparsed_groups
+
+
+def test_guards_accept_every_matching_token():
+    tokens = _tokens()
+
+    for regexp in REGEXPS:
+        guard = get_guard(regexp)
+        assert guard is not None
+
+        for token in tokens:
+            if re.match(regexp, token):
+                assert guard.accepts(token), (regexp, token)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_parse_section_matches_linear_search(engine):
+    random.seed(9)
+    tokens = sorted(_tokens())
+
+    for _ in range(300):
+        handlers_regexps = random.sample(REGEXPS, random.randint(1, len(REGEXPS)))
+        section = " ".join(random.choice(tokens) for _ in range(12))
+        if random.random() < 0.5:
+            section = random.choice(REPORTS)
+
+        calls, expected_calls = [], []
+        handlers = [
+            GroupHandler(r, lambda m, i=i: calls.append((i, m.group())))
+            for i, r in enumerate(handlers_regexps)
+        ]
+        expected_handlers = [
+            GroupHandler(r, lambda m, i=i: expected_calls.append((i, m.group())))
+            for i, r in enumerate(handlers_regexps)
+        ]
+
+        unparsed = parse_section(handlers, section, engine)
+
+        assert unparsed == _linear_parse_section(expected_handlers, section)
+        assert calls == expected_calls
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_parse_section_empty_and_newline_groups(engine):
+    calls = []
+    handlers = [
+        GroupHandler(MetarRegExp.STATION, lambda m: calls.append(m.group())),
+        GroupHandler(MetarRegExp.WEATHER, lambda m: calls.append(m.group())),
+    ]
+
+    assert parse_section(handlers, "MROC\n  ", engine) == [""]
+    assert calls == ["MROC", ""]
+
+
+def test_parser_engines_give_the_same_reports():
+    assert get_parser_engine() == "dispatch"
+
+    reports = {}
+    try:
+        for engine in ENGINES:
+            set_parser_engine(engine)
+            reports[engine] = [
+                (str(report), report.unparsed_groups)
+                for report in (
+                    Metar(REPORTS[3]),
+                    Metar(REPORTS[6]),
+                    Taf(REPORTS[8]),
+                )
+            ]
+    finally:
+        set_parser_engine("dispatch")
+
+    assert reports["alternation"] == reports["dispatch"]
+
+    with pytest.raises(ValueError):
+        set_parser_engine("unknown")
+
+    with pytest.raises(ValueError):
+        parse_section([], "MROC", "unknown")
+
+
+class _Parser:
+    handlers = HandlerTable(
+        (MetarRegExp.STATION, "_handle_station"),
+        (MetarRegExp.TIME, "_handle_time"),
+    )
+
+    def __init__(self):
+        self.calls = []
+
+    def _handle_station(self, match):
+        self.calls.append(("station", match.group()))
+
+    def _handle_time(self, match):
+        self.calls.append(("time", match.group()))
+
+
+class _SubParser(_Parser):
+    def _handle_time(self, match):
+        self.calls.append(("sub time", match.group()))
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_handler_table_dispatch_to_the_instance(engine):
+    assert _Parser.handlers is _Parser().handlers
+    assert _SubParser.handlers is not _Parser.handlers
+
+    parser = _Parser()
+    sub_parser = _SubParser()
+    for p in (parser, sub_parser):
+        unparsed = parse_section(p.handlers, "MROC 161900Z XX", engine, owner=p)
+        assert unparsed == ["XX"]
+
+    assert parser.calls == [("station", "MROC"), ("time", "161900Z")]
+    assert sub_parser.calls == [("station", "MROC"), ("sub time", "161900Z")]
@@ -0,0 +1,76 @@
+import pickle
+
+from datetime import datetime
+
+import pytest
+
+from aeromet_py import Metar, set_reference_time
+from aeromet_py.reports.models.base import report
+
+
+code = (
+    "METAR MROC 071200Z 10005KT 9999 -RA FEW020 BKN015CB 25/17 Q1013 "
+    "R07/290095 TEMPO 3000 -RA BKN015CB"
+)
+
+
+def test_round_trip():
+    metar = Metar(code, 2022, 3)
+    loaded = pickle.loads(pickle.dumps(metar))
+
+    assert loaded.as_dict() == metar.as_dict()
+    assert str(loaded) == str(metar)
+
+
+def test_loads_without_parsing(monkeypatch: pytest.MonkeyPatch):
+    metar = Metar(code, lazy=True)
+    data = pickle.dumps(metar)
+
+    def parse_groups(*args, **kwargs):
+        raise AssertionError("the report is parsed again")
+
+    monkeypatch.setattr(report, "parse_groups", parse_groups)
+    loaded = pickle.loads(data)
+
+    assert loaded.as_dict() == metar.as_dict()
+    assert loaded.unparsed_groups == metar.unparsed_groups
+
+
+def test_compact_form():
+    # The groups are written by the name of their class and their slots,
+    # so the modules of the classes aren't repeated
+    metar = Metar(code)
+    data = pickle.dumps(metar)
+
+    assert b"aeromet_py.reports.models.metar" not in data
+    assert pickle.loads(data).wind.speed_in_knot == metar.wind.speed_in_knot
+
+
+def test_keeps_null_groups_shared():
+    metar = Metar("METAR MROC 071200Z 10005KT 9999 25/17 Q1013")
+    loaded = pickle.loads(pickle.dumps(metar))
+
+    other = Metar("METAR SKBO 071200Z 9999")
+
+    assert loaded.sea_state is other.sea_state
+    assert loaded.wind_variation is other.wind_variation
+
+
+def test_keeps_year_and_month():
+    set_reference_time(datetime(2021, 2, 10))
+    try:
+        metar = Metar(code)
+    finally:
+        set_reference_time(None)
+
+    loaded = pickle.loads(pickle.dumps(metar))
+    assert loaded.time.time == datetime(2021, 2, 7, 12, 0)
+
+
+def test_keeps_options():
+    metar = Metar(code + " XYZ", truncate=False, fields=["wind"])
+    loaded = pickle.loads(pickle.dumps(metar))
+
+    assert loaded.wind.as_dict() == metar.wind.as_dict()
+    assert loaded.pressure.as_dict()["pressure"] is None
+    assert loaded.unparsed_groups == metar.unparsed_groups
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+from aeromet_py import Metar, ReportCache, Taf, parse_cached
+from aeromet_py.reports import get_report_cache
+
+
+code = "METAR MROC 071200Z 10005KT 9999 FEW020 25/17 A3005 NOSIG"
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_same_report_by_raw_code():
+    cache = ReportCache(Metar)
+    metar = cache.parse(code)
+
+    assert cache.parse(code) is metar
+    assert cache.parse("  " + code.replace(" ", "\n", 1) + "=") is metar
+    assert cache.parse(code, 2022, 3) is not metar
+    assert cache.info() == (2, 2, 0, 1024, 2)
+    assert metar.as_dict() == Metar(code).as_dict()
+
+
+def test_least_recently_used_dropped():
+    cache = ReportCache(Metar, maxsize=2)
+    first = cache.parse(code)
+    cache.parse(code.replace("MROC", "SKBO"))
+    cache.parse(code)
+    cache.parse(code.replace("MROC", "LEMD"))
+
+    assert len(cache) == 2
+    assert cache.parse(code) is first
+    cache.parse(code.replace("MROC", "SKBO"))
+    assert cache.info().misses == 4
+
+
+def test_time_to_live():
+    timer = FakeTimer()
+    cache = ReportCache(Metar, ttl=60, timer=timer)
+    metar = cache.parse(code)
+
+    timer.now = 59.0
+    assert cache.parse(code) is metar
+
+    timer.now = 60.0
+    assert cache.parse(code) is not metar
+    assert cache.info() == (1, 2, 1, 1024, 1)
+
+
+def test_threads_share_reports():
+    cache = ReportCache(Metar)
+    codes = [code.replace("MROC", station) for station in ("SKBO", "LEMD", "EGLL")]
+    results = []
+
+    def parse() -> None:
+        results.append([cache.parse(c) for c in codes * 50])
+
+    threads = [threading.Thread(target=parse) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for reports in results:
+        assert [id(r) for r in reports] == [id(r) for r in results[0]]
+    info = cache.info()
+    assert info.hits + info.misses == 600
+    assert info.currsize == 3
+
+
+def test_parse_cached():
+    get_report_cache(Taf).clear()
+    taf = "TAF MROC 071100Z 0712/0812 10005KT 9999 FEW020"
+
+    assert parse_cached(code) is parse_cached(code)
+    assert parse_cached(taf, report_class=Taf) is parse_cached(taf, report_class=Taf)
+    assert isinstance(parse_cached(taf, report_class=Taf), Taf)
+    assert get_report_cache(Taf).info().hits == 2
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ReportCache(Metar, maxsize=0)
+
+    with pytest.raises(ValueError):
+        ReportCache(Metar, ttl=0)
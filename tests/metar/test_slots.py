@@ -0,0 +1,49 @@
+import pickle
+
+from aeromet_py import Metar
+from aeromet_py.reports.models import Cloud
+
+
+code = (
+    "METAR SCFA 121300Z 21008G20KT 9999 3000W TSRA FEW020 20/13 Q1014 "
+    "R17L/0800U WS R17L BECMG 4000 -DZ"
+)
+
+
+def test_groups_without_dict():
+    metar = Metar(code)
+
+    for group in (
+        metar.time,
+        metar.station,
+        metar.wind,
+        metar.prevailing_visibility,
+        metar.minimum_visibility,
+        metar.weathers[0],
+        metar.clouds[0],
+        metar.temperatures,
+        metar.pressure,
+        metar.windshears[0],
+        metar.weathers,
+        metar.weather_trends[0].trend_indicator,
+    ):
+        assert not hasattr(group, "__dict__"), type(group).__name__
+
+
+def test_subclass_of_group():
+    class TypedCloud(Cloud):
+        def __init__(self, data):
+            super().__init__(data)
+            self.source = "test"
+
+    cloud = TypedCloud({"code": "FEW020", "cover": "a few", "height": "609.6"})
+    assert cloud.source == "test"
+    assert cloud.as_dict()["height"] == 609.6
+
+
+def test_as_dict_and_pickle():
+    metar = Metar(code)
+    wind = pickle.loads(pickle.dumps(metar.wind))
+
+    assert wind.as_dict() == metar.wind.as_dict()
+    assert wind.as_dict()["gust"]["speed"] == 20.0
@@ -31,3 +31,12 @@ def test_metar_station():
         "name": "NY NYC/JFK ARPT",
         "synop": "74486",
     }
+
+
+def test_metar_station_data_is_shared():
+    first = Metar("METAR MROC 161900Z 09014KT CAVOK 29/16 A2999")
+    second = Metar("METAR MROC 162000Z 09012KT CAVOK 28/16 A3000")
+
+    assert first.station is not second.station
+    assert first.station._station is second.station._station
+    assert first.station.as_dict() == second.station.as_dict()
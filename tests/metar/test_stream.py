@@ -0,0 +1,139 @@
+import asyncio
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from aeromet_py import Metar, Taf, aparse
+
+
+codes = [
+    "METAR MROC 071200Z 10005KT 9999 -RA FEW020 BKN015CB 25/17 Q1013 NOSIG",
+    "METAR SKBO 071300Z VRB02KT CAVOK 18/09 A3010 NOSIG",
+    "METAR LEMD 071400Z 27015G25KT 3000 BR OVC008 10/09 Q1009",
+]
+
+
+async def lines_of(text):
+    for line in text.splitlines(keepends=True):
+        await asyncio.sleep(0)
+        yield line
+
+
+def collect(stream, **kwargs):
+    async def run():
+        return [result async for result in aparse(stream, **kwargs)]
+
+    return asyncio.run(run())
+
+
+def test_parse_lines():
+    results = collect(lines_of("\n".join(codes * 10)), year=2022, month=3)
+
+    assert [result.position for result in results] == list(range(30))
+    assert [result.report.as_dict() for result in results] == [
+        Metar(code, 2022, 3).as_dict() for code in codes * 10
+    ]
+
+
+def test_split_reports():
+    feed = (
+        "SAXX99 KWBC 071200\n"
+        "\n"
+        "METAR MROC 071200Z 10005KT\n"
+        "      9999 FEW020 25/17 Q1013=\n"
+        "SKBO 071300Z VRB02KT CAVOK\n"
+        "\n"
+        "TAF MROC 071100Z 0712/0812 10005KT 9999 FEW020\n"
+        "    BECMG 0714/0716 -RA\n"
+        "TAF SKBO 071100Z 0712/0812 VRB02KT CAVOK"
+    )
+    results = collect(lines_of(feed), report_class=Taf)
+
+    assert [result.code for result in results] == [
+        "SAXX99 KWBC 071200",
+        "METAR MROC 071200Z 10005KT 9999 FEW020 25/17 Q1013=",
+        "SKBO 071300Z VRB02KT CAVOK",
+        "TAF MROC 071100Z 0712/0812 10005KT 9999 FEW020 BECMG 0714/0716 -RA",
+        "TAF SKBO 071100Z 0712/0812 VRB02KT CAVOK",
+    ]
+
+
+def test_stream_reader():
+    async def run():
+        stream = asyncio.StreamReader()
+        stream.feed_data("\n".join(codes).encode())
+        stream.feed_eof()
+        return [result async for result in aparse(stream, batch_size=2)]
+
+    results = asyncio.run(run())
+    assert [result.report.station.icao for result in results] == [
+        "MROC",
+        "SKBO",
+        "LEMD",
+    ]
+
+
+def test_errors_per_report():
+    feed = codes[0] + "\n" + codes[1] + " XYZ\n" + codes[2]
+    results = collect(lines_of(feed), truncate=True)
+    assert [result.ok for result in results] == [True, False, True]
+
+
+def test_feed_errors_raised():
+    async def failing():
+        yield codes[0]
+        raise OSError("connection lost")
+
+    with pytest.raises(OSError):
+        collect(failing())
+
+
+def test_backpressure():
+    read = []
+
+    async def feed():
+        for index in range(1000):
+            read.append(index)
+            yield codes[index % 3]
+
+    async def run():
+        results = aparse(feed(), batch_size=4, max_pending=2)
+        await results.__anext__()
+        await asyncio.sleep(0.05)
+        await results.aclose()
+
+    asyncio.run(run())
+    assert len(read) < 20
+
+
+def test_early_exit():
+    async def feed():
+        for index in range(1000):
+            yield codes[index % 3]
+
+    async def run():
+        results = aparse(feed(), batch_size=2, max_pending=1)
+        async for _ in results:
+            # Let the reader fill the queue before leaving
+            await asyncio.sleep(0.01)
+            break
+
+        await results.aclose()
+        return asyncio.all_tasks() - {asyncio.current_task()}
+
+    # The reader of the feed is stopped, though it waits for a full queue
+    assert asyncio.run(run()) == set()
+
+
+def test_process_pool():
+    with ProcessPoolExecutor(2) as executor:
+        results = collect(lines_of("\n".join(codes * 4)), executor=executor)
+
+    assert [result.code for result in results] == codes * 4
+    assert all(result.ok for result in results)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        collect(lines_of(codes[0]), batch_size=0)
@@ -0,0 +1,48 @@
+from aeromet_py import Metar, Taf
+from aeromet_py.reports.models import Cloud
+
+
+code = (
+    "METAR MROC 071200Z 10005KT 9999 FEW020 25/17 A3005 "
+    "BECMG FM1230 TL1330 3000 BKN010"
+)
+
+
+def test_groups_described_on_demand(monkeypatch):
+    calls = []
+    cloud_str = Cloud.__str__
+    monkeypatch.setattr(
+        Cloud, "__str__", lambda self: calls.append(1) or cloud_str(self)
+    )
+
+    metar = Metar(code)
+    assert calls == []
+
+    string = str(metar)
+    assert len(calls) == 2
+    assert string.splitlines()[5].startswith("a few at 2000.0 feet")
+
+
+def test_trend_with_periods():
+    metar = Metar(code, year=2022, month=3)
+    trend = str(metar.weather_trends[0]).splitlines()
+
+    assert trend[0] == ("becoming from 2022-03-07 12:30:00 until 2022-03-07 13:30:00")
+    assert str(metar).endswith("\n".join(trend))
+
+
+def test_taf_string_keeps_the_given_periods():
+    taf = Taf(
+        "TAF KJFK 121130Z 1212/1318 32010KT P6SM FEW250 FM121800 30012G20KT "
+        "P6SM SCT250 TEMPO 1220/1222 BKN040 FM130200 28008KT P6SM BKN040",
+        2022,
+        3,
+    )
+
+    # The first FM change is cut by the second one after it's described
+    assert str(taf.changes_forecasted[0]).strip() == (
+        "from 2022-03-12 18:00:00 until 2022-03-13 01:00:00"
+    )
+    assert "from 2022-03-12 18:00:00 until 2022-03-13 18:00:00" in str(taf)
+    for change in list(taf.changes_forecasted)[1:]:
+        assert str(change).strip() in str(taf)
@@ -1,4 +1,11 @@
-from aeromet_py import Metar
+import sys
+import threading
+
+from datetime import datetime
+
+import pytest
+
+from aeromet_py import Metar, Taf, get_reference_time, set_reference_time
 
 
 def test_code():
@@ -36,3 +43,76 @@ def test_no_code():
     assert time.minute == 0
     assert str(time) == date2str
     assert time.as_dict() == {"code": None, "datetime": date2str}
+
+
+@pytest.fixture
+def reference():
+    set_reference_time(datetime(2019, 2, 10, 12, 0))
+    yield
+    set_reference_time(None)
+
+
+def test_reference_time(reference):
+    metar = Metar("METAR UUDD 212130Z 35003MPS CAVOK 18/12 Q1008 BECMG AT2200 RA")
+
+    assert get_reference_time() == datetime(2019, 2, 10, 12, 0)
+    assert metar.time.time == datetime(2019, 2, 21, 21, 30)
+    assert metar.weather_trends[0].trend_indicator.period_at.time == datetime(
+        2019, 2, 21, 22, 0
+    )
+    assert Metar("METAR UUDD NIL").time.time == datetime(2019, 2, 1)
+    assert Metar("METAR UUDD 212130Z NIL", 2021).time.time == datetime(
+        2021, 2, 21, 21, 30
+    )
+
+
+def test_taf_reference_time(reference):
+    taf = Taf("TAF SKBO 211100Z 2112/2212 03005KT 9999 SCT020 TX22/2118Z")
+
+    assert taf.time.time == datetime(2019, 2, 21, 11, 0)
+    assert taf.valid.period_until.time == datetime(2019, 2, 22, 12, 0)
+
+
+def test_default_time_built_on_access():
+    metar = Metar("METAR UUDD NIL")
+    set_reference_time(datetime(2019, 2, 10))
+    try:
+        assert metar.time.time == datetime(2019, 2, 1)
+    finally:
+        set_reference_time(None)
+
+    today = datetime.utcnow()
+    assert get_reference_time() >= today.replace(microsecond=0)
+    assert metar.time.time == datetime(2019, 2, 1)
+
+
+def test_default_time_concurrent_access(reference):
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(100):
+            time = Metar("METAR UUDD NIL").time
+            results = []
+            barrier = threading.Barrier(8)
+
+            def read() -> None:
+                barrier.wait()
+                try:
+                    results.append(time.time)
+                except Exception as error:
+                    results.append(error)
+
+            threads = [threading.Thread(target=read) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert results == [datetime(2019, 2, 1)] * 8
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_invalid_day():
+    with pytest.raises(ValueError):
+        Metar("METAR UUDD 302130Z 35003MPS CAVOK", year=2021, month=2)
@@ -1,5 +1,6 @@
 from aeromet_py import Metar
 
+
 fails = [
     "METAR MRLM 141200Z 000O0KT 9999 SCT0320 BKN080 22/21 A2990",
     "METAR MRLM 271500Z 11005KT 9999 FEW025 BKN25O 29/22 A2984 RMK HZY",
@@ -32,3 +33,26 @@ def test_unparsed_groups():
         metar = Metar(report)
 
         assert metar.unparsed_groups == unparsed
+
+
+def test_unparsed_spans():
+    for report in fails:
+        metar = Metar(report)
+
+        assert [span.text for span in metar.unparsed_spans] == metar.unparsed_groups
+        for span in metar.unparsed_spans:
+            assert metar.raw_code[span.start : span.end] == span.text
+
+
+def test_unparsed_spans_in_trends():
+    metar = Metar(
+        "METAR MROC 071200Z 10015G25KT 9999 FEW020 25/17 A3005 TEMPO 3000 ZZZ"
+        " RMK HZ BECMG YYY NSW"
+    )
+
+    assert metar.unparsed_groups == ["ZZZ", "YYY"]
+    assert metar.unparsed_spans[0].start == 65
+    assert metar.unparsed_spans[1].start == 82
+    assert metar.highlight_unparsed().splitlines()[1] == " " * 65 + "^^^" + (
+        " " * 14 + "^^^"
+    )
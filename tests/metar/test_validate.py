@@ -0,0 +1,25 @@
+from aeromet_py import Metar, validate_metar
+
+from .test_unparsed_groups import fails
+
+
+def test_validate_metar():
+    result = validate_metar(
+        "METAR MROC 071200Z 10015G25KT 9999 XXX FEW020 25/17 A3005 "
+        "TEMPO 3000 ZZZ RMK HZ BECMG YYY"
+    )
+
+    assert result.station == "MROC"
+    assert result.time == "071200Z"
+    assert result.unparsed_groups == ["XXX", "ZZZ", "YYY"]
+    assert not result.valid
+
+
+def test_validate_same_as_parse():
+    for code in fails:
+        metar = Metar(code)
+        result = validate_metar(code)
+
+        assert result.raw_code == metar.raw_code
+        assert result.unparsed_spans == metar.unparsed_spans
+        assert result.valid == (metar.unparsed_groups == [])
@@ -88,3 +88,12 @@ def test_no_windshears():
     for i in range(3):
         with pytest.raises(IndexError):
             assert windshears[i].code == None
+
+
+def test_runway_written_as_rwy():
+    metar = Metar("METAR MROC 202000Z 12013G23KT 9999 27/16 A2997 WS RWY22L NOSIG")
+    windshears = metar.windshears
+
+    assert windshears.codes == ["WS R22L"]
+    assert windshears[0].name == "22 left"
+    assert metar.unparsed_groups == []
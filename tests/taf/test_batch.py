@@ -0,0 +1,15 @@
+from aeromet_py import Taf, parse_tafs
+
+
+codes = [
+    "TAF MROC 071100Z 0712/0812 10005KT 9999 FEW020 BECMG 0714/0716 -RA",
+    "TAF SKBO 071100Z 0712/0812 VRB02KT CAVOK TX25/0718Z TN09/0810Z",
+]
+
+
+def test_parse_tafs():
+    for workers in (1, 2):
+        results = list(parse_tafs(codes, workers, year=2022, month=3))
+        assert [result.report.as_dict() for result in results] == [
+            Taf(code, 2022, 3).as_dict() for code in codes
+        ]
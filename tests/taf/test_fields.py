@@ -0,0 +1,39 @@
+from aeromet_py import Taf
+
+
+code = (
+    "TAF MROC 161700Z 1618/1718 09012KT 9999 FEW030 TX31/1618Z TN19/1711Z "
+    "BECMG 1700/1702 06008KT TEMPO 1708/1712 5000 -RA BKN010"
+)
+
+
+def test_only_the_valid_period():
+    taf = Taf(code, fields=["valid"])
+    eager = Taf(code)
+
+    assert taf.valid.as_dict() == eager.valid.as_dict()
+    assert taf.wind.code is None
+    assert len(taf.changes_forecasted) == 0
+
+
+def test_changes_forecasted():
+    taf = Taf(code, fields=["changes_forecasted"])
+    eager = Taf(code)
+
+    assert taf.changes_forecasted.as_dict() == eager.changes_forecasted.as_dict()
+    assert len(taf.max_temperatures) == 0
+
+
+def test_unparsed_groups_of_changes_not_wanted():
+    taf = Taf(code + " XYZ", fields=["wind"])
+
+    assert taf.unparsed_groups == ["XYZ"]
+    assert len(taf.changes_forecasted) == 0
+
+
+def test_method_fields():
+    taf = Taf(code, fields=["should_be_cavok"], lazy=True)
+
+    assert taf.should_be_cavok() == Taf(code).should_be_cavok()
+    assert taf.prevailing_visibility.code == "9999"
+    assert len(taf.max_temperatures) == 0
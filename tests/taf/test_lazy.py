@@ -0,0 +1,28 @@
+from aeromet_py import Taf
+
+
+code = (
+    "TAF MROC 161700Z 1618/1718 09012KT 9999 FEW030 TX31/1618Z TN19/1711Z "
+    "BECMG 1700/1702 06008KT TEMPO 1708/1712 5000 -RA BKN010"
+)
+
+
+def test_lazy_same_as_eager():
+    eager = Taf(code)
+    lazy = Taf(code, lazy=True)
+
+    assert lazy.lazy
+    assert "_max_temperatures" not in lazy.__dict__
+    assert lazy.min_temperatures[0].code == "TN19/1711Z"
+    assert "_max_temperatures" in lazy.__dict__
+    assert "_changes_forecasted" not in lazy.__dict__
+    assert len(lazy.changes_forecasted) == 2
+    assert str(lazy) == str(eager)
+    assert lazy.as_dict() == eager.as_dict()
+
+
+def test_lazy_string_with_truncate():
+    eager = Taf(code, truncate=True)
+
+    assert str(Taf(code, lazy=True)) == str(eager)
+    assert str(Taf(code, lazy=True, truncate=True)) == str(eager)
@@ -0,0 +1,16 @@
+import pickle
+
+from aeromet_py import Taf
+
+
+def test_round_trip():
+    taf = Taf(
+        "TAF MROC 071100Z 0712/0812 10005KT 9999 FEW020 "
+        "BECMG 0714/0716 -RA FM072000 VRB02KT CAVOK",
+        2022,
+        3,
+    )
+    loaded = pickle.loads(pickle.dumps(taf))
+
+    assert loaded.as_dict() == taf.as_dict()
+    assert str(loaded) == str(taf)
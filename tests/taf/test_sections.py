@@ -56,3 +56,14 @@ def test_sections_no_weather_changes():
     assert taf.sections == sections
     assert taf.body == sections[0]
     assert taf.weather_changes == sections[1]
+
+
+def test_unparsed_spans():
+    taf = Taf(
+        "TAF SKBO 071100Z 0712/0812 03005KT 9999 QQQ SCT020 PROB30 TEMPO"
+        " 0712/0716 4000 WWW BR BECMG 0720/0722 1 1/2SM VVV"
+    )
+
+    assert taf.unparsed_groups == ["QQQ", "WWW", "VVV"]
+    for span in taf.unparsed_spans:
+        assert taf.raw_code[span.start : span.end] == span.text
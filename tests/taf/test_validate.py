@@ -0,0 +1,24 @@
+from aeromet_py import Taf, validate_taf
+
+
+def test_validate_taf():
+    code = (
+        "TAF SKBO 071100Z 0712/0812 03005KT 9999 QQQ SCT020 PROB30 TEMPO"
+        " 0712/0716 4000 WWW BR BECMG 0720/0722 1 1/2SM VVV"
+    )
+    result = validate_taf(code)
+
+    assert result.station == "SKBO"
+    assert result.time == "071100Z"
+    assert result.unparsed_spans == Taf(code).unparsed_spans
+    assert result.unparsed_groups == ["QQQ", "WWW", "VVV"]
+
+
+def test_validate_valid_taf():
+    result = validate_taf(
+        "TAF MROC 161700Z 1618/1718 09012KT 9999 FEW030 TX31/1618Z TN19/1711Z "
+        "BECMG 1700/1702 06008KT TEMPO 1708/1712 5000 -RA BKN010"
+    )
+
+    assert result.valid
+    assert result.unparsed_groups == []
@@ -0,0 +1,44 @@
+from aeromet_py.utils import (
+    sanitize_change_indicator,
+    sanitize_visibility,
+    sanitize_windshear,
+)
+
+
+def test_sanitize_visibility():
+    assert sanitize_visibility("KT 1 1/2SM BR") == "KT 1_1/2SM BR"
+    assert sanitize_visibility("KT 1/2SM BR") == "KT 1/2SM BR"
+    # Groups sharing the space between them
+    assert sanitize_visibility("X 1 1/2SM 2 1/4SM Y") == "X 1_1/2SM 2_1/4SM Y"
+    assert sanitize_visibility("X 1 1/2SM2 1/4SM") == "X 1_1/2SM2_1/4SM"
+    # Up to three groups, keeping the offsets
+    assert (
+        sanitize_visibility(" 1 1/2SM 2 1/2SM 3 1/2SM 4 1/2SM")
+        == " 1_1/2SM 2_1/2SM 3_1/2SM 4 1/2SM"
+    )
+    report = "METAR 1 1/2SM WS RWY25 WS ALL RWY PROB30 TEMPO"
+    sanitized = sanitize_change_indicator(
+        sanitize_windshear(sanitize_visibility(report))
+    )
+    assert len(sanitized) == len(report)
+    assert sanitized.replace("_", " ") == report
+
+
+def test_sanitize_windshear():
+    assert sanitize_windshear("WS R07L WS RWY25") == "WS_R07L WS_RWY25"
+    assert (
+        sanitize_windshear("WS ALL RWY WS R01 WS R02 WS ALL RWY WS R03 WS R04")
+        == "WS_ALL_RWY WS_R01 WS_R02 WS_ALL_RWY WS_R03 WS R04"
+    )
+
+
+def test_sanitize_change_indicator():
+    assert sanitize_change_indicator("PROB30 TEMPO 1612/1614") == (
+        "PROB30_TEMPO 1612/1614"
+    )
+    assert sanitize_change_indicator("PROB40 1612/1614 PROB50 TEMPO") == (
+        "PROB40 1612/1614 PROB50 TEMPO"
+    )
+    assert sanitize_change_indicator(" ".join(["PROB30 TEMPO"] * 6)) == " ".join(
+        ["PROB30_TEMPO"] * 5 + ["PROB30 TEMPO"]
+    )
@@ -0,0 +1,58 @@
+from aeromet_py.utils import Span, highlight, relocate, split_sections, split_sentence
+
+
+def test_split_sections_left():
+    sentence = "METAR MROC 161900Z 09014KT CAVOK TEMPO 5000 RA NOSIG RMK SLP"
+    sections = split_sections(
+        sentence, ["NOSIG", "TEMPO", "BECMG", "RMK"], space="left"
+    )
+
+    assert [s.text for s in sections] == [
+        "METAR MROC 161900Z 09014KT CAVOK",
+        "TEMPO 5000 RA",
+        "NOSIG",
+        "RMK SLP",
+    ]
+    for section in sections:
+        assert sentence[section.start : section.end] == section.text
+
+
+def test_split_sections_both_with_count():
+    sections = split_sections(
+        "TEMPO FM1200 5000 BECMG 9999 TEMPO 3000 BECMG NSW",
+        ["TEMPO", "BECMG"],
+        count=1,
+        space="both",
+    )
+
+    assert sections == [
+        Span("TEMPO FM1200 5000", 0, 17),
+        Span("BECMG 9999", 18, 28),
+        Span("TEMPO 3000 BECMG NSW", 29, 49),
+    ]
+
+
+def test_split_sections_keeps_pipes():
+    assert split_sentence("TAF MROC |X FM161800 9999", ["FM"], space="left") == [
+        "TAF MROC |X",
+        "FM161800 9999",
+    ]
+
+
+def test_split_sections_without_keywords():
+    assert split_sections("TAF MROC", []) == [Span("TAF MROC", 0, 8)]
+
+
+def test_relocate():
+    sentence = "A B RMK C D"
+    pieces = [Span("A B", 0, 3), Span("C D", 8, 11)]
+    spans = relocate([Span("B", 2, 3), Span("D", 6, 7)], pieces)
+
+    assert spans == [Span("B", 2, 3), Span("D", 10, 11)]
+    for span in spans:
+        assert sentence[span.start : span.end] == span.text
+
+
+def test_highlight():
+    assert highlight("AAA BB C", [Span("BB", 4, 6)]) == "AAA BB C\n    ^^"
+    assert highlight("AAA", []) == "AAA\n"